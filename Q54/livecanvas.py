@@ -1,59 +1,118 @@
 # livecanvas.py
 from __future__ import annotations  # Permet d'utiliser des annotations de type en avance
 
+import re  # recherche des octets 1 (cellules vivantes) dans le buffer
+
+from livemodel import LiveState  # vue de l'état du Model (buffer en lecture seule, pas de copie)
+
+
 class LiveCanvasIterator:
     """
     Iterator (design pattern)
-    - Parcourt une matrice bool (alive_matrix)  # True = vivant, False = mort
+    - Parcourt l'état du Model (LiveState)  # 1 octet par cellule : 1 = vivant, 0 = mort
     - Retourne à chaque __next__() un triplet (row, col, alive)  # format pratique pour la View
     """
 
-    def __init__(self, alive_matrix: list[list[bool]]) -> None:  #reçoit la matrice à parcourir
-        self.__alive_matrix: list[list[bool]] = alive_matrix  #matrice bool
-        self.__rows: int = len(alive_matrix)  # nombre de lignes
-        self.__cols: int = len(alive_matrix[0]) if self.__rows > 0 else 0  #  nombre de colonnes
-        self.__row_index: int = 0  # position courante en ligne
-        self.__col_index: int = 0  # position courante en colonne
+    def __init__(self, state: LiveState) -> None:  #reçoit l'état à parcourir
+        self.__buffer: memoryview = state.buffer  # octets de l'état (lecture seule, aucune matrice bool construite)
+        self.__cols: int = state.cols  #  nombre de colonnes
+        self.__size: int = state.rows * state.cols  # nombre de cellules
+        self.__index: int = 0  # position courante dans le buffer (row*cols+col)
 
     def __iter__(self) -> LiveCanvasIterator:  # un iterator retourne toujours lui-même
         return self  # Permet : for x in iterator
 
-    def __next__(self) -> tuple[int, int, bool]:  #donne l’élément suivant ou StopIteration
-        if self.__row_index >= self.__rows:  # Si on a dépassé la dernière ligne
+    def __next__(self) -> tuple[int, int, bool]:  #donne l'élément suivant ou StopIteration
+        if self.__index >= self.__size:  # Si on a dépassé la dernière cellule
             raise StopIteration
 
-        alive: bool = self.__alive_matrix[self.__row_index][self.__col_index]  # Lit l’état de la cellule courante
-        row: int = self.__row_index  # Copie la ligne courante
-        col: int = self.__col_index  # Copie la colonne courante
+        index: int = self.__index  # position courante
+        self.__index += 1  # Passe à la cellule suivante (la ligne suit toute seule avec divmod)
 
-        self.__col_index += 1  # Passe à la colonne suivante
+        row, col = divmod(index, self.__cols)  # indice à plat -> (ligne, colonne)
+        return row, col, self.__buffer[index] == 1  # Retourne un triplet exploitable par la View
 
-        if self.__col_index >= self.__cols:  # Si on a dépassé la dernière colonne
-            self.__col_index = 0  # On revient à la colonne 0
-            self.__row_index += 1  # Et on passe à la ligne suivante
 
-        return row, col, alive  # Retourne un triplet exploitable par la View
+class LiveAliveIterator:
+    """
+    Iterator spécialisé : seulement les cellules vivantes  # les mortes ne sont jamais parcourues
+    - Retourne à chaque __next__() un triplet (row, col, True)  # même format que LiveCanvasIterator
+    """
+
+    def __init__(self, state: LiveState) -> None:  # reçoit l'état à parcourir
+        self.__cols: int = state.cols  # nombre de colonnes
+        self.__matches = re.finditer(b"\x01", state.buffer)  # recherche des octets 1, au fur et à mesure (pas de liste)
 
+    def __iter__(self) -> LiveAliveIterator:  # un iterator retourne toujours lui-même
+        return self
 
-class LiveCanvas:  # Objet "itérable" : encapsule la matrice et fournit l'iterator (pattern Iterator)
+    def __next__(self) -> tuple[int, int, bool]:  # vivante suivante (StopIteration quand il n'y en a plus)
+        row, col = divmod(next(self.__matches).start(), self.__cols)  # indice à plat -> (ligne, colonne)
+        return row, col, True
+
+
+class LiveRegionIterator:
+    """
+    Iterator spécialisé : les cellules d'un rectangle  # coin (row, col), rows x cols, ligne par ligne
+    - La partie hors de la grille est ignorée  # pas d'IndexError
     """
-    - Contient une matrice bool (alive_matrix)  # La "photo" du modèle
+
+    def __init__(self, state: LiveState, row: int, col: int, rows: int, cols: int) -> None:
+        self.__buffer: memoryview = state.buffer  # octets de l'état (lecture seule)
+        self.__width: int = state.cols  # largeur de la grille
+        self.__col_start: int = max(0, col)  # rectangle coupé aux bords de la grille
+        self.__col_end: int = min(state.cols, col + cols)
+        self.__row_end: int = min(state.rows, row + rows)
+        self.__row: int = max(0, row)  # position courante
+        self.__col: int = self.__col_start
+        if self.__col_start >= self.__col_end:  # rectangle vide en largeur : rien à parcourir
+            self.__row = self.__row_end
+
+    def __iter__(self) -> LiveRegionIterator:
+        return self
+
+    def __next__(self) -> tuple[int, int, bool]:
+        if self.__row >= self.__row_end:  # Si on a dépassé la dernière ligne du rectangle
+            raise StopIteration
+
+        row, col = self.__row, self.__col  # cellule courante
+        self.__col += 1  # colonne suivante
+        if self.__col >= self.__col_end:  # fin de ligne du rectangle
+            self.__col = self.__col_start
+            self.__row += 1
+
+        return row, col, self.__buffer[row * self.__width + col] == 1
+
+
+class LiveCanvas:  # Objet "itérable" : encapsule l'état et fournit l'iterator (pattern Iterator)
+    """
+    - Contient la vue de l'état du Model (LiveState)  # La "photo" du modèle, sans copie
     - Fournit un iterator via __iter__()  # Design Pattern Iterator
     """
 
     # (Attributs de classe)  # Critère prof : attributs de classe en premier si existants
     # Aucun attribut de classe ici  # Donc rien à mettre
 
-    def __init__(self, alive_matrix: list[list[bool]]) -> None:  # Constructeur : reçoit la matrice à afficher
-        self.__alive_matrix: list[list[bool]] = alive_matrix  # Attribut privé : matrice bool stockée
+    def __init__(self, state: LiveState, changes: list[tuple[int, int, bool]] | None = None) -> None:  # Constructeur : reçoit l'état à afficher
+        self.__state: LiveState = state  # Attribut privé : vue de l'état stockée
+        self.__changes = changes  # cellules modifiées (Model.changed_since), None = on ne sait pas
 
     def __del__(self) -> None:  # Destructeur éventuel
         pass  # Rien de spécial ici
 
     def __str__(self) -> str:  # debug lisible
-        rows: int = len(self.__alive_matrix)  # Calcule le nombre de lignes
-        cols: int = len(self.__alive_matrix[0]) if rows > 0 else 0  # Calcule le nombre de colonnes
-        return f"LiveCanvas(rows={rows}, cols={cols})"
+        return f"LiveCanvas(rows={self.__state.rows}, cols={self.__state.cols})"
 
     def __iter__(self) -> LiveCanvasIterator:
-        return LiveCanvasIterator(self.__alive_matrix)  # Retourne un iterator dédié (pattern Iterator)
+        return LiveCanvasIterator(self.__state)  # Retourne un iterator dédié (pattern Iterator)
+
+    def alive(self) -> LiveAliveIterator:  # seulement les vivantes, trouvées dans les octets (pas de copie)
+        return LiveAliveIterator(self.__state)
+
+    def region(self, row: int, col: int, rows: int, cols: int) -> LiveRegionIterator:  # seulement un rectangle
+        return LiveRegionIterator(self.__state, row, col, rows, cols)
+
+    def changed(self):  # seulement les cellules modifiées (journal du Model), sinon toutes
+        if self.__changes is None:  # le Model ne sait plus : on parcourt tout
+            return LiveCanvasIterator(self.__state)
+        return iter(self.__changes)  # déjà des triplets (row, col, alive)
@@ -17,6 +17,7 @@ class LiveController:
 
     def __init__(self) -> None:
         self.__model: LiveModel = LiveModel()  # instance du Model (grille logique)
+        self.__drawn_version: int = -1  # version de l'état affiché (-1 = rien d'affiché)
         self.__view: LiveView = LiveView(self)  #  instance de la View
         self.__view.set_status("Entrez rows/cols puis cliquez 'Create grid'.")
         self.__view.mainloop()  # Lance la boucle Tkinter (programme événementiel)
@@ -43,14 +44,15 @@ class LiveController:
             return
 
         try:  # pour gérer les ValueError du Model (rows/cols <= 0)
-            self.__model.create_grid(rows, cols)  # Crée la grille logique (row/col standards) dans le Model
+            self.__model.resize_grid(rows, cols)  # Crée la grille, ou la redimensionne en gardant le motif
         except ValueError as e:  # Si rows/cols invalides (<= 0)
             self.__view.set_status(f"Erreur: {e}")
             return
 
-        alive_matrix = self.__model.snapshot_alive()  # Demande au Model une matrice bool (True/False) pour la View
-        self.__view.render_grid(alive_matrix)  # Demande à la View de dessiner la grille (damier + cellules vivantes)
-        self.__view.set_status(f"Grille créée: {rows} x {cols}. Clic gauche=vivant, clic droit=mort.")
+        state = self.__model.state_view()  # Demande au Model une vue de son état (sans copie, plus de matrice bool)
+        self.__drawn_version = state.version  # version affichée
+        self.__view.render_grid(state)  # Demande à la View de dessiner la grille (damier + cellules vivantes)
+        self.__view.set_status(f"Grille: {rows} x {cols}. Clic gauche=vivant, clic droit=mort.")
 
     def gui_canvas_click(self, x: int, y: int, alive: bool) -> None:
         """
@@ -79,8 +81,13 @@ class LiveController:
             self.__view.set_status(str(e))  # Affiche l'erreur du Model
             return
 
-        alive_matrix = self.__model.snapshot_alive()  # Récupère la nouvelle matrice bool après modification
-        self.__view.render_grid(alive_matrix)  # Redessine la grille (simple pour l'étape 1)
+        state = self.__model.state_view()  # Récupère la vue de l'état après modification (sans copie)
+        changes = self.__model.changed_since(self.__drawn_version)  # cellules modifiées depuis le dernier dessin
+        self.__drawn_version = state.version  # version affichée
+        if changes is None:  # le Model ne sait plus : on redessine tout
+            self.__view.render_grid(state)
+        else:
+            self.__view.render_changes(state, changes)  # Redessine seulement la cellule cliquée
 
 
 
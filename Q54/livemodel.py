@@ -1,5 +1,6 @@
 # livemodel.py  # contient le MODEL (données + logique) dans le MVC
 from __future__ import annotations  # Autorise l'utilisation d'annotations de type "en avance" (pratique pour typing)
+from collections import deque  # file bornée : journal des dernières modifications
 
 
 
@@ -40,18 +41,67 @@ class LiveCell:  # Déclare la Classe représentant une cellule logique (vivante
 
 
 
+class LiveState:  # vue de l'état de la grille SANS copie, donnée à la View à la place d'une matrice bool
+    """
+    vue en lecture seule de l'état du Model:
+    buffer = memoryview en lecture seule, 1 octet par cellule (1=vivante), indice row*cols+col
+    version = numéro de l'état vu (le Model l'augmente à chaque modification, il n'y a pas de générations ici)
+    """
+
+    def __init__(self, buffer: memoryview, rows: int, cols: int, version: int) -> None:  # reçoit le buffer du Model
+        self.__buffer: memoryview = buffer  # vue en lecture seule (pas de copie)
+        self.__rows: int = rows  # nombre de lignes
+        self.__cols: int = cols  # nombre de colonnes
+        self.__version: int = version  # numéro de l'état
+
+    def __str__(self) -> str:  # debug lisible
+        return f"LiveState(rows={self.__rows}, cols={self.__cols}, version={self.__version})"
+
+    @property
+    def buffer(self) -> memoryview:  # Getter : octets de l'état (lecture seule)
+        return self.__buffer
+
+    @property
+    def rows(self) -> int:  # Getter : nombre de lignes
+        return self.__rows
+
+    @property
+    def cols(self) -> int:  # Getter : nombre de colonnes
+        return self.__cols
+
+    @property
+    def version(self) -> int:  # Getter : numéro de l'état vu
+        return self.__version
+
+    def is_alive(self, row: int, col: int) -> bool:  # lit une cellule dans le buffer
+        return self.__buffer[row * self.__cols + col] == 1
+
+
+
+
+
+
 class LiveModel: # stocke la grille logique
 
+    CHANGE_LOG_SIZE: int = 4096  # nombre de modifications gardées dans le journal (pour changed_since)
+
 
     """
     stocke la grille LOGIQUE avec indices standards:
     grid[row][col] avec row=0..rows-1, col=0..cols-1
+    + un état à plat (bytearray, 1 octet par cellule) tenu à jour par set_cell_alive,
+    lu par la View sans copie via state_view() / snapshot()
     """
 
     def __init__(self) -> None:  # initialisation d'un modèle vide
         self.__rows: int = 0  # nombre de lignes (0=pas créé)
         self.__cols: int = 0  # nombre de colonnes
         self.__grid: list[list[LiveCell]] = []  # la matrice
+        self.__state: bytearray = bytearray()  # état à plat (1=vivante), même contenu que la matrice
+        self.__version: int = 0  # augmente à chaque modification (la View sait si elle a déjà dessiné cet état)
+        self.__shared: bool = False  # True si une image (snapshot) partage le buffer : copie avant d'écrire
+        self.__log: deque[tuple[int, int]] = deque(maxlen=self.CHANGE_LOG_SIZE)  # journal (version, indice) des écritures
+        self.__log_start: int = 0  # version à partir de laquelle le journal est complet
 
     def __str__(self) -> str:  # afficher l'état du Model
         if not self.is_ready():  # Si la grille n'est pas prête
@@ -72,6 +122,10 @@ class LiveModel: # stocke la grille logique
     def cols(self) -> int:  # Getter : renvoie le nombre de colonnes
         return self.__cols  # Retourne l'attribut privé __cols
 
+    @property
+    def version(self) -> int:  # Getter : numéro de l'état courant
+        return self.__version
+
 
 
 
@@ -85,6 +139,39 @@ class LiveModel: # stocke la grille logique
         self.__rows = rows  # Stocke le nombre de lignes dans l'attribut privé
         self.__cols = cols  # Stocke le nombre de colonnes dans l'attribut privé
         self.__grid = [[LiveCell(False) for _ in range(cols)] for _ in range(rows)]  # Crée une matrice rows x cols de cellules
+        self.__state = bytearray(rows * cols)  # nouvel état à plat, tout mort (nouveau buffer : les images gardent l'ancien)
+        self.__shared = False
+        self.__version += 1  # nouvel état
+        self.__forget_log()  # nouvelle grille : les anciennes versions ne se comparent plus
+
+    def resize_grid(self, rows: int, cols: int) -> None:  # change la taille en gardant le motif (coin haut-gauche fixe)
+        """Redimensionne la grille existante sans perdre les cellules déjà placées."""
+        if rows <= 0 or cols <= 0:  # mêmes règles que create_grid
+            raise ValueError("rows et cols doivent être > 0")
+        if not self.is_ready():  # pas encore de grille : simple création
+            self.create_grid(rows, cols)
+            return
+
+        grid = self.__grid[:rows]  # garde les lignes qui rentrent (mêmes objets LiveCell)
+        for r, row in enumerate(grid):  # ajuste chaque ligne conservée
+            if cols <= self.__cols:
+                grid[r] = row[:cols]  # coupe les colonnes en trop
+            else:
+                grid[r] = row + [LiveCell(False) for _ in range(cols - self.__cols)]  # complète avec des mortes
+        grid += [[LiveCell(False) for _ in range(cols)] for _ in range(rows - len(grid))]  # nouvelles lignes mortes
+
+        state = bytearray(rows * cols)  # nouvel état à plat, rempli ligne par ligne avec l'ancien
+        keep = min(cols, self.__cols)  # colonnes conservées
+        for r in range(min(rows, self.__rows)):  # lignes conservées
+            state[r * cols:r * cols + keep] = self.__state[r * self.__cols:r * self.__cols + keep]
+
+        self.__rows = rows  # nouvelles dimensions
+        self.__cols = cols
+        self.__grid = grid  # une seule réaffectation de la matrice
+        self.__state = state
+        self.__shared = False
+        self.__version += 1  # nouvel état
+        self.__forget_log()  # autre taille : les anciennes versions ne se comparent plus
 
     def is_ready(self) -> bool:  # indique si la grille prete
         return self.__rows > 0 and self.__cols > 0 and len(self.__grid) == self.__rows  # True si rows/cols valides et grille construite
@@ -96,10 +183,42 @@ class LiveModel: # stocke la grille logique
     def set_cell_alive(self, row: int, col: int, alive: bool) -> None:  # modifie l'état d'une cellule vivante ou morte
         self.__check_bounds(row, col)  # Vérifie que la cellule existe dans la grille
         self.__grid[row][col].set_alive(alive)  # Change état via méthode de la cellule
+        if self.__shared:  # une image partage le buffer : on le copie avant d'écrire (copie à l'écriture)
+            self.__state = bytearray(self.__state)
+            self.__shared = False
+        self.__state[row * self.__cols + col] = 1 if alive else 0  # même changement dans l'état à plat
+        self.__version += 1  # nouvel état
+        if len(self.__log) == self.__log.maxlen:  # journal plein : la plus vieille écriture va sortir
+            self.__log_start = self.__log[0][0]  # on ne peut plus répondre pour les versions d'avant
+        self.__log.append((self.__version, row * self.__cols + col))  # note l'écriture (index des changements)
+
+    def changed_since(self, version: int) -> list[tuple[int, int, bool]] | None:  # cellules modifiées depuis une version
+        """Retourne les cellules (row, col, alive) écrites après la version donnée, lues dans le journal.
+        None si le journal ne remonte pas jusque-là (trop ancien, nouvelle grille) : tout redessiner."""
+        if version < self.__log_start or version > self.__version:  # version inconnue
+            return None
+        cols = self.__cols
+        indices = {index for written, index in self.__log if written > version}  # chaque cellule une seule fois
+        return [(index // cols, index % cols, self.__state[index] == 1) for index in sorted(indices)]  # état actuel
+
+    def __forget_log(self) -> None:  # vide le journal : il repart de la version courante
+        self.__log.clear()
+        self.__log_start = self.__version
+
+    def state_view(self) -> LiveState:  # vue de l'état courant SANS copie (suit les modifications)
+        """Retourne une vue en lecture seule de l'état pour la View (pas de matrice bool à construire)."""
+        return LiveState(memoryview(self.__state).toreadonly(), self.__rows, self.__cols, self.__version)
+
+    def snapshot(self) -> LiveState:  # image figée de l'état, toujours sans copie
+        """Retourne une vue qui ne bouge plus : le Model copiera son buffer avant la prochaine écriture."""
+        self.__shared = True  # copie à l'écriture
+        return self.state_view()
 
     def snapshot_alive(self) -> list[list[bool]]:  #crée une image de la grille sous forme de bool
-        """Retourne une image booléenne pour la View (sans exposer les objets)."""
-        return [[cell.alive for cell in row] for row in self.__grid]  # Convertit objets -> bool
+        """Retourne une image booléenne (ancienne API, gardée pour compatibilité : préférer state_view())."""
+        state = self.__state  # lu directement dans l'état à plat
+        cols = self.__cols
+        return [[value == 1 for value in state[r * cols:(r + 1) * cols]] for r in range(self.__rows)]  # octets -> bool
 
 
 
@@ -125,4 +244,14 @@ if __name__ == "__main__":
     assert m.rows == 5 and m.cols == 10  # Vérifie que les getters rows/cols donnent les bonnes dimensions
     m.set_cell_alive(0, 0, True)
     assert m.get_cell(0, 0).alive is True
+    m.resize_grid(3, 12)  # le motif doit survivre au redimensionnement
+    assert m.rows == 3 and m.cols == 12 and m.get_cell(0, 0).alive is True
+    image = m.snapshot()  # image figée sans copie
+    m.set_cell_alive(0, 0, False)  # le Model copie son buffer avant d'écrire
+    assert image.is_alive(0, 0) is True and m.state_view().is_alive(0, 0) is False
+    assert m.snapshot_alive()[0][:2] == [False, False]
+    version = m.version  # index des changements
+    m.set_cell_alive(1, 2, True)
+    assert m.changed_since(version) == [(1, 2, True)] and m.changed_since(m.version) == []
+    assert m.changed_since(0) is None  # avant le dernier redimensionnement : inconnu
     print("livemodel.py OK")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations  # Permet d'utiliser des annotations de type avant que les classes soient définies
 from tkinter import Tk, Frame, Label, Entry, Button, Canvas  # Widgets Tkinter utilisés pour créer l'interface
+from livemodel import LiveState  # Vue de l'état du Model (lecture seule, sans copie)
 from livecanvas import LiveCanvas  # Importe l'objet itérable + iterator (design pattern Iterator)
 
 
@@ -69,13 +70,13 @@ class LiveView:
     def set_status(self, text: str) -> None:
         self.__status_label.config(text=text)  # Met à jour le texte du label
 
-    def render_grid(self, alive_matrix: list[list[bool]]) -> None:  #dessiner la grille
+    def render_grid(self, state: LiveState) -> None:  #dessiner la grille
          # On efface puis on redessine tout
         self.__canvas.delete("all")  # Efface tous les éléments du canvas
         self.__rect_by_cell.clear()  # Réinitialise le dictionnaire de rectangles
 
-        rows = len(alive_matrix)  # Nombre de lignes dans la matrice bool
-        cols = len(alive_matrix[0]) if rows > 0 else 0  # Nombre de colonnes (0 si la matrice vide)
+        rows = state.rows  # Nombre de lignes (lu dans la vue de l'état, pas de matrice bool)
+        cols = state.cols  # Nombre de colonnes
 
         width = cols * self.__cell_size  # Largeur du canvas en pixels selon la grille
         height = rows * self.__cell_size  # Hauteur du canvas en pixels selon la grille
@@ -89,10 +90,18 @@ class LiveView:
             y = r * self.__cell_size  # Coordonnée y de la ligne horizontale
             self.__canvas.create_line(0, y, width, y)  # Trace la ligne horizontale
 
-        live_canvas = LiveCanvas(alive_matrix)  # Crée un objet itérable qui encapsule la matrice bool
-        for row, col, alive in live_canvas:  # Itération via __iter__() + __next__() (design pattern Iterator)
-            if alive:  # On dessine uniquement les cellules vivantes (comme avant)
-                 self.__draw_cell(row, col, True)  # Dessine en noir
+        live_canvas = LiveCanvas(state)  # Crée un objet itérable qui encapsule la vue de l'état
+        for row, col, _alive in live_canvas.alive():  # Iterator spécialisé : uniquement les cellules vivantes
+            self.__draw_cell(row, col, True)  # Dessine en noir
+
+    def render_changes(self, state: LiveState, changes: list[tuple[int, int, bool]]) -> None:  # redessine seulement ce qui a changé
+        live_canvas = LiveCanvas(state, changes)  # état + cellules modifiées (venant du Model)
+        for row, col, alive in live_canvas.changed():  # Iterator spécialisé : uniquement les cellules modifiées
+            rect_id = self.__rect_by_cell.pop((row, col), None)  # ancien rectangle de la cellule (s'il existe)
+            if rect_id is not None:
+                self.__canvas.delete(rect_id)  # On l'efface
+            if alive:  # vivante : nouveau rectangle noir
+                self.__draw_cell(row, col, True)
 
 
     def mainloop(self) -> None:  #démarre Tkinter (boucle d'événements)
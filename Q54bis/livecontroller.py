@@ -9,7 +9,7 @@ Rôle :
 
 from __future__ import annotations
 
-from livemodel import LiveModel
+from livemodel import LiveModel, BlockStepEngine
 from liveview import LiveView
 
 
@@ -37,7 +37,8 @@ class LiveController:
 
     def __init__(self, rows: int = 40, cols: int = 40, cell_px: int = 10):
         # Le model est créé ici : indices logiques 0..n-1 (consigne 2)
-        self.__model = LiveModel(rows, cols)
+        # Moteur par blocs 2x2 (table 4x4 -> 2x2) : mêmes résultats que cellule par cellule, bien plus rapide
+        self.__model = LiveModel(rows, cols, engine=BlockStepEngine())
 
         # La view est créée ici : gère pixels + events Tkinter (consigne 2)
         self.__view = LiveView(self, cell_px=cell_px, rows=rows, cols=cols)
@@ -51,18 +52,6 @@ class LiveController:
         # Lancement boucle Tkinter (bloquant)
         self.__view.mainloop()
 
-    # Helpers internes (méthodes privées/protégées : ici privées)
-    def __alive_cells(self) -> list[tuple[int, int]]:
-        """
-        Transforme le modèle en "liste de cellules vivantes".
-        C'est ce qu'on envoie à la View pour dessiner.
-        """
-        out: list[tuple[int, int]] = []
-        for r, c, cell in self.__model.grid:
-            if cell.alive:
-                out.append((r, c))
-        return out
-
     def gui_render(self) -> None:
         """
         ORAL
@@ -77,12 +66,24 @@ class LiveController:
             f"running={self.__model.running}"
         )
 
+        # Iterator spécialisé : seulement les vivantes (index de la grille)
         self.__view.render(
             rows=self.__model.grid.rows,
             cols=self.__model.grid.cols,
-            alive_cells=self.__alive_cells(),
+            alive_cells=self.__model.grid.alive_cells(),
         )
 
+    def __render_step(self, previous_generation: int) -> None:
+        """
+        Après un step : on ne redessine que les cellules qui ont changé
+        depuis la génération affichée (si le modèle la connaît encore).
+        """
+        changes = self.__model.changed_since(previous_generation)
+        if changes is None:
+            self.gui_render()
+            return
+        self.__view.render_changes(changes)
+
     def __tick(self) -> None:
         """
         Boucle after()
@@ -92,8 +93,9 @@ class LiveController:
         if not self.__model.running:
             return
 
+        previous = self.__model.generation
         self.__model.step()
-        self.gui_render()
+        self.__render_step(previous)
 
         # Reprogrammer __tick dans speed_ms ms
         self.__view.after(self.__model.speed_ms, self.__tick)
@@ -110,8 +112,9 @@ class LiveController:
 
     def gui_step(self) -> None:
         """Bouton Step : une génération."""
+        previous = self.__model.generation
         self.__model.step()
-        self.gui_render()
+        self.__render_step(previous)
 
     def gui_clear(self) -> None:
         """Bouton Clear : vider grille."""
@@ -136,8 +139,9 @@ class LiveController:
         rows = int(parts[0])
         cols = int(parts[1])
 
-        # Recréation du modèle (simple et propre au début)
-        self.__model = LiveModel(rows, cols)
+        # Redimensionnement sur place : le motif en cours est conservé
+        self.__model.resize(rows, cols, anchor="center")
+        self.__view.resize(rows, cols)
         self.gui_render()
 
     def gui_toggle_cell(self, row: int, col: int) -> None:
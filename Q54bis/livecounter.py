@@ -1,6 +1,6 @@
 """
 livecounter.py
-Compteur de générations (Singleton optionnel).
+Compteur de générations (Singleton optionnel via get_instance()).
 But : montrer un design pattern "justifié" (défense orale).
 
 REMARQUE :
@@ -11,11 +11,15 @@ REMARQUE :
 class LiveCounter:
     _instance = None
 
-    def __new__(cls):
-        # Singleton : une seule instance possible
+    def __init__(self) -> None:
+        # Chaque simulation peut avoir son propre compteur
+        self._value = 0
+
+    @classmethod
+    def get_instance(cls) -> "LiveCounter":
+        # Singleton : compteur partagé par défaut (plusieurs instances restent possibles)
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._value = 0
+            cls._instance = cls()
         return cls._instance
 
     @property
@@ -11,8 +11,10 @@ Rôle :
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from array import array
+from collections import deque
 from dataclasses import dataclass
-from typing import Iterator
+from typing import Iterator, Optional
 
 
 # ============================================================
@@ -99,16 +101,143 @@ class CellFactory:
     - Grid n'a pas besoin de connaître les classes concrètes.
     """
 
+    # Les cellules sont immuables : une seule instance de chaque sorte,
+    # partagée par toutes les cases (Flyweight)
+    _ALIVE: Cell = AliveCell()
+    _DEAD: Cell = DeadCell()
+
     @staticmethod
     def create(alive: bool) -> Cell:
         """
         Exemple de méthode "statique" (pas besoin d'instance).
         """
-        return AliveCell() if alive else DeadCell()
+        return CellFactory._ALIVE if alive else CellFactory._DEAD
 
 
 # ============================================================
-# 2) GRID : composition (la grille contient des cellules)
+# 2) MOTEURS DE CALCUL : Strategy pour Grid.step
+# ============================================================
+
+# octet 0/1 <-> chiffre ASCII "0"/"1" : passer d'une ligne d'états à un entier (et retour) en C
+_TO_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_FROM_DIGITS = bytes.maketrans(b"01", b"\x00\x01")
+
+_BLOCK_TABLE: Optional[bytes] = None
+
+
+def block_table() -> bytes:
+    """
+    Table précalculée 4x4 -> 2x2 (65 536 entrées).
+
+    - Entrée : un voisinage 4x4 codé sur 16 bits (bit r * 4 + c = cellule (r, c) vivante)
+    - Sortie : l'état suivant du bloc central 2x2 (bit r * 2 + c pour la cellule (r + 1, c + 1))
+
+    Les règles viennent des cellules elles-mêmes (polymorphisme AliveCell / DeadCell) :
+    la table donne donc exactement les mêmes résultats que le calcul cellule par cellule.
+    Construite une seule fois, à la première utilisation.
+    """
+    global _BLOCK_TABLE
+    if _BLOCK_TABLE is None:
+        # rules[vivante][voisins] -> vivante au tour suivant ?
+        rules = [[CellFactory.create(alive).next_alive(n) for n in range(9)] for alive in (False, True)]
+
+        # pour chaque cellule centrale : son bit et le masque de ses 8 voisines
+        centres = []
+        for r, c in ((1, 1), (1, 2), (2, 1), (2, 2)):
+            around = sum(1 << (rr * 4 + cc) for rr in range(r - 1, r + 2)
+                         for cc in range(c - 1, c + 2) if (rr, cc) != (r, c))
+            centres.append((r * 4 + c, around))
+
+        table = bytearray(1 << 16)
+        for pattern in range(1 << 16):
+            out = 0
+            for bit, (cell, around) in enumerate(centres):
+                if rules[pattern >> cell & 1][(pattern & around).bit_count()]:
+                    out |= 1 << bit
+            table[pattern] = out
+        _BLOCK_TABLE = bytes(table)
+    return _BLOCK_TABLE
+
+
+class StepEngine(ABC):
+    """
+    ORAL
+    Strategy pour Grid.step : comment calculer la génération suivante.
+    step_into(grid, out) écrit tout l'état suivant dans out, 1 octet par
+    cellule (1 = vivante), ligne par ligne ; la grille fournit toujours le
+    même buffer (pas d'allocation à chaque génération) puis l'applique.
+    next_state(grid) fait la même chose dans un nouvel objet bytes.
+    """
+
+    @abstractmethod
+    def step_into(self, grid: "Grid", out: bytearray) -> None:
+        raise NotImplementedError
+
+    def next_state(self, grid: "Grid") -> bytes:
+        out = bytearray(grid.rows * grid.cols)
+        self.step_into(grid, out)
+        return bytes(out)
+
+
+class CellStepEngine(StepEngine):
+    """
+    Moteur de référence : chaque cellule compte ses voisins et applique
+    sa règle (polymorphisme). Simple à lire, mais une boucle Python par cellule
+    et 8 voisins à regarder à chaque fois.
+    """
+
+    def step_into(self, grid: "Grid", out: bytearray) -> None:
+        cols = grid.cols
+        for r, c, cell in grid:
+            out[r * cols + c] = cell.next_alive(grid.alive_neighbors(r, c))
+
+
+class BlockStepEngine(StepEngine):
+    """
+    Moteur par blocs 2x2 (sans NumPy).
+
+    Idée :
+    - chaque ligne de l'état de la grille devient un entier (bit c = colonne c),
+      entouré d'une bordure morte
+    - pour chaque bloc 2x2, on prend 4 bits dans les 4 lignes qui l'entourent
+      (voisinage 4x4 = 16 bits) et on lit directement son état suivant dans block_table()
+    - 1 lecture de table pour 4 cellules, au lieu de 4 x 8 voisins à compter
+
+    Mêmes résultats que CellStepEngine (bords non reliés, comme alive_neighbors).
+    """
+
+    def step_into(self, grid: "Grid", out: bytearray) -> None:
+        table = block_table()
+        rows, cols = grid.rows, grid.cols
+        state = grid.state
+        block_cols = (cols + 1) // 2
+
+        def line(r: int) -> int:
+            # ligne en entier, décalée d'un bit (colonne -1 morte) ; hors grille : morte
+            if not 0 <= r < rows:
+                return 0
+            return int(bytes(state[r * cols:(r + 1) * cols][::-1]).translate(_TO_DIGITS), 2) << 1
+
+        # fenêtre glissante de 4 lignes : seules des données de la taille d'une ligne sont créées
+        shifts = range(0, 2 * block_cols, 2)
+        c, d = 0, line(0)
+        for top_row in range(0, rows, 2):
+            a, b, c, d = c, d, line(top_row + 1), line(top_row + 2)
+            top = bottom = 0
+            if a | b | c | d:
+                for shift in shifts:
+                    result = table[(a >> shift & 15) | (b >> shift & 15) << 4
+                                   | (c >> shift & 15) << 8 | (d >> shift & 15) << 12]
+                    top |= (result & 3) << shift
+                    bottom |= (result >> 2) << shift
+            for r, bits in ((top_row, top), (top_row + 1, bottom)):
+                if r < rows:
+                    digits = format(bits, f"0{cols}b")[::-1].encode()[:cols]
+                    out[r * cols:(r + 1) * cols] = digits.translate(_FROM_DIGITS)
+
+
+# ============================================================
+# 3) GRID : composition (la grille contient des cellules)
 # ============================================================
 
 class Grid:
@@ -121,11 +250,14 @@ class Grid:
     - cols : nombre de colonnes
     """
 
-    def __init__(self, rows: int, cols: int) -> None:
+    def __init__(self, rows: int, cols: int, engine: Optional[StepEngine] = None) -> None:
         # Attributs privés (consigne d'encapsulation)
         self.__rows = rows
         self.__cols = cols
 
+        # Moteur de calcul de step (Strategy) : par cellule si rien n'est choisi
+        self.__engine: StepEngine = engine or CellStepEngine()
+
         # Matrice 2D (liste de listes) de Cell
         # Tout démarre mort.
         self.__cells: list[list[Cell]] = [
@@ -133,6 +265,19 @@ class Grid:
             for _ in range(rows)
         ]
 
+        # Index des cellules vivantes (r, c), tenu à jour à chaque écriture :
+        # les itérateurs spécialisés n'ont pas à parcourir toute la matrice
+        self.__alive: set[tuple[int, int]] = set()
+
+        # Double buffer d'états (1 octet par case, index r * cols + c) : l'état
+        # courant et celui où le moteur écrit le suivant, échangés à chaque step
+        self.__state = bytearray(rows * cols)
+        self.__next: Optional[bytearray] = None
+
+        # Nb d'écritures hors step (clics, redimensionnement...) : changed_since
+        # sait ainsi si l'état a changé autrement que par des générations
+        self.__edits = 0
+
     # Accesseurs
     @property
     def rows(self) -> int:
@@ -144,6 +289,25 @@ class Grid:
         """Nombre de colonnes (lecture seule)"""
         return self.__cols
 
+    @property
+    def engine(self) -> StepEngine:
+        """Moteur de calcul utilisé par step (Strategy)"""
+        return self.__engine
+
+    @property
+    def state(self) -> memoryview:
+        """État à plat en lecture seule, sans copie (1 octet par case, index r * cols + c)"""
+        return memoryview(self.__state).toreadonly()
+
+    @property
+    def edit_count(self) -> int:
+        """Nb d'écritures hors step depuis la création (lecture seule)"""
+        return self.__edits
+
+    @engine.setter
+    def engine(self, engine: StepEngine) -> None:
+        self.__engine = engine
+
     # Iterator (consigne 4 demandera plus tard un iterator côté Canvas aussi)
     def __iter__(self) -> Iterator[tuple[int, int, Cell]]:
         """
@@ -159,6 +323,29 @@ class Grid:
             for c in range(self.__cols):
                 yield r, c, self.__cells[r][c]
 
+    # Iterators spécialisés : servis par l'index, pas par toute la matrice
+    def alive_cells(self) -> Iterator[tuple[int, int]]:
+        """
+        Iterator sur les cellules vivantes seulement : (r, c).
+        Coût = nombre de vivantes (les mortes ne sont jamais parcourues).
+        """
+        return iter(list(self.__alive))
+
+    def alive_count(self) -> int:
+        """Nombre de cellules vivantes, lu dans l'index (sans parcourir la matrice)."""
+        return len(self.__alive)
+
+    def region(self, r: int, c: int, rows: int, cols: int) -> Iterator[tuple[int, int, Cell]]:
+        """
+        Iterator sur un rectangle (coin (r, c), rows x cols), ligne par ligne.
+        La partie hors de la grille est ignorée.
+        """
+        c0, c1 = max(0, c), min(self.__cols, c + cols)
+        for rr in range(max(0, r), min(self.__rows, r + rows)):
+            row = self.__cells[rr]
+            for cc in range(c0, c1):
+                yield rr, cc, row[cc]
+
     # Méthodes publiques
     def get(self, r: int, c: int) -> Cell:
         """Retourne la cellule à (r,c)."""
@@ -170,6 +357,51 @@ class Grid:
         On utilise la Factory pour ne pas dépendre des classes concrètes.
         """
         self.__cells[r][c] = CellFactory.create(alive)
+        index = r * self.__cols + c
+        if self.__state[index] != alive:
+            self.__state[index] = alive
+            self.__edits += 1
+        if alive:
+            self.__alive.add((r, c))
+        else:
+            self.__alive.discard((r, c))
+
+    def resize(self, rows: int, cols: int, anchor: str = "topleft") -> None:
+        """
+        Change la taille de la grille sans perdre le motif.
+        - anchor="topleft" : le coin haut-gauche reste en place
+        - anchor="center"  : le motif reste centré
+        Les cellules sont immuables : on réutilise les mêmes objets,
+        seules les nouvelles cases reçoivent l'instance morte partagée.
+        """
+        if rows <= 0 or cols <= 0:
+            raise ValueError("rows et cols doivent être > 0")
+        if anchor not in ("topleft", "center"):
+            raise ValueError(f"ancrage inconnu : {anchor}")
+
+        dr = (rows - self.__rows) // 2 if anchor == "center" else 0
+        dc = (cols - self.__cols) // 2 if anchor == "center" else 0
+
+        dead = CellFactory.create(False)
+        cells: list[list[Cell]] = [[dead] * cols for _ in range(rows)]
+        c0, c1 = max(0, -dc), min(self.__cols, cols - dc)
+        for r in range(max(0, -dr), min(self.__rows, rows - dr)):
+            if c0 < c1:
+                cells[r + dr][c0 + dc:c1 + dc] = self.__cells[r][c0:c1]
+
+        self.__cells = cells
+        # index : on décale les vivantes, celles qui sortent de la grille disparaissent
+        self.__alive = {
+            (r + dr, c + dc) for r, c in self.__alive
+            if 0 <= r + dr < rows and 0 <= c + dc < cols
+        }
+        self.__rows = rows
+        self.__cols = cols
+        self.__state = bytearray(rows * cols)
+        for r, c in self.__alive:
+            self.__state[r * cols + c] = 1
+        self.__next = None
+        self.__edits += 1
 
     def toggle(self, r: int, c: int) -> None:
         """
@@ -205,37 +437,58 @@ class Grid:
 
         return count
 
-    def step(self) -> None:
+    def step(self) -> array:
         """
         Avance d'une génération.
 
         IMPORTANT :
-        On calcule d'abord dans une matrice temporaire (next_alive_matrix),
-        puis on applique. Sinon, on fausse le comptage des voisins.
-        """
-
-        # next_alive_matrix[r][c] dira si la cellule sera vivante après step
-        next_alive_matrix: list[list[bool]] = [
-            [False for _ in range(self.__cols)]
-            for _ in range(self.__rows)
-        ]
-
-        for r, c, cell in self:
-            n = self.alive_neighbors(r, c)
+        Le moteur (Strategy) calcule TOUT l'état suivant à partir de l'état actuel,
+        puis on l'applique. Sinon, on fausse le comptage des voisins.
 
-            # Ici c'est LE polymorphisme :
-            # - si cell est AliveCell, il applique la règle des vivantes
-            # - si cell est DeadCell, il applique la règle des mortes
-            next_alive_matrix[r][c] = cell.next_alive(n)
+        Retourne les index (r * cols + c) des cellules qui ont changé.
 
-        # Application : remplacement des cellules (via Factory)
-        for r in range(self.__rows):
-            for c in range(self.__cols):
-                self.__cells[r][c] = CellFactory.create(next_alive_matrix[r][c])
+        Rien de la taille de la grille n'est alloué : le moteur écrit dans le
+        second buffer, les deux buffers sont échangés, et seules les cases qui
+        changent sont mises à jour dans l'index des vivantes et dans la matrice
+        (l'autre instance partagée, Flyweight).
+        """
+        next_state = self.__next
+        if next_state is None:
+            next_state = self.__next = bytearray(self.__rows * self.__cols)
+        self.__engine.step_into(self, next_state)
+
+        # Cellules qui changent : comparaison ligne par ligne (lignes identiques
+        # sautées), puis XOR de la ligne pour trouver les colonnes
+        cols = self.__cols
+        state = self.__state
+        flips = array("I")
+        for start in range(0, len(state), cols):
+            end = start + cols
+            if state[start:end] != next_state[start:end]:
+                line = (int.from_bytes(state[start:end], "big")
+                        ^ int.from_bytes(next_state[start:end], "big")).to_bytes(cols, "big")
+                index = line.find(1)
+                while index >= 0:
+                    flips.append(start + index)
+                    index = line.find(1, index + 1)
+
+        # Application : cellules immuables => une instance vivante et une morte partagées (Factory)
+        alive = CellFactory.create(True)
+        dead = CellFactory.create(False)
+        for index in flips:
+            r, c = divmod(index, cols)
+            if next_state[index]:
+                self.__cells[r][c] = alive
+                self.__alive.add((r, c))
+            else:
+                self.__cells[r][c] = dead
+                self.__alive.discard((r, c))
+        self.__state, self.__next = next_state, state
+        return flips
 
 
 # ============================================================
-# 3) LIVE MODEL : paramètres globaux du jeu (running, vitesse...)
+# 4) LIVE MODEL : paramètres globaux du jeu (running, vitesse...)
 # ============================================================
 
 class LiveModel:
@@ -245,13 +498,21 @@ class LiveModel:
     Il contient la Grid et les paramètres (vitesse, running, génération).
     """
 
-    def __init__(self, rows: int, cols: int) -> None:
+    # Nombre de générations passées dont on garde les changements (changed_since)
+    CHANGE_WINDOW = 8
+
+    def __init__(self, rows: int, cols: int, engine: Optional[StepEngine] = None) -> None:
         # Attributs privés (consigne)
-        self.__grid = Grid(rows, cols)
+        self.__grid = Grid(rows, cols, engine)
         self.__running = False
         self.__speed_ms = 80
         self.__generation = 0
 
+        # (génération, nb d'écritures de la grille à la fin de cette génération,
+        # index des cellules changées par le step suivant), pour les dernières
+        # générations seulement : taille = activité, pas grille
+        self.__marks: deque[tuple[int, int, array]] = deque(maxlen=self.CHANGE_WINDOW)
+
     # ORAL : accesseurs
     @property
     def grid(self) -> Grid:
@@ -293,6 +554,15 @@ class LiveModel:
     def clear(self) -> None:
         self.__grid.clear()
         self.__generation = 0
+        self.__marks.clear()
+
+    def resize(self, rows: int, cols: int, anchor: str = "topleft") -> None:
+        """
+        Consigne 3 : changer la taille sans perdre le motif
+        (la génération est conservée).
+        """
+        self.__grid.resize(rows, cols, anchor)
+        self.__marks.clear()  # les états passés n'ont plus la même taille
 
     # CONSIGNE 5 : bouton "Aléa"
     def randomize(self, density: float = 0.25) -> None:
@@ -307,16 +577,39 @@ class LiveModel:
             self.__grid.set_alive(r, c, alive)
 
         self.__generation = 0
+        self.__marks.clear()
 
     # CONSIGNE 6 : compter les vivantes (console ou GUI)
     def alive_count(self) -> int:
-        """Retourne le nombre de cellules vivantes."""
-        count = 0
-        for _r, _c, cell in self.__grid:
-            if cell.alive:
-                count += 1
-        return count
+        """Retourne le nombre de cellules vivantes (index de la grille)."""
+        return self.__grid.alive_count()
 
     def step(self) -> None:
-        self.__grid.step()
+        edits = self.__grid.edit_count
+        self.__marks.append((self.__generation, edits, self.__grid.step()))
         self.__generation += 1
+
+    def changed_since(self, generation: int) -> Optional[list[tuple[int, int, bool]]]:
+        """
+        Cellules (r, c, vivante) dont l'état diffère de l'état final de la
+        génération donnée. Calculé avec les cellules changées par chaque step
+        (une cellule changée deux fois est revenue à son état) : coût = activité,
+        pas taille de la grille.
+
+        Retourne None si cette génération n'est plus connue (trop ancienne,
+        grille vidée, redimensionnée...) ou si des cellules ont été modifiées
+        depuis (clics) : tout est alors à redessiner.
+        """
+        if generation == self.__generation:
+            return []
+        grid = self.__grid
+        steps = [mark for mark in self.__marks if mark[0] >= generation]
+        if not steps or steps[0][0] != generation:
+            return None
+        if any(edits != grid.edit_count for _marked, edits, _flips in steps):
+            return None
+        changed: set[int] = set()
+        for _marked, _edits, flips in steps:
+            changed.symmetric_difference_update(flips)
+        cols = grid.cols
+        return [(r, c, grid.get(r, c).alive) for r, c in (divmod(index, cols) for index in sorted(changed))]
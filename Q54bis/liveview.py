@@ -12,7 +12,7 @@ BUT MVC :
 from __future__ import annotations
 
 from tkinter import Tk, Canvas, Frame, Button, Label, Entry, LEFT, RIGHT, TOP
-from typing import Iterator
+from typing import Iterable, Iterator
 
 
 class LiveCanvas:
@@ -33,6 +33,9 @@ class LiveCanvas:
         self.__canvas = Canvas(parent, width=width_px, height=height_px, bg="white")
         self.__canvas.pack(side=TOP, padx=5, pady=5)
 
+        # Cellules vivantes actuellement dessinées (une par rectangle noir)
+        self.__drawn: set[tuple[int, int]] = set()
+
         # Events -> controller
         self.__canvas.bind("<Button-1>", self.__on_left_click)   # click gauche
         self.__canvas.bind("<Button-3>", self.__on_right_click)  # click droit
@@ -45,22 +48,15 @@ class LiveCanvas:
         Iterator appliqué à LiveCanvas.
 
         BUT :
-        - permettre d’itérer facilement sur toutes les cellules visibles
+        - itérer sur ce qui est affiché : les cellules vivantes dessinées (row/col)
         - utile pour l’affichage (ex: redessiner, debug, futur refactor)
 
         Remarque :
-        - Ici on itère sur les cellules "pixelisées" (row/col)
-        - La View ne connaît PAS l’état vivant/mort (ça vient du Controller)
+        - On ne parcourt plus toutes les cases pixelisées : seulement les
+          rectangles noirs (les mortes ne sont pas dessinées)
+        - La View ne connaît PAS le modèle (l'état vient du Controller)
         """
-        width_px = int(self.__canvas["width"])
-        height_px = int(self.__canvas["height"])
-
-        cols = width_px // self.__cell_px
-        rows = height_px // self.__cell_px
-
-        for r in range(rows):
-            for c in range(cols):
-                yield r, c
+        return iter(list(self.__drawn))
 
     # ==========================
     # Events souris -> controller
@@ -73,6 +69,10 @@ class LiveCanvas:
         row, col = self.xy_to_rc(event.x, event.y)
         self.__controller.gui_set_dead(row, col)
 
+    def resize(self, rows: int, cols: int) -> None:
+        """Adapte la taille du Canvas à la nouvelle grille (consigne 3)."""
+        self.__canvas.config(width=cols * self.__cell_px, height=rows * self.__cell_px)
+
     def xy_to_rc(self, x: int, y: int) -> tuple[int, int]:
         """
         Conversion pixels -> logique.
@@ -118,9 +118,10 @@ class LiveCanvas:
         color = "black" if alive else "white"
 
         # outline="" pour éviter bordure noire sur chaque cellule
-        self.__canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="")
+        # tag r{row}c{col} : pour effacer/redessiner une seule cellule
+        self.__canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="", tags=f"r{row}c{col}")
 
-    def render(self, rows: int, cols: int, alive_cells: list[tuple[int, int]]) -> None:
+    def render(self, rows: int, cols: int, alive_cells: Iterable[tuple[int, int]]) -> None:
         """
         Rend l'état du modèle :
         - On redessine tout (simple et fiable au début)
@@ -135,8 +136,24 @@ class LiveCanvas:
         self.draw_grid(rows, cols)
 
         # Dessine uniquement les vivantes (venant du Controller -> Model)
+        self.__drawn = set()
         for r, c in alive_cells:
             self.draw_cell(r, c, True)
+            self.__drawn.add((r, c))
+
+    def render_changes(self, changes: list[tuple[int, int, bool]]) -> None:
+        """
+        Rendu incrémental : seulement les cellules qui ont changé (r, c, vivante)
+        - vivante : rectangle noir
+        - morte   : on efface son rectangle
+        """
+        for r, c, alive in changes:
+            self.__canvas.delete(f"r{r}c{c}")
+            if alive:
+                self.draw_cell(r, c, True)
+                self.__drawn.add((r, c))
+            else:
+                self.__drawn.discard((r, c))
 
 
 class LiveCommandBar:
@@ -190,9 +207,17 @@ class LiveView:
         height_px = rows * cell_px
         self.__canvas = LiveCanvas(self.__window, controller, cell_px, width_px, height_px)
 
-    def render(self, rows: int, cols: int, alive_cells: list[tuple[int, int]]) -> None:
+    def render(self, rows: int, cols: int, alive_cells: Iterable[tuple[int, int]]) -> None:
         self.__canvas.render(rows, cols, alive_cells)
 
+    def render_changes(self, changes: list[tuple[int, int, bool]]) -> None:
+        """Seulement les cellules qui ont changé depuis le dernier affichage."""
+        self.__canvas.render_changes(changes)
+
+    def resize(self, rows: int, cols: int) -> None:
+        """Nouvelle taille de grille : on agrandit/réduit le Canvas."""
+        self.__canvas.resize(rows, cols)
+
     def after(self, delay_ms: int, callback) -> None:
         """Expose Tk.after au controller."""
         self.__window.after(delay_ms, callback)
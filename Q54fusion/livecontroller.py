@@ -14,10 +14,33 @@ Fusion :
 
 from __future__ import annotations
 
-from livemodel import LiveModel, RandomStrategy, CanonStrategy, EmptyStrategy
+from livemodel import LiveModel, RandomStrategy, CanonStrategy, EmptyStrategy, BlockStepEngine
 from liveview import LiveView
 from livecounter import LiveCounter
 
+# Dessin à la souris : délai avant d'appliquer les cellules en attente (ms)
+PAINT_FRAME_MS = 16
+
+
+def line_cells(r0: int, c0: int, r1: int, c1: int) -> list[tuple[int, int]]:
+    """Cellules du segment (r0, c0) -> (r1, c1), extrémités comprises (Bresenham)."""
+    dr, dc = -abs(r1 - r0), abs(c1 - c0)
+    sr = 1 if r0 < r1 else -1
+    sc = 1 if c0 < c1 else -1
+    error = dc + dr
+    cells: list[tuple[int, int]] = []
+    while True:
+        cells.append((r0, c0))
+        if r0 == r1 and c0 == c1:
+            return cells
+        double = 2 * error
+        if double >= dr:
+            error += dr
+            c0 += sc
+        if double <= dc:
+            error += dc
+            r0 += sr
+
 
 class LiveController:
     @classmethod
@@ -27,6 +50,8 @@ class LiveController:
     def __init__(self, rows: int = 40, cols: int = 40, cell_px: int = 10):
         # Model
         self.__model = LiveModel(rows, cols, cell_px=cell_px)
+        # Moteur par blocs 2x2 (table 4x4 -> 2x2) : mêmes résultats, bien plus rapide
+        self.__model.set_engine(BlockStepEngine())
 
         # Counter (Observer)
         self.__counter = LiveCounter()
@@ -41,6 +66,12 @@ class LiveController:
         self.__model.set_strategy(self.__strategy_empty)
         self.__model.apply_strategy()
 
+        # Dessin à la souris : cellules en attente, appliquées en un lot par image
+        self.__paint_alive: bool | None = None
+        self.__paint_last: tuple[int, int] | None = None
+        self.__paint_pending: list[tuple[int, int]] = []
+        self.__paint_scheduled = False
+
         # View
         self.__view = LiveView(self, cell_px=cell_px, rows=rows, cols=cols)
 
@@ -50,16 +81,6 @@ class LiveController:
         # Lancement GUI
         self.__view.mainloop()
 
-    # ------------------------------------
-    # Helper : liste vivantes
-    # ------------------------------------
-    def __alive_cells(self) -> list[tuple[int, int]]:
-        out: list[tuple[int, int]] = []
-        for r, c, cell in self.__model.grid:
-            if cell.alive:
-                out.append((r, c))
-        return out
-
     # ------------------------------------
     # Rendu
     # ------------------------------------
@@ -69,15 +90,14 @@ class LiveController:
             f"[GEN={self.__model.generation}] "
             f"alive={self.__model.alive_count()} "
             f"running={self.__model.running} "
-            f"counter_alive={self.__counter.alive_count}"
+            f"counter_alive={self.__counter.alive_count} "
+            f"coalesced={self.__view.scheduler.coalesced}"
         )
 
         # GUI
+        # vue de l'état sans copie : plus de liste des cellules vivantes
         self.__view.render(
-            rows=self.__model.grid.rows,
-            cols=self.__model.grid.cols,
-            alive_cells=self.__alive_cells(),
-            generation=self.__model.generation,
+            state=self.__model.state_view(),
             alive_count=self.__counter.alive_count,
         )
 
@@ -135,22 +155,68 @@ class LiveController:
         rows = int(parts[0])
         cols = int(parts[1])
 
-        # recrée le modèle
-        self.__model = LiveModel(rows, cols, cell_px=self.__model.cell_px)
-        self.__model.set_counter(self.__counter)
-
-        # config vide
-        self.__model.set_strategy(self.__strategy_empty)
-        self.__model.apply_strategy()
+        # redimensionne sur place (motif, génération et compteur conservés)
+        self.__model.resize(rows, cols, anchor="center")
+        self.__view.resize(rows, cols)
 
         self.gui_render()
 
     def gui_toggle_cell(self, row: int, col: int) -> None:
         if 0 <= row < self.__model.grid.rows and 0 <= col < self.__model.grid.cols:
             self.__model.toggle_cell(row, col)
-            self.gui_render()
+            self.__render_cells([(row, col)], self.__model.grid.get(row, col).alive)
 
     def gui_set_dead(self, row: int, col: int) -> None:
-        if 0 <= row < self.__model.grid.rows and 0 <= col < self.__model.grid.cols:
-            self.__model.grid.set_alive(row, col, False)
-            self.gui_render()
+        self.__render_cells(self.__model.paint_cells([(row, col)], False), False)
+
+    # ------------------------------------
+    # dessin à la souris (glisser)
+    # ------------------------------------
+    def gui_paint_start(self, row: int, col: int, button: int) -> None:
+        """
+        Bouton enfoncé. Clic gauche : la première cellule bascule et tout le
+        tracé prend son nouvel état ; clic droit : le tracé tue les cellules.
+        """
+        inside = 0 <= row < self.__model.grid.rows and 0 <= col < self.__model.grid.cols
+        if button == 1:
+            self.__paint_alive = not self.__model.grid.get(row, col).alive if inside else True
+        else:
+            self.__paint_alive = False
+        self.__paint_last = (row, col)
+        self.__paint_pending.append((row, col))
+        self.__schedule_paint()
+
+    def gui_paint_move(self, row: int, col: int) -> None:
+        """Glisser : la souris saute des cases quand elle va vite, on trace le segment."""
+        if self.__paint_alive is None or (row, col) == self.__paint_last:
+            return
+        self.__paint_pending += line_cells(*self.__paint_last, row, col)[1:]
+        self.__paint_last = (row, col)
+        self.__schedule_paint()
+
+    def gui_paint_end(self) -> None:
+        self.__flush_paint()
+        self.__paint_alive = None
+
+    def __schedule_paint(self) -> None:
+        # au plus un lot (et un dessin) par image
+        if not self.__paint_scheduled:
+            self.__paint_scheduled = True
+            self.__view.after(PAINT_FRAME_MS, self.__flush_paint)
+
+    def __flush_paint(self) -> None:
+        self.__paint_scheduled = False
+        cells, self.__paint_pending = self.__paint_pending, []
+        if cells and self.__paint_alive is not None:
+            alive = self.__paint_alive
+            self.__render_cells(self.__model.paint_cells(cells, alive), alive)
+
+    def __render_cells(self, cells: list[tuple[int, int]], alive: bool) -> None:
+        # dessin incrémental : seulement les cellules modifiées + la barre d'infos
+        if cells:
+            self.__view.draw_cells(
+                cells,
+                alive,
+                generation=self.__model.generation,
+                alive_count=self.__counter.alive_count,
+            )
@@ -6,7 +6,8 @@ Compteur (Observer simplifié) + Singleton optionnel.
 Objectifs :
 - Consigne 6 : compter le nombre de cellules vivantes.
 - Justifier "Observer" : le modèle appelle counter.count_all(self) après step / toggle / config.
-- Justifier "Singleton" : __new__ renvoie toujours la même instance (optionnel à l’oral).
+- Justifier "Singleton" : get_instance() renvoie toujours la même instance (optionnel à l’oral),
+  LiveCounter() crée un compteur indépendant (une simulation = un compteur).
 """
 
 from __future__ import annotations
@@ -23,11 +24,15 @@ class LiveCounter:
 
     _instance = None  # Singleton optionnel
 
-    def __new__(cls):
-        # Singleton (optionnel)
+    def __init__(self) -> None:
+        # un compteur par simulation (plusieurs univers possibles)
+        self._alive_count = 0
+
+    @classmethod
+    def get_instance(cls) -> "LiveCounter":
+        # Singleton (optionnel) : compteur partagé par défaut
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._alive_count = 0
+            cls._instance = cls()
         return cls._instance
 
     @property
@@ -50,5 +55,12 @@ class LiveCounter:
                 count += 1
         self._alive_count = count
 
+    def count_changes(self, delta: int) -> None:
+        """
+        Mise à jour incrémentale : delta cellules vivantes en plus (ou en moins).
+        Le modèle l'utilise pour les clics et le dessin, où il sait ce qui a changé.
+        """
+        self._alive_count += delta
+
     def __str__(self) -> str:
         return f"LiveCounter: {self._alive_count} cellules vivantes"
@@ -12,10 +12,14 @@ Consignes :
 - Strategy : Random/Canon/Empty ✅
 - Observer : Counter (cells vivantes) ✅
 - Iterator : Grid.__iter__ ✅
+- Vue de l'état sans copie : GridState (lecture seule, copie à l'écriture) ✅
+- Moteurs de calcul au choix pour Grid.step : par cellule ou par blocs 2x2 ✅
 """
 
 from __future__ import annotations
 
+import random
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Iterator, Optional
@@ -73,17 +77,58 @@ class DeadCell(Cell):
 class CellFactory:
     """
     Factory : centralise la création des cellules.
+    Les cellules sont immuables : une seule instance vivante et une seule
+    morte, partagées par toutes les cases (Flyweight).
     """
 
+    _ALIVE: Cell = AliveCell()
+    _DEAD: Cell = DeadCell()
+
     @staticmethod
     def create(alive: bool) -> Cell:
-        return AliveCell() if alive else DeadCell()
+        return CellFactory._ALIVE if alive else CellFactory._DEAD
 
 
 # ============================================================
 # 2) STRATEGY : configurations (surplus initiative)
 # ============================================================
 
+# octet -> 8 cellules (bit de poids faible en premier)
+_BYTE_TO_CELLS = [bytes((value >> bit) & 1 for bit in range(8)) for value in range(256)]
+
+
+def random_mask(total: int, alive_count: int, rng: random.Random) -> bytearray:
+    """
+    Masque de `total` cellules (1 octet par cellule) avec exactement
+    `alive_count` vivantes, tiré en bloc avec getrandbits puis corrigé.
+    """
+    alive_count = max(0, min(alive_count, total))
+    if alive_count == total:
+        return bytearray(b"\x01" * total)
+
+    # probabilité sur 8 bits, bits de poids faible d'abord
+    level = alive_count * 256 // total
+    mask = 0
+    for bit in range(8):
+        bits = rng.getrandbits(total)
+        mask = (mask | bits) if (level >> bit) & 1 else (mask & bits)
+
+    packed = mask.to_bytes((total + 7) // 8, "little")
+    state = bytearray(b"".join(map(_BYTE_TO_CELLS.__getitem__, packed)))
+    del state[total:]
+
+    # correction de l'écart pour avoir exactement alive_count vivantes
+    missing = alive_count - mask.bit_count()
+    wanted = 1 if missing > 0 else 0
+    missing = abs(missing)
+    while missing:
+        index = rng.randrange(total)
+        if state[index] != wanted:
+            state[index] = wanted
+            missing -= 1
+    return state
+
+
 class ConfigStrategy(ABC):
     @abstractmethod
     def apply(self, model: "LiveModel") -> None:
@@ -98,26 +143,21 @@ class EmptyStrategy(ConfigStrategy):
 
 
 class RandomStrategy(ConfigStrategy):
-    """Configuration aléatoire : X% vivantes."""
+    """
+    Configuration aléatoire : X% vivantes.
+    Graine (seed) optionnelle : même graine => même tirage.
+    """
 
-    def __init__(self, percentage: int = 25):
+    def __init__(self, percentage: int = 25, seed: Optional[int] = None):
         self.percentage = percentage
+        self.__rng = random.Random(seed)
 
     def apply(self, model: "LiveModel") -> None:
-        import random
-
-        model.clear()
-
         total = model.grid.rows * model.grid.cols
         target = int(total * self.percentage / 100)
 
-        coords = [(r, c) for r, c, _cell in model.grid]
-        if target > len(coords):
-            target = len(coords)
-
-        for (r, c) in random.sample(coords, k=target):
-            model.grid.set_alive(r, c, True)
-
+        # un seul masque tiré en bloc, écrit en une fois dans la grille
+        model.grid.load(random_mask(total, target, self.__rng))
         model.reset_generation()
 
 
@@ -153,21 +193,170 @@ class CanonStrategy(ConfigStrategy):
 
 
 # ============================================================
-# 3) GRID : composition + Iterator
+# 3) MOTEURS DE CALCUL : Strategy pour Grid.step
+# ============================================================
+
+# octet 0/1 -> chiffre ASCII "0"/"1" (et l'inverse) : une ligne <-> un entier
+_TO_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_FROM_DIGITS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def _row_bits(row) -> int:
+    """Ligne d'états (1 octet par cellule) -> entier, bit c = colonne c."""
+    return int(bytes(row[::-1]).translate(_TO_DIGITS), 2) if row else 0
+
+
+def _bits_row(bits: int, cols: int) -> bytes:
+    """Inverse de _row_bits (cols cellules)."""
+    return format(bits, f"0{cols}b")[::-1].encode()[:cols].translate(_FROM_DIGITS)
+
+
+_BLOCK_TABLE: Optional[bytes] = None
+
+
+def block_table() -> bytes:
+    """
+    Table 4x4 -> 2x2 (65 536 entrées, construite une fois, à la première utilisation).
+
+    Entrée : voisinage 4x4, bit r * 4 + c = cellule (r, c) vivante.
+    Sortie : état suivant du bloc central 2x2, bit r * 2 + c pour (r + 1, c + 1).
+    Les règles viennent des cellules elles-mêmes (AliveCell / DeadCell).
+    """
+    global _BLOCK_TABLE
+    if _BLOCK_TABLE is None:
+        rules = [[CellFactory.create(alive).next_alive(n) for n in range(9)] for alive in (False, True)]
+        centres = []
+        for r, c in ((1, 1), (1, 2), (2, 1), (2, 2)):
+            around = sum(1 << (rr * 4 + cc) for rr in range(r - 1, r + 2)
+                         for cc in range(c - 1, c + 2) if (rr, cc) != (r, c))
+            centres.append((r * 4 + c, around))
+        table = bytearray(1 << 16)
+        for pattern in range(1 << 16):
+            out = 0
+            for bit, (cell, around) in enumerate(centres):
+                if rules[pattern >> cell & 1][(pattern & around).bit_count()]:
+                    out |= 1 << bit
+            table[pattern] = out
+        _BLOCK_TABLE = bytes(table)
+    return _BLOCK_TABLE
+
+
+class StepEngine(ABC):
+    """
+    Calcule l'état suivant de toute la grille (1 octet par cellule, ligne par ligne).
+    step_into écrit dans un buffer fourni par la grille (réutilisé à chaque
+    génération) ; next_state renvoie un nouvel état.
+    """
+
+    @abstractmethod
+    def step_into(self, grid: "Grid", out: bytearray) -> None:
+        raise NotImplementedError
+
+    def next_state(self, grid: "Grid") -> bytes:
+        out = bytearray(grid.rows * grid.cols)
+        self.step_into(grid, out)
+        return bytes(out)
+
+
+class CellStepEngine(StepEngine):
+    """Moteur de référence : chaque cellule compte ses voisins et applique sa règle."""
+
+    def step_into(self, grid: "Grid", out: bytearray) -> None:
+        cols = grid.cols
+        for r, c, cell in grid:
+            out[r * cols + c] = cell.next_alive(grid.alive_neighbors(r, c))
+
+
+class BlockStepEngine(StepEngine):
+    """
+    Moteur par blocs 2x2, sans NumPy :
+    chaque bloc 2x2 est lu dans la table 4x4 -> 2x2 avec son voisinage,
+    les lignes sont des entiers (un bit par cellule, entourés d'une bordure morte).
+    Mêmes résultats que CellStepEngine (bords non reliés).
+    """
+
+    def step_into(self, grid: "Grid", out: bytearray) -> None:
+        table = block_table()
+        rows, cols = grid.rows, grid.cols
+        state = grid.state_view().buffer
+        block_cols = (cols + 1) // 2
+
+        def line(r: int) -> int:
+            # ligne en entier, décalée d'un bit (colonne -1 morte) ; hors grille : morte
+            return _row_bits(state[r * cols:(r + 1) * cols]) << 1 if 0 <= r < rows else 0
+
+        # fenêtre glissante de 4 lignes : seules des données de la taille d'une ligne sont créées
+        shifts = range(0, 2 * block_cols, 2)
+        c, d = 0, line(0)
+        for top_row in range(0, rows, 2):
+            a, b, c, d = c, d, line(top_row + 1), line(top_row + 2)
+            top = bottom = 0
+            for shift in shifts:
+                result = table[(a >> shift & 15) | (b >> shift & 15) << 4
+                               | (c >> shift & 15) << 8 | (d >> shift & 15) << 12]
+                top |= (result & 3) << shift
+                bottom |= (result >> 2) << shift
+            out[top_row * cols:(top_row + 1) * cols] = _bits_row(top, cols)
+            if top_row + 1 < rows:
+                out[(top_row + 1) * cols:(top_row + 2) * cols] = _bits_row(bottom, cols)
+
+
+# ============================================================
+# 4) GRID : composition + Iterator
 # ============================================================
 
+@dataclass(frozen=True)
+class GridState:
+    """
+    Vue de l'état sans copie, pour la View.
+
+    - buffer : memoryview en lecture seule, 1 octet par cellule (1 = vivante),
+      ligne par ligne (indice r * cols + c)
+    - generation : génération de l'état vu (0 si la grille est seule)
+
+    Une vue suit les écritures en place (clics, dessin) ; step, load et resize
+    changent de buffer : redemander une vue ensuite (step alterne entre deux
+    buffers, une vue ancienne montre donc plus tard une autre génération).
+    Une image (Grid.snapshot) reste figée : la grille recopie son buffer avant
+    d'écrire (copie à l'écriture) et ne le réutilise jamais pour step.
+    """
+
+    buffer: memoryview
+    rows: int
+    cols: int
+    generation: int = 0
+
+    def alive(self, r: int, c: int) -> bool:
+        return self.buffer[r * self.cols + c] == 1
+
+    def alive_cells(self) -> Iterator[tuple[int, int]]:
+        """Cellules vivantes (r, c), trouvées par recherche d'octets (pas de liste de booléens)."""
+        cols = self.cols
+        for match in re.finditer(b"\x01", self.buffer):
+            yield divmod(match.start(), cols)
+
+    def alive_count(self) -> int:
+        return int.from_bytes(self.buffer, "little").bit_count()
+
+
 class Grid:
     """
     Grid contient une matrice de Cell : composition.
     """
 
-    def __init__(self, rows: int, cols: int) -> None:
+    def __init__(self, rows: int, cols: int, engine: Optional[StepEngine] = None) -> None:
         self.__rows = rows
         self.__cols = cols
+        self.__engine: StepEngine = engine or CellStepEngine()
         self.__cells: list[list[Cell]] = [
             [CellFactory.create(False) for _ in range(cols)]
             for _ in range(rows)
         ]
+        # état à plat (1 octet par cellule), tenu à jour avec les cellules
+        self.__state = bytearray(rows * cols)
+        self.__shared = False   # une image (snapshot) partage le buffer
+        # second buffer : step y écrit l'état suivant puis les deux s'échangent
+        self.__back: Optional[bytearray] = None
 
     @property
     def rows(self) -> int:
@@ -177,6 +366,14 @@ class Grid:
     def cols(self) -> int:
         return self.__cols
 
+    @property
+    def engine(self) -> StepEngine:
+        return self.__engine
+
+    @engine.setter
+    def engine(self, engine: StepEngine) -> None:
+        self.__engine = engine
+
     def __iter__(self) -> Iterator[tuple[int, int, Cell]]:
         for r in range(self.__rows):
             for c in range(self.__cols):
@@ -185,8 +382,80 @@ class Grid:
     def get(self, r: int, c: int) -> Cell:
         return self.__cells[r][c]
 
+    def state_view(self, generation: int = 0) -> GridState:
+        """Vue en lecture seule de l'état, sans copie (suit les écritures)."""
+        return GridState(memoryview(self.__state).toreadonly(), self.__rows, self.__cols, generation)
+
+    def snapshot(self, generation: int = 0) -> GridState:
+        """Image figée de l'état, sans copie : la grille copiera avant d'écrire."""
+        self.__shared = True
+        return self.state_view(generation)
+
+    def __writable(self) -> bytearray:
+        # copie à l'écriture : une image partage le buffer actuel
+        if self.__shared:
+            self.__state = bytearray(self.__state)
+            self.__shared = False
+        return self.__state
+
     def set_alive(self, r: int, c: int, alive: bool) -> None:
         self.__cells[r][c] = CellFactory.create(alive)
+        self.__writable()[r * self.__cols + c] = 1 if alive else 0
+
+    def load(self, states) -> None:
+        """
+        Remplace tout l'état d'un coup.
+        states : une valeur par cellule, ligne par ligne (1/True = vivante).
+        Les cellules sont immuables : on partage une instance vivante et une morte.
+        """
+        if len(states) != self.__rows * self.__cols:
+            raise ValueError("taille de l'état incorrecte")
+        alive = CellFactory.create(True)
+        dead = CellFactory.create(False)
+        cols = self.__cols
+        self.__cells = [
+            [alive if state else dead for state in states[r * cols:(r + 1) * cols]]
+            for r in range(self.__rows)
+        ]
+        if isinstance(states, (bytes, bytearray)):
+            self.__state = bytearray(states)  # déjà 0/1 : copie en C
+        else:
+            self.__state = bytearray(1 if state else 0 for state in states)
+        self.__shared = False
+
+    def resize(self, rows: int, cols: int, anchor: str = "topleft") -> None:
+        """
+        Change la taille de la grille sans perdre le motif.
+        - anchor="topleft" : le coin haut-gauche reste en place
+        - anchor="center"  : le motif reste centré
+        Les cellules sont immuables : on réutilise les mêmes objets,
+        seules les nouvelles cases reçoivent l'instance morte partagée.
+        """
+        if rows <= 0 or cols <= 0:
+            raise ValueError("rows et cols doivent être > 0")
+        if anchor not in ("topleft", "center"):
+            raise ValueError(f"ancrage inconnu : {anchor}")
+
+        dr = (rows - self.__rows) // 2 if anchor == "center" else 0
+        dc = (cols - self.__cols) // 2 if anchor == "center" else 0
+
+        dead = CellFactory.create(False)
+        cells: list[list[Cell]] = [[dead] * cols for _ in range(rows)]
+        state = bytearray(rows * cols)
+        old_cols = self.__cols
+        c0, c1 = max(0, -dc), min(old_cols, cols - dc)
+        for r in range(max(0, -dr), min(self.__rows, rows - dr)):
+            if c0 < c1:
+                cells[r + dr][c0 + dc:c1 + dc] = self.__cells[r][c0:c1]
+                start = (r + dr) * cols
+                state[start + c0 + dc:start + c1 + dc] = self.__state[r * old_cols + c0:r * old_cols + c1]
+
+        self.__cells = cells
+        self.__state = state
+        self.__shared = False
+        self.__back = None
+        self.__rows = rows
+        self.__cols = cols
 
     def toggle(self, r: int, c: int) -> None:
         self.set_alive(r, c, not self.get(r, c).alive)
@@ -207,22 +476,30 @@ class Grid:
         return count
 
     def step(self) -> None:
-        next_alive_matrix: list[list[bool]] = [
-            [False for _ in range(self.__cols)]
-            for _ in range(self.__rows)
-        ]
-
-        for r, c, cell in self:
-            n = self.alive_neighbors(r, c)
-            next_alive_matrix[r][c] = cell.next_alive(n)
-
-        for r in range(self.__rows):
-            for c in range(self.__cols):
-                self.__cells[r][c] = CellFactory.create(next_alive_matrix[r][c])
+        # le moteur (Strategy) calcule tout l'état suivant depuis l'état actuel
+        # dans le second buffer, puis les deux buffers s'échangent (double buffer :
+        # rien de la taille de la grille n'est alloué ; un buffer confié à une
+        # image n'est pas réutilisé)
+        back = self.__back
+        if back is None:
+            back = bytearray(self.__rows * self.__cols)
+        self.__engine.step_into(self, back)
+
+        # cellules mises à jour en place, ligne par ligne (instances partagées)
+        cells = (CellFactory.create(False), CellFactory.create(True))
+        cols = self.__cols
+        view = memoryview(back)
+        for r, row in enumerate(self.__cells):
+            row[:] = map(cells.__getitem__, view[r * cols:(r + 1) * cols])
+        view.release()
+
+        self.__back = None if self.__shared else self.__state
+        self.__state = back
+        self.__shared = False
 
 
 # ============================================================
-# 4) LIVE MODEL : paramètres + Observer + Strategy
+# 5) LIVE MODEL : paramètres + Observer + Strategy
 # ============================================================
 
 class LiveModel:
@@ -236,8 +513,8 @@ class LiveModel:
     - counter (observer)
     """
 
-    def __init__(self, rows: int, cols: int, cell_px: int = 10) -> None:
-        self.__grid = Grid(rows, cols)
+    def __init__(self, rows: int, cols: int, cell_px: int = 10, engine: Optional[StepEngine] = None) -> None:
+        self.__grid = Grid(rows, cols, engine)
         self.__running = False
         self.__speed_ms = 80
         self.__generation = 0
@@ -273,6 +550,15 @@ class LiveModel:
     def cell_px(self) -> int:
         return self.__cell_px
 
+    # --- Vue de l'état (pour la View) ---
+    def state_view(self) -> GridState:
+        """État courant sans copie, avec sa génération."""
+        return self.__grid.state_view(self.__generation)
+
+    def snapshot(self) -> GridState:
+        """Image figée de l'état courant (copie à l'écriture côté grille)."""
+        return self.__grid.snapshot(self.__generation)
+
     # --- Observer ---
     def set_counter(self, counter) -> None:
         self.__counter = counter
@@ -282,6 +568,10 @@ class LiveModel:
         if self.__counter:
             self.__counter.count_all(self)
 
+    # --- Moteur de calcul (Strategy pour step) ---
+    def set_engine(self, engine: StepEngine) -> None:
+        self.__grid.engine = engine
+
     # --- Strategy ---
     def set_strategy(self, strategy: ConfigStrategy) -> None:
         self.__strategy = strategy
@@ -301,19 +591,41 @@ class LiveModel:
 
     def toggle_cell(self, r: int, c: int) -> None:
         self.__grid.toggle(r, c)
-        self.__notify_counter()
+        # une seule cellule a changé : pas besoin de tout recompter
+        if self.__counter:
+            self.__counter.count_changes(1 if self.__grid.get(r, c).alive else -1)
+
+    def paint_cells(self, cells, alive: bool) -> list[tuple[int, int]]:
+        """
+        Met toutes les cellules (r, c) dans l'état alive, en un seul lot
+        (positions hors grille ignorées). Le compteur reçoit un seul
+        événement avec la différence.
+        Retourne les cellules qui ont vraiment changé (à redessiner).
+        """
+        grid = self.__grid
+        changed: list[tuple[int, int]] = []
+        for r, c in cells:
+            if 0 <= r < grid.rows and 0 <= c < grid.cols and grid.get(r, c).alive != alive:
+                grid.set_alive(r, c, alive)
+                changed.append((r, c))
+        if changed and self.__counter:
+            self.__counter.count_changes(len(changed) if alive else -len(changed))
+        return changed
 
     def clear(self) -> None:
         self.__grid.clear()
         self.__generation = 0
         self.__notify_counter()
 
+    def resize(self, rows: int, cols: int, anchor: str = "topleft") -> None:
+        # motif, génération et compteur conservés
+        self.__grid.resize(rows, cols, anchor)
+        self.__notify_counter()
+
     def reset_generation(self) -> None:
         self.__generation = 0
 
     def randomize(self, density: float = 0.25) -> None:
-        import random
-
         for r, c, _ in self.__grid:
             self.__grid.set_alive(r, c, random.random() < density)
 
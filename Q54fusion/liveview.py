@@ -8,12 +8,85 @@ View Tkinter :
 
 Consigne 4 :
 - Iterator appliqué à LiveCanvas : __iter__() pour parcourir toutes les cellules affichables.
+
+Rendu : les demandes (render, draw_cells) sont regroupées par RenderScheduler,
+au plus un rendu par image, fait quand Tk est libre (pas de update() forcé).
 """
 
 from __future__ import annotations
 
+import time
 from tkinter import Tk, Canvas, Frame, Button, Label, Entry, LEFT, RIGHT, TOP, BOTH, X
-from typing import Iterator, Optional
+from typing import Callable, Iterator, Optional
+
+from livemodel import GridState
+
+
+class RenderScheduler:
+    """
+    Regroupe les demandes de rendu :
+    - mark_dirty() : toute la grille ; mark_dirty(cells) : quelques cellules
+      {(r, c): vivante}, la dernière demande d'une cellule l'emporte
+    - la première demande programme un seul rappel after_idle, les suivantes
+      s'y ajoutent ; elles sont comptées dans coalesced (images économisées)
+    - deux rendus sont espacés d'au moins frame_ms
+    """
+
+    def __init__(self, window, render: Callable[[Optional[dict], int], None],
+                 frame_ms: int = 16, clock: Callable[[], float] = time.perf_counter):
+        """render(cells, coalesced) : cells = None pour toute la grille."""
+        self.__window = window
+        self.__render = render
+        self.__frame = frame_ms / 1000
+        self.__clock = clock
+        self.__pending = False
+        self.__full = False
+        self.__cells: dict[tuple[int, int], bool] = {}
+        self.__merged = 0
+        self.__last: Optional[float] = None
+        self.__renders = 0
+        self.__coalesced = 0
+
+    @property
+    def pending(self) -> bool:
+        return self.__pending
+
+    @property
+    def renders(self) -> int:
+        return self.__renders
+
+    @property
+    def coalesced(self) -> int:
+        return self.__coalesced
+
+    def mark_dirty(self, cells: Optional[dict[tuple[int, int], bool]] = None) -> None:
+        if cells is None:
+            self.__full = True
+            self.__cells.clear()
+        elif not self.__full:
+            self.__cells.update(cells)
+        if self.__pending:
+            self.__merged += 1
+            self.__coalesced += 1
+            return
+        self.__pending = True
+        wait = 0.0 if self.__last is None else self.__last + self.__frame - self.__clock()
+        if wait > 0:
+            # trop tôt après le rendu précédent : attendre l'image suivante
+            self.__window.after(max(1, round(wait * 1000)), lambda: self.__window.after_idle(self.flush))
+        else:
+            self.__window.after_idle(self.flush)
+
+    def flush(self) -> None:
+        """Rendu en attente (rappel after_idle) ; rien s'il n'y en a pas."""
+        if not self.__pending:
+            return
+        cells = None if self.__full else self.__cells
+        merged = self.__merged
+        self.__pending, self.__full, self.__cells, self.__merged = False, False, {}, 0
+        self.__last = self.__clock()
+        self.__renders += 1
+        self.__render(cells, merged)
 
 
 class LiveCanvas:
@@ -35,6 +108,10 @@ class LiveCanvas:
 
         self.__canvas.bind("<Button-1>", self.__on_left_click)
         self.__canvas.bind("<Button-3>", self.__on_right_click)
+        self.__canvas.bind("<B1-Motion>", self.__on_drag)
+        self.__canvas.bind("<B3-Motion>", self.__on_drag)
+        self.__canvas.bind("<ButtonRelease-1>", self.__on_release)
+        self.__canvas.bind("<ButtonRelease-3>", self.__on_release)
 
     # Iterator (consigne 4)
     def __iter__(self) -> Iterator[tuple[int, int]]:
@@ -46,11 +123,23 @@ class LiveCanvas:
 
     def __on_left_click(self, event) -> None:
         row, col = self.xy_to_rc(event.x, event.y)
-        self.__controller.gui_toggle_cell(row, col)
+        self.__controller.gui_paint_start(row, col, 1)
 
     def __on_right_click(self, event) -> None:
         row, col = self.xy_to_rc(event.x, event.y)
-        self.__controller.gui_set_dead(row, col)
+        self.__controller.gui_paint_start(row, col, 3)
+
+    def __on_drag(self, event) -> None:
+        row, col = self.xy_to_rc(event.x, event.y)
+        self.__controller.gui_paint_move(row, col)
+
+    def __on_release(self, _event) -> None:
+        self.__controller.gui_paint_end()
+
+    def resize(self, rows: int, cols: int) -> None:
+        self.__width_px = cols * self.__cell_px
+        self.__height_px = rows * self.__cell_px
+        self.__canvas.config(width=self.__width_px, height=self.__height_px)
 
     def xy_to_rc(self, x: int, y: int) -> tuple[int, int]:
         col = x // self.__cell_px
@@ -75,12 +164,19 @@ class LiveCanvas:
         x2 = x1 + self.__cell_px
         y2 = y1 + self.__cell_px
         color = "black" if alive else "white"
-        self.__canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="")
+        self.__canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="", tags=f"r{row}c{col}")
+
+    def draw_cells(self, cells: list[tuple[int, int]], alive: bool) -> None:
+        """Dessin incrémental : vivantes -> un carré noir, mortes -> on efface le carré."""
+        for r, c in cells:
+            self.__canvas.delete(f"r{r}c{c}")
+            if alive:
+                self.draw_cell(r, c, True)
 
-    def render(self, rows: int, cols: int, alive_cells: list[tuple[int, int]]) -> None:
+    def render(self, state: GridState) -> None:
         self.clear()
-        self.draw_grid(rows, cols)
-        for r, c in alive_cells:
+        self.draw_grid(state.rows, state.cols)
+        for r, c in state.alive_cells():
             self.draw_cell(r, c, True)
 
 
@@ -133,6 +229,12 @@ class LiveView:
         self.__window.title("Game of Life (Q54)")
         self.__window.resizable(False, False)
 
+        # rendus regroupés : au plus un par image
+        self.__scheduler = RenderScheduler(self.__window, self.__render)
+        self.__state: Optional[GridState] = None
+        self.__generation = 0
+        self.__alive_count = 0
+
         self.__main_frame = Frame(self.__window)
         self.__main_frame.pack(fill=BOTH, expand=True, padx=10, pady=10)
 
@@ -157,23 +259,47 @@ class LiveView:
         self.__alive_label = Label(info_frame, text="Cellules vivantes: 0")
         self.__alive_label.pack(side=LEFT, padx=20)
 
-        instructions = Label(info_frame, text="Clic gauche: toggle • Clic droit: tuer")
+        instructions = Label(info_frame, text="Clic gauche: toggle • Clic droit: tuer (glisser pour dessiner)")
         instructions.pack(side=RIGHT, padx=20)
 
-    def render(self, rows: int, cols: int, alive_cells: list[tuple[int, int]], generation: int = 0, alive_count: int = 0) -> None:
+    @property
+    def scheduler(self) -> RenderScheduler:
+        return self.__scheduler
+
+    def render(self, state: GridState, alive_count: int = 0) -> None:
         """
         API MVC :
         Controller -> View : affiche ce qu'on lui donne.
+        state : vue de l'état sans copie (dimensions, cellules, génération).
+        Le dessin est fait au prochain moment libre (regroupé avec les autres demandes).
         """
-        self.__canvas.render(rows, cols, alive_cells)
+        self.__state = state
+        self.__generation, self.__alive_count = state.generation, alive_count
+        self.__scheduler.mark_dirty()
+
+    def draw_cells(self, cells: list[tuple[int, int]], alive: bool, generation: int = 0, alive_count: int = 0) -> None:
+        """
+        API MVC (incrémental) :
+        seulement les cellules modifiées, sans tout effacer ni redessiner.
+        """
+        self.__generation, self.__alive_count = generation, alive_count
+        self.__scheduler.mark_dirty({cell: alive for cell in cells})
+
+    def __render(self, cells: Optional[dict[tuple[int, int], bool]], _coalesced: int) -> None:
+        if cells is None:
+            self.__canvas.render(self.__state)
+        else:
+            self.__canvas.draw_cells([cell for cell, alive in cells.items() if alive], True)
+            self.__canvas.draw_cells([cell for cell, alive in cells.items() if not alive], False)
 
         # update info bar
         if self.__generation_label is not None:
-            self.__generation_label.config(text=f"Génération: {generation}")
+            self.__generation_label.config(text=f"Génération: {self.__generation}")
         if self.__alive_label is not None:
-            self.__alive_label.config(text=f"Cellules vivantes: {alive_count}")
+            self.__alive_label.config(text=f"Cellules vivantes: {self.__alive_count}")
 
-        self.__window.update()
+    def resize(self, rows: int, cols: int) -> None:
+        self.__canvas.resize(rows, cols)
 
     def after(self, delay_ms: int, callback) -> None:
         self.__window.after(delay_ms, callback)
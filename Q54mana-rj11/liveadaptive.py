@@ -0,0 +1,220 @@
+"""
+Module liveadaptive.py
+Choix automatique du moteur de calcul selon la densité de la grille
+
+Deux moteurs pour la même grille (tore) :
+- dense : le noyau de LiveModel, qui traite le rectangle des vivantes
+  agrandi d'une cellule (coût proportionnel à son aire)
+- creux : l'ensemble des index vivants et le nb de voisins de chaque
+  cellule, tenus à jour ; on ne réévalue que les cellules qui ont changé à
+  la génération précédente et leurs voisines (coût proportionnel à
+  l'activité, environ 20 fois plus cher par cellule qui change que le dense
+  par cellule calculée). Les cellules stables (blocs...) ne coûtent rien
+
+Une soupe est dense au départ puis se vide : AdaptiveLiveModel mesure la
+population et l'activité toutes les sample_every générations, prévoit
+l'activité de la période suivante (tendance) et bascule quand l'autre moteur
+sera nettement plus rapide. La marge (hysteresis) évite de rebasculer à
+chaque mesure autour du seuil. Chaque bascule est notée dans switches avec
+sa raison.
+
+    model = AdaptiveLiveModel(500, 500, 1, log=print)
+    model.apply_strategy()
+    for _ in range(1000):
+        model.next_generation()
+    print(model.mode, model.switches)
+"""
+
+import re
+from collections import Counter, deque, namedtuple
+from itertools import chain
+
+from livemodel import LiveModel, CONWAY_RULE
+
+DENSE = "dense"
+SPARSE = "creux"
+
+# Coût relatif par cellule : cellule du rectangle calculé (dense), cellule qui change (creux)
+DENSE_COST = 1.0
+SPARSE_COST = 20.0
+
+_ALIVE = re.compile(b"\x01")
+
+# Bascule notée dans le journal (density = population / nb de cellules,
+# activity = part des cellules qui ont changé à la dernière génération)
+Switch = namedtuple("Switch", "generation old new population density activity reason")
+
+
+class AdaptiveLiveModel(LiveModel):
+    """
+    LiveModel qui passe du moteur dense au moteur creux (et inversement)
+    selon la population et l'activité mesurées
+    """
+
+    # Nb de bascules gardées dans le journal
+    SWITCH_LOG_SIZE = 64
+
+    def __init__(self, canvas_width: int, canvas_height: int, cell_size: int,
+                 rule: str = CONWAY_RULE, sample_every: int = 16, margin: float = 0.25, log=None):
+        """
+        :param sample_every: nb de générations entre deux mesures
+        :param margin: marge relative sur les coûts avant de basculer (hysteresis)
+        :param log: fonction appelée avec le texte de chaque bascule (print...)
+        """
+        if sample_every <= 0:
+            raise ValueError("sample_every doit être positif")
+        self._alive = None          # index vivants (moteur creux), None = à relire dans le buffer
+        self._counts = None         # nb de voisins vivants par index (moteur creux, avec _alive)
+        self._flipped = None        # index qui ont changé à la dernière génération (moteur creux)
+        super().__init__(canvas_width, canvas_height, cell_size, rule)
+        self._mode = DENSE
+        self._sample_every = sample_every
+        self._margin = margin
+        self._log = log
+        self._last_changed = None
+        self._switches = deque(maxlen=self.SWITCH_LOG_SIZE)
+
+    @property
+    def mode(self):
+        """Moteur en cours : DENSE ou SPARSE"""
+        return self._mode
+
+    @property
+    def switches(self):
+        """Bascules récentes (Switch), de la plus ancienne à la plus récente"""
+        return list(self._switches)
+
+    def _writable(self) -> bytearray:
+        cells = super()._writable()
+        self._alive = None          # l'appelant va écrire dans le buffer
+        return cells
+
+    def set_rule(self, rule: str):
+        super().set_rule(rule)
+        if self._mode == SPARSE and not self._sparse_allowed():
+            self._switch(DENSE, self.count_alive_cells(), 0.0, "règle B0 : le moteur creux ne s'applique pas")
+
+    def resize(self, width: int, height: int, anchor: str = "topleft"):
+        super().resize(width, height, anchor)
+        self._alive = None
+        self._last_changed = None
+
+    def count_alive_cells(self) -> int:
+        if self._alive is not None:
+            return len(self._alive)
+        return super().count_alive_cells()
+
+    def _sparse_allowed(self) -> bool:
+        # B0 : des cellules mortes sans voisin naissent, le moteur creux ne les voit pas
+        return not self._rule_table[0]
+
+    # ------------------------------------------------------------------
+    # Génération
+    # ------------------------------------------------------------------
+
+    def next_generation(self):
+        super().next_generation()
+        if self._generation % self._sample_every == 0:
+            self._sample()
+
+    def _compute_generation(self, old_cells, t):
+        if self._mode == DENSE:
+            self._alive = None
+            return super()._compute_generation(old_cells, t)
+
+        profiler = self._profiler
+        width = self._matrix_width
+        total = len(old_cells)
+
+        def neighbours(index):
+            x = index % width
+            row = index - x
+            left, right = (x - 1) % width, (x + 1) % width
+            above, below = (row - width) % total, (row + width) % total
+            return (above + left, above + x, above + right, row + left, row + right,
+                    below + left, below + x, below + right)
+
+        # 1. Cellules à réévaluer : toutes celles qui ont un voisin vivant après
+        #    une écriture ou une bascule, sinon celles qui ont changé à la
+        #    génération précédente et leurs voisines (les autres ne changent pas)
+        alive = self._alive
+        if alive is None:
+            alive = {match.start() for match in _ALIVE.finditer(old_cells)}
+            counts = Counter(chain.from_iterable(map(neighbours, alive)))
+            candidates = alive.union(counts)
+        else:
+            counts = self._counts
+            flipped = self._flipped
+            candidates = flipped.union(chain.from_iterable(map(neighbours, flipped)))
+        if profiler is not None:
+            t = profiler.mark("candidates", t)
+
+        # 2. Règles (même table que le moteur dense : clé = voisins + 9 * état),
+        #    puis mise à jour des nb de voisins autour des cellules qui changent
+        table = self._rule_table
+        born = [index for index in candidates if index not in alive and table[counts[index]]]
+        died = [index for index in candidates if index in alive and not table[counts[index] + 9]]
+        keys = {index: counts[index] + 9 * old_cells[index] for index in self._cell_objects}
+        new_cells = self._take_buffer()
+        new_cells[:] = old_cells
+        for index in born:
+            new_cells[index] = 1
+        for index in died:
+            new_cells[index] = 0
+        alive.difference_update(died)
+        alive.update(born)
+        counts.update(chain.from_iterable(map(neighbours, born)))
+        counts.subtract(chain.from_iterable(map(neighbours, died)))
+        self._alive, self._counts = alive, counts
+        self._flipped = set(born).union(died)
+        self._next_flips = born + died          # changed_since sans relire la grille
+        if profiler is not None:
+            t = profiler.mark("rules", t)
+        return new_cells, keys, t
+
+    # ------------------------------------------------------------------
+    # Mesure et bascule
+    # ------------------------------------------------------------------
+
+    def _sample(self):
+        """Population, activité et tendance : bascule si l'autre moteur sera nettement plus rapide"""
+        total = self._matrix_width * self._matrix_height
+        population = self.count_alive_cells()
+        changed = self.changed_since(self._generation - 1)
+        changed = len(changed) if changed is not None else total
+        activity = changed / total
+        # nb de cellules qui changeront par génération à la période suivante
+        # (tendance de la dernière période) : c'est le coût du moteur creux
+        previous = self._last_changed if self._last_changed is not None else changed
+        predicted = max(0, 2 * changed - previous)
+        self._last_changed = changed
+
+        # le moteur dense ne calcule que le rectangle des vivantes agrandi d'une cellule
+        region = self._step_region()
+        area = (region[2] - region[0]) * (region[3] - region[1]) if region is not None else 0
+        dense_cost = area * DENSE_COST
+        sparse_cost = predicted * SPARSE_COST
+        if self._mode == DENSE:
+            if self._sparse_allowed() and sparse_cost < dense_cost * (1 - self._margin):
+                self._switch(SPARSE, population, activity,
+                             f"activité prévue {predicted} cellules : coût creux {sparse_cost:.0f} "
+                             f"< coût dense {dense_cost:.0f} - {self._margin:.0%}")
+        elif sparse_cost > dense_cost * (1 + self._margin):
+            self._switch(DENSE, population, activity,
+                         f"activité prévue {predicted} cellules : coût creux {sparse_cost:.0f} "
+                         f"> coût dense {dense_cost:.0f} + {self._margin:.0%}")
+
+    def _switch(self, mode: str, population: int, activity: float, reason: str):
+        """Change de moteur ; l'état (buffer) est commun, l'ensemble creux est relu à la demande"""
+        switch = Switch(self._generation, self._mode, mode, population,
+                        population / (self._matrix_width * self._matrix_height), activity, reason)
+        self._mode = mode
+        if mode == DENSE:
+            self._alive = None
+        self._switches.append(switch)
+        if self._log is not None:
+            self._log(f"Génération {switch.generation} : moteur {switch.old} -> {switch.new} "
+                      f"(densité {switch.density:.2%}, activité {switch.activity:.2%}) : {reason}")
+
+    def __str__(self):
+        return f"AdaptiveLiveModel({self._matrix_width}x{self._matrix_height}, {self._mode}, gen={self._generation})"
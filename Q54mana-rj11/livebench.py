@@ -0,0 +1,422 @@
+"""
+Module livebench.py
+Banc d'essai (benchmark) des différents moteurs du Jeu de la Vie
+
+Chaque moteur est lancé sans interface graphique sur des charges standard
+(vide, soupe aléatoire 25%, canon à planeurs, R-pentomino) et pour plusieurs
+tailles de grille. On mesure :
+- le temps par génération
+- le nombre de cellules traitées par seconde
+- la mémoire maximale (tracemalloc)
+
+Les résultats sont écrits en JSON (clés triées) pour pouvoir être comparés
+d'un commit à l'autre :
+    python livebench.py --sizes 50,128 --out bench.json
+    python livebench.py --compare avant.json apres.json
+"""
+
+import argparse
+import ast
+import importlib.util
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from abc import ABC, abstractmethod
+
+from livebits import BitLiveModel
+from livemodel import LiveModel, CANON_POSITIONS
+from livecontroller import LiveController
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+
+DEFAULT_SIZES = [50, 128, 256, 512, 1024, 2048, 4096]
+
+
+# ============================================================================
+# Charges de travail : chaque fonction renvoie la liste des (x, y) vivantes
+# ============================================================================
+
+
+def workload_empty(width, height, seed):
+    """Grille vide"""
+    return []
+
+
+def workload_soup(width, height, seed):
+    """Soupe aléatoire à 25% (reproductible grâce à la graine)"""
+    rng = random.Random(seed)
+    total = width * height
+    return [(i % width, i // width) for i in rng.sample(range(total), total // 4)]
+
+
+def workload_canon(width, height, seed):
+    """Canon à planeurs de Gosper (mêmes positions que CanonStrategy)"""
+    return [(x, y) for x, y in CANON_POSITIONS if x < width and y < height]
+
+
+def workload_rpentomino(width, height, seed):
+    """R-pentomino centré"""
+    cx, cy = width // 2, height // 2
+    return [(cx + dx, cy + dy) for dx, dy in ((1, 0), (2, 0), (0, 1), (1, 1), (1, 2))]
+
+
+WORKLOADS = {
+    "empty": workload_empty,
+    "soup25": workload_soup,
+    "glider_gun": workload_canon,
+    "r_pentomino": workload_rpentomino,
+}
+
+# Charges où peu de cellules vivent : les moteurs qui ne calculent que le
+# rectangle des vivantes les traitent sur de bien plus grandes grilles
+SPARSE_WORKLOADS = ("empty", "glider_gun", "r_pentomino")
+
+
+# ============================================================================
+# Adaptateurs de moteurs
+# ============================================================================
+
+
+def _load_module(name, path):
+    """Charge un module d'un autre dossier sous un nom unique"""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module     # nécessaire pour les dataclasses
+    spec.loader.exec_module(module)
+    return module
+
+
+class BenchEngine(ABC):
+    """Interface commune d'un moteur mesuré par le banc d'essai"""
+
+    name = ""
+    max_cells = 512 * 512   # au-delà, la mesure est ignorée (trop lente)
+    max_sparse_cells = None     # limite pour SPARSE_WORKLOADS (None = max_cells)
+
+    @classmethod
+    def cell_limit(cls, workload):
+        """Nb de cellules au-delà duquel la charge est ignorée pour ce moteur"""
+        if workload in SPARSE_WORKLOADS and cls.max_sparse_cells is not None:
+            return cls.max_sparse_cells
+        return cls.max_cells
+
+    @abstractmethod
+    def setup(self, width, height, alive):
+        """Crée la grille et place les cellules vivantes"""
+        pass
+
+    @abstractmethod
+    def step(self):
+        """Calcule une génération"""
+        pass
+
+    @abstractmethod
+    def population(self):
+        """Nombre de cellules vivantes"""
+        pass
+
+
+class ModelEngine(BenchEngine):
+    """LiveModel.next_generation (Q54mana-rj11)"""
+
+    name = "mana_model"
+    max_cells = 2048 * 2048
+    max_sparse_cells = 4096 * 4096     # seul le rectangle des vivantes est calculé
+
+    def setup(self, width, height, alive):
+        self._model = LiveModel(width, height, 1)
+        state = bytearray(width * height)
+        for x, y in alive:
+            state[y * width + x] = 1
+        self._model.load_state(state)
+
+    def step(self):
+        self._model.next_generation()
+
+    def population(self):
+        return self._model.count_alive_cells()
+
+
+class BitModelEngine(ModelEngine):
+    """BitLiveModel.next_generation : grille entière dans un seul entier (Q54mana-rj11)"""
+
+    name = "mana_bits"
+    max_cells = 4096 * 4096
+
+    def setup(self, width, height, alive):
+        self._model = BitLiveModel(width, height, 1)
+        state = bytearray(width * height)
+        for x, y in alive:
+            state[y * width + x] = 1
+        self._model.load_state(state)
+
+
+class ControllerEngine(BenchEngine):
+    """_count_neighbours + _apply_conway_rules du LiveController (Q54mana-rj11)"""
+
+    name = "mana_controller"
+
+    def setup(self, width, height, alive):
+        self._model = LiveModel(width, height, 1)
+        self._controller = LiveController(model=self._model)
+        for x, y in alive:
+            self._model.get_cell(x, y).set_alive(True)
+
+    def step(self):
+        self._controller._count_neighbours()
+        self._controller._apply_conway_rules()
+
+    def population(self):
+        return self._model.count_alive_cells()
+
+
+class GridEngine(BenchEngine):
+    """Grid.step (Q54fusion / Q54bis), coordonnées (ligne, colonne)"""
+
+    folder = ""
+    step_engine = ""    # classe StepEngine du module ("" = moteur par défaut de Grid)
+
+    def __init__(self):
+        path = os.path.join(ROOT, self.folder, "livemodel.py")
+        self._module = _load_module(f"{self.folder.lower()}_livemodel", path)
+
+    def setup(self, width, height, alive):
+        engine = getattr(self._module, self.step_engine)() if self.step_engine else None
+        self._grid = self._module.Grid(height, width, engine)
+        for x, y in alive:
+            self._grid.set_alive(y, x, True)
+
+    def step(self):
+        self._grid.step()
+
+    def population(self):
+        return sum(1 for _r, _c, cell in self._grid if cell.alive)
+
+
+class FusionGridEngine(GridEngine):
+    name = "fusion_grid"
+    folder = "Q54fusion"
+
+
+class BisGridEngine(GridEngine):
+    name = "bis_grid"
+    folder = "Q54bis"
+
+
+class FusionBlockEngine(FusionGridEngine):
+    """Grid.step de Q54fusion avec BlockStepEngine (table 4x4 -> 2x2)"""
+
+    name = "fusion_block"
+    step_engine = "BlockStepEngine"
+    max_cells = 1024 * 1024
+
+
+class BisBlockEngine(BisGridEngine):
+    """Grid.step de Q54bis avec BlockStepEngine (table 4x4 -> 2x2)"""
+
+    name = "bis_block"
+    step_engine = "BlockStepEngine"
+    max_cells = 1024 * 1024
+
+
+class _NullCanvas:
+    """Remplace le Canvas / la fenêtre Tk : toutes les méthodes ne font rien"""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class ProceduralEngine(BenchEngine):
+    """play() de GameOfLife_procedural.py, exécutée sans fenêtre Tk"""
+
+    name = "procedural"
+    FUNCTIONS = ("damier", "ligne_vert", "ligne_hor", "play", "redessiner")
+
+    def __init__(self):
+        # On n'exécute que les fonctions : le script crée une fenêtre au chargement
+        path = os.path.join(HERE, "GameOfLife_procedural.py")
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), path)
+        tree.body = [node for node in tree.body
+                     if isinstance(node, ast.FunctionDef) and node.name in self.FUNCTIONS]
+        self._code = compile(tree, path, "exec")
+
+    def setup(self, width, height, alive):
+        dico_case = {(x, y): 0 for x in range(width) for y in range(height)}
+        for x, y in alive:
+            dico_case[x, y] = 1
+        self._ns = {
+            "width": width, "height": height, "c": 1,
+            "flag": 0, "vitesse": 0, "ALL": "all",
+            "dico_case": dico_case, "dico_etat": {},
+            "can1": _NullCanvas(), "fen1": _NullCanvas(),
+        }
+        exec(self._code, self._ns)
+
+    def step(self):
+        self._ns["play"]()
+
+    def population(self):
+        return sum(self._ns["dico_case"].values())
+
+
+ENGINES = {
+    engine.name: engine
+    for engine in (ModelEngine, BitModelEngine, ControllerEngine, FusionGridEngine, BisGridEngine,
+                   FusionBlockEngine, BisBlockEngine, ProceduralEngine)
+}
+
+
+# ============================================================================
+# Mesures
+# ============================================================================
+
+
+def run_case(engine_cls, workload, size, generations=5, seed=0, max_cells=None):
+    """Mesure un moteur sur une charge et une taille, renvoie un dict"""
+    limit = engine_cls.cell_limit(workload) if max_cells is None else max_cells
+    result = {"engine": engine_cls.name, "workload": workload,
+              "width": size, "height": size, "generations": generations}
+    if size * size > limit:
+        result["skipped"] = f"plus de {limit} cellules"
+        return result
+
+    alive = WORKLOADS[workload](size, size, seed)
+
+    # 1. Mémoire maximale (création + une génération), mesure séparée
+    tracemalloc.start()
+    try:
+        engine = engine_cls()
+        engine.setup(size, size, alive)
+        engine.step()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    # 2. Temps (sans tracemalloc qui ralentit tout)
+    engine = engine_cls()
+    engine.setup(size, size, alive)
+    start = time.perf_counter()
+    for _ in range(generations):
+        engine.step()
+    elapsed = time.perf_counter() - start
+
+    per_generation = elapsed / generations if generations else 0.0
+    result.update({
+        "seconds_per_generation": round(per_generation, 6),
+        "cells_per_second": round(size * size / per_generation) if per_generation else None,
+        "peak_memory_bytes": peak,
+        "final_population": engine.population(),
+    })
+    return result
+
+
+def run_suite(engines=None, workloads=None, sizes=None, generations=5, seed=0,
+              max_cells=None, verbose=False):
+    """Lance toutes les combinaisons moteur x charge x taille"""
+    results = []
+    for name in engines or ENGINES:
+        for workload in workloads or WORKLOADS:
+            for size in sizes or DEFAULT_SIZES:
+                result = run_case(ENGINES[name], workload, size, generations, seed, max_cells)
+                if verbose:
+                    print(_format_result(result))
+                results.append(result)
+    return {"meta": _metadata(generations, seed), "results": results}
+
+
+def _metadata(generations, seed):
+    """Informations sur la machine et le commit"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE,
+                                capture_output=True, text=True, timeout=5).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ""
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "generations": generations,
+        "seed": seed,
+    }
+
+
+def _format_result(result):
+    """Une ligne lisible pour la console"""
+    key = f"{result['engine']:<16} {result['workload']:<12} {result['width']:>5}x{result['height']:<5}"
+    if "skipped" in result:
+        return f"{key} ignoré ({result['skipped']})"
+    return (f"{key} {result['seconds_per_generation'] * 1000:10.2f} ms/gen "
+            f"{result['cells_per_second']:>12} cells/s {result['peak_memory_bytes'] / 1e6:8.2f} Mo")
+
+
+def save_results(report, path):
+    """Écrit le rapport JSON (clés triées, indentation fixe => diff lisible)"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare_results(old, new):
+    """
+    Compare deux rapports : renvoie une liste de
+    (engine, workload, taille, ancien s/gen, nouveau s/gen, accélération)
+    """
+    def index(report):
+        return {(r["engine"], r["workload"], r["width"], r["height"]): r
+                for r in report["results"] if "skipped" not in r}
+
+    before, after = index(old), index(new)
+    rows = []
+    for key in sorted(before.keys() & after.keys()):
+        t_old = before[key]["seconds_per_generation"]
+        t_new = after[key]["seconds_per_generation"]
+        speedup = t_old / t_new if t_new else float("inf")
+        rows.append((key[0], key[1], f"{key[2]}x{key[3]}", t_old, t_new, speedup))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark des moteurs du Jeu de la Vie")
+    parser.add_argument("--engines", default=",".join(ENGINES))
+    parser.add_argument("--workloads", default=",".join(WORKLOADS))
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)))
+    parser.add_argument("--generations", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-cells", type=int, default=None,
+                        help="ignore les grilles plus grandes (défaut : limite propre à chaque moteur et charge)")
+    parser.add_argument("--out", default="bench_output.json")
+    parser.add_argument("--compare", nargs=2, metavar=("AVANT", "APRES"))
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0], encoding="utf-8") as f:
+            old = json.load(f)
+        with open(args.compare[1], encoding="utf-8") as f:
+            new = json.load(f)
+        for engine, workload, size, t_old, t_new, speedup in compare_results(old, new):
+            print(f"{engine:<16} {workload:<12} {size:>11} {t_old * 1000:10.2f} -> "
+                  f"{t_new * 1000:10.2f} ms/gen  x{speedup:.2f}")
+        return
+
+    report = run_suite(
+        engines=args.engines.split(","),
+        workloads=args.workloads.split(","),
+        sizes=[int(s) for s in args.sizes.split(",")],
+        generations=args.generations,
+        seed=args.seed,
+        max_cells=args.max_cells,
+        verbose=True,
+    )
+    save_results(report, args.out)
+    print(f"\nRésultats écrits dans {args.out}")
+
+
+if __name__ == "__main__":
+    main()
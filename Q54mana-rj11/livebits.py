@@ -0,0 +1,339 @@
+"""
+Module livebits.py
+Moteur bit-parallèle : toute la grille dans un seul entier Python
+
+Un int Python est un vecteur de bits de taille quelconque : bit
+y * largeur + x = cellule (x, y) vivante. Une génération se calcule pour
+toutes les cellules à la fois :
+1. huit copies décalées de la grille (une par direction de voisin) ; des
+   masques de colonnes / lignes coupent ce qui dépasse d'un bord, et pour
+   le tore on y recolle ce qui sort de l'autre côté
+2. un arbre d'additionneurs (demi et pleins additionneurs bit à bit)
+   donne le nombre de voisins de chaque cellule sur 4 bits
+3. la règle (B3/S23 ou autre) devient une formule booléenne sur ces 4 bits
+
+Chaque opération traite des millions de cellules en C (arithmétique des
+grands entiers) : une grille 2048x2048 avance en quelques dizaines de
+millisecondes, contre plusieurs secondes pour la boucle cellule par cellule.
+
+BitLiveModel est un LiveModel qui utilise ce moteur. La conversion entre
+l'entier et le buffer d'octets (get_cell, vues, clics...) est paresseuse :
+tant que personne ne lit les cellules, les générations restent en entier.
+
+    python livebits.py --sizes 256,1024,2048 --generations 5
+"""
+
+import argparse
+import time
+
+from livedelta import changed_indices
+from livemodel import LiveModel, CONWAY_RULE, parse_rule
+
+# octet 0/1 <-> chiffre ASCII "0"/"1" : conversions faites en C
+_TO_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_FROM_DIGITS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def pack_bits(state) -> int:
+    """État (1 octet par cellule, index y * largeur + x) -> entier (bit index = cellule)"""
+    if not len(state):
+        return 0
+    return int(bytes(state)[::-1].translate(_TO_DIGITS), 2)
+
+
+def unpack_bits(bits: int, total: int, out: bytearray = None) -> bytearray:
+    """
+    Inverse de pack_bits : entier -> état de total cellules
+    :param out: buffer de total octets à remplir (réutilisé), sinon un nouveau
+    """
+    if out is None:
+        out = bytearray(total)
+    if total:
+        out[:] = format(bits, f"0{total}b")[::-1].encode().translate(_FROM_DIGITS)
+    return out
+
+
+def _full_adder(a, b, c):
+    """Somme et retenue de trois vecteurs de bits"""
+    partial = a ^ b
+    return partial ^ c, (a & b) | (partial & c)
+
+
+class BitEngine:
+    """
+    Calcul d'une génération sur une grille entière codée en un seul entier
+    Les masques ne dépendent que de la taille : ils sont calculés une fois
+    """
+
+    def __init__(self, width: int, height: int, rule: str = CONWAY_RULE, wrap: bool = True):
+        """
+        :param wrap: True = tore (les bords se rejoignent), False = bords fermés
+                     (tout ce qui est hors de la grille est mort)
+        """
+        if width <= 0 or height <= 0:
+            raise ValueError("La grille doit avoir au moins une cellule")
+        self._width = width
+        self._height = height
+        self._wrap = wrap
+        self._total = width * height
+        self._all = (1 << self._total) - 1
+        row = (1 << width) - 1
+        # masque d'une colonne (x = 0 ou x = width - 1) sur toutes les lignes
+        first_column = int(("0" * (width - 1) + "1") * height, 2)
+        self._first_column = first_column
+        self._last_column = first_column << (width - 1)
+        self._first_row = row
+        self._last_row = row << (width * (height - 1))
+        self.set_rule(rule)
+
+    @property
+    def width(self):
+        return self._width
+
+    @property
+    def height(self):
+        return self._height
+
+    @property
+    def wrap(self):
+        return self._wrap
+
+    def set_rule(self, rule: str):
+        self._born, self._survive = parse_rule(rule)
+
+    def _west(self, bits):
+        """bit (x, y) = cellule (x - 1, y)"""
+        shifted = (bits << 1) & ~self._first_column & self._all
+        if self._wrap:
+            shifted |= (bits & self._last_column) >> (self._width - 1)
+        return shifted
+
+    def _east(self, bits):
+        """bit (x, y) = cellule (x + 1, y)"""
+        shifted = (bits >> 1) & ~self._last_column
+        if self._wrap:
+            shifted |= (bits & self._first_column) << (self._width - 1)
+        return shifted
+
+    def _north(self, bits):
+        """bit (x, y) = cellule (x, y - 1)"""
+        shifted = (bits << self._width) & self._all
+        if self._wrap:
+            shifted |= bits >> (self._width * (self._height - 1))
+        return shifted
+
+    def _south(self, bits):
+        """bit (x, y) = cellule (x, y + 1)"""
+        shifted = bits >> self._width
+        if self._wrap:
+            shifted |= (bits & self._first_row) << (self._width * (self._height - 1))
+        return shifted
+
+    def step(self, bits: int) -> int:
+        """Génération suivante de la grille codée dans bits"""
+        west, east = self._west(bits), self._east(bits)
+        above, below = self._north(bits), self._south(bits)
+        neighbours = (west, east, above, below,
+                      self._west(above), self._east(above), self._west(below), self._east(below))
+
+        # nb de voisins sur 4 bits (c0 + 2 c1 + 4 c2 + 8 c3) par un arbre d'additionneurs
+        s1, k1 = _full_adder(*neighbours[0:3])
+        s2, k2 = _full_adder(*neighbours[3:6])
+        s3, k3 = neighbours[6] ^ neighbours[7], neighbours[6] & neighbours[7]
+        c0, k4 = _full_adder(s1, s2, s3)
+        t, k5 = _full_adder(k1, k2, k3)                 # retenues de poids 2
+        c1, k6 = t ^ k4, t & k4
+        c2, c3 = k5 ^ k6, k5 & k6                       # retenues de poids 4
+
+        full = self._all
+        digits = [(c0, c0 ^ full), (c1, c1 ^ full), (c2, c2 ^ full), (c3, c3 ^ full)]
+
+        def count_is(n):
+            # bits dont le nb de voisins vaut n (n = 0..8)
+            result = full
+            for bit, (one, zero) in enumerate(digits):
+                result &= one if (n >> bit) & 1 else zero
+            return result
+
+        born = 0
+        for n in self._born:
+            born |= count_is(n)
+        survive = 0
+        for n in self._survive:
+            survive |= count_is(n)
+        return (born & ~bits & full) | (survive & bits)
+
+
+class BitLiveModel(LiveModel):
+    """
+    LiveModel dont les générations sont calculées par BitEngine
+    - l'état vit dans un entier (_bits) et/ou dans le buffer d'octets
+      habituel ; chacun n'est reconstruit qu'au moment où on le lit
+    - sans objets LiveCell, historique ni observers des générations,
+      next_generation ne touche que l'entier (aucune conversion) ;
+      sinon on passe par le chemin normal de LiveModel
+    - wrap=False : bords fermés au lieu du tore
+    """
+
+    def __init__(self, canvas_width: int, canvas_height: int, cell_size: int,
+                 rule: str = CONWAY_RULE, wrap: bool = True):
+        self._bits = 0
+        self._buffer = None
+        super().__init__(canvas_width, canvas_height, cell_size, rule)
+        self._engine = BitEngine(self._matrix_width, self._matrix_height, rule, wrap)
+
+    # Buffer d'octets reconstruit à la demande depuis l'entier
+    @property
+    def _cells(self):
+        if self._buffer is None:
+            self._buffer = unpack_bits(self._bits, self._matrix_width * self._matrix_height)
+        return self._buffer
+
+    @_cells.setter
+    def _cells(self, value):
+        self._buffer = value
+        self._bits = None           # l'entier sera recalculé depuis le buffer
+
+    def _writable(self) -> bytearray:
+        cells = super()._writable()
+        self._bits = None           # l'appelant va écrire dans le buffer
+        return cells
+
+    @property
+    def engine(self):
+        return self._engine
+
+    def set_rule(self, rule: str):
+        super().set_rule(rule)
+        self._engine.set_rule(rule)
+
+    def resize(self, width: int, height: int, anchor: str = "topleft"):
+        super().resize(width, height, anchor)
+        if (width, height) != (self._engine.width, self._engine.height):
+            self._engine = BitEngine(width, height, self._rule, self._engine.wrap)
+            self._marks.clear()     # les entiers gardés n'ont plus la bonne taille
+
+    def get_bits(self) -> int:
+        """État en un seul entier (bit y * largeur + x)"""
+        if self._bits is None:
+            self._bits = pack_bits(self._buffer)
+        return self._bits
+
+    def count_alive_cells(self) -> int:
+        if self._bits is not None:
+            return self._bits.bit_count()
+        return self._buffer.count(1)
+
+    def changed_since(self, generation: int):
+        # les générations du chemin rapide sont gardées en entier : XOR direct
+        for marked, state in self._marks:
+            if marked == generation and isinstance(state, int) and generation != self._generation:
+                total = self._matrix_width * self._matrix_height
+                return changed_indices(bytes(total), unpack_bits(state ^ self.get_bits(), total))
+        return super().changed_since(generation)
+
+    def next_generation(self):
+        if (self._cell_objects or self._history is not None or self._generation_observers
+                or self._profiler is not None):
+            super().next_generation()
+            return
+        # chemin rapide : tout reste en entier (l'ancien buffer, s'il existe,
+        # ou l'ancien entier sert de repère à changed_since)
+        old_bits = self.get_bits()
+        old = self._buffer if self._buffer is not None else old_bits
+        self._buffer = None
+        self._bits = self._engine.step(old_bits)
+        self._shared = False
+        self._marks.append((self._generation, old))
+        self._forget_box()
+        self._generation += 1
+        if self._counter:
+            self._counter.count_all(self)
+
+    def _compute_generation(self, old_cells, t):
+        new_bits = self._engine.step(self.get_bits())
+        if self._profiler is not None:
+            t = self._profiler.mark("kernel", t)
+        new_cells = unpack_bits(new_bits, len(old_cells), self._take_buffer())
+        # clés (voisins + 9 * état) seulement pour les objets LiveCell
+        width, height = self._matrix_width, self._matrix_height
+        keys = {}
+        for index in self._cell_objects:
+            x, y = index % width, index // width
+            count = 0
+            for dy in (-1, 0, 1):
+                for dx in (-1, 0, 1):
+                    if dx or dy:
+                        nx, ny = x + dx, y + dy
+                        if self._engine.wrap:
+                            nx, ny = nx % width, ny % height
+                        elif not (0 <= nx < width and 0 <= ny < height):
+                            continue
+                        count += old_cells[ny * width + nx]
+            keys[index] = count + 9 * old_cells[index]
+        if self._profiler is not None:
+            t = self._profiler.mark("unpack", t)
+        return new_cells, keys, t
+
+    def __str__(self):
+        return f"BitLiveModel({self._matrix_width}x{self._matrix_height}, gen={self._generation})"
+
+
+# ============================================================================
+# Banc d'essai : entier bit-parallèle contre boucle cellule par cellule
+# ============================================================================
+
+
+def benchmark(sizes=(256, 1024, 2048), generations: int = 5, density: float = 0.25, seed: int = 0,
+              max_loop_cells: int = 2048 * 2048) -> list:
+    """
+    Temps moyen par génération (s) des deux moteurs de LiveModel sur une soupe
+    :return: liste de dicts {size, bits, loop, speedup}
+    """
+    import random
+    from livemodel import random_mask
+
+    results = []
+    for size in sizes:
+        state = random_mask(size * size, int(size * size * density), random.Random(seed))
+        fast = BitLiveModel(size, size, 1)
+        fast.load_state(state)
+        start = time.perf_counter()
+        for _ in range(generations):
+            fast.next_generation()
+        bits_time = (time.perf_counter() - start) / generations
+
+        loop_time = None
+        if size * size <= max_loop_cells:
+            loop = LiveModel(size, size, 1)
+            loop.load_state(state)
+            start = time.perf_counter()
+            for _ in range(generations):
+                loop.next_generation()
+            loop_time = (time.perf_counter() - start) / generations
+            if loop.get_state() != fast.get_state():
+                raise AssertionError(f"Résultats différents en {size}x{size}")
+        results.append({
+            "size": size,
+            "bits": bits_time,
+            "loop": loop_time,
+            "speedup": loop_time / bits_time if loop_time else None,
+        })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Moteur bit-parallèle contre boucle par cellule")
+    parser.add_argument("--sizes", default="256,1024,2048")
+    parser.add_argument("--generations", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",")]
+    for result in benchmark(sizes, args.generations, seed=args.seed):
+        loop = f"{result['loop'] * 1000:9.1f} ms" if result["loop"] is not None else "        -"
+        speedup = f"x{result['speedup']:.1f}" if result["speedup"] else ""
+        print(f"{result['size']:>5}²  entier {result['bits'] * 1000:8.1f} ms  boucle {loop}  {speedup}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+"""
+Module livecensus.py
+Recensement des objets laissés par une soupe stabilisée (comme apgsearch)
+
+Étapes :
+1. séparer les cellules vivantes en composantes connexes (8 voisins, grille
+   torique, voir livelabel.py)
+2. simuler chaque composante seule pendant quelques générations pour trouver
+   sa période et son déplacement (nature morte, oscillateur, vaisseau)
+3. mettre l'objet sous forme canonique (min sur les 8 symétries et toutes
+   les phases) et chercher son nom dans une table de hachage d'objets connus
+
+Les composantes qui ne reviennent pas à leur forme seules (ex : les deux
+moitiés d'un beacon) sont regroupées avec leurs voisines à 2 cases près,
+puis réévaluées. Les résultats sont mémorisés par forme : une soupe
+typique ne contient que des blocs, ruches et clignotants déjà vus.
+
+    census = Census()
+    census.add(model)
+    print(census.most_common(5))
+"""
+
+import argparse
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from livemodel import LiveModel, RandomStrategy, TRANSFORMS, transform_pattern, parse_rule, CONWAY_RULE
+from livesweep import run_to_stabilisation
+from livelabel import label
+
+MAX_PERIOD = 30
+
+_NEIGHBOURS = [(dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy]
+_NEAR = [(dx, dy) for dy in range(-2, 3) for dx in range(-2, 3) if dx or dy]
+
+# Objets courants (une phase quelconque, la forme canonique est calculée au chargement)
+KNOWN_OBJECTS = {
+    "block": [(0, 0), (1, 0), (0, 1), (1, 1)],
+    "beehive": [(1, 0), (2, 0), (0, 1), (3, 1), (1, 2), (2, 2)],
+    "loaf": [(1, 0), (2, 0), (0, 1), (3, 1), (1, 2), (3, 2), (2, 3)],
+    "boat": [(0, 0), (1, 0), (0, 1), (2, 1), (1, 2)],
+    "ship": [(0, 0), (1, 0), (0, 1), (2, 1), (1, 2), (2, 2)],
+    "tub": [(1, 0), (0, 1), (2, 1), (1, 2)],
+    "pond": [(1, 0), (2, 0), (0, 1), (3, 1), (0, 2), (3, 2), (1, 3), (2, 3)],
+    "barge": [(1, 0), (0, 1), (2, 1), (1, 2), (3, 2), (2, 3)],
+    "long_boat": [(0, 0), (1, 0), (0, 1), (2, 1), (1, 2), (3, 2), (2, 3)],
+    "mango": [(1, 0), (2, 0), (0, 1), (3, 1), (1, 2), (4, 2), (2, 3), (3, 3)],
+    "blinker": [(0, 0), (1, 0), (2, 0)],
+    "toad": [(1, 0), (2, 0), (3, 0), (0, 1), (1, 1), (2, 1)],
+    "beacon": [(0, 0), (1, 0), (0, 1), (1, 1), (2, 2), (3, 2), (2, 3), (3, 3)],
+    "glider": [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)],
+    "lwss": [(1, 0), (4, 0), (0, 1), (0, 2), (4, 2), (0, 3), (1, 3), (2, 3), (3, 3)],
+}
+
+
+# ============================================================================
+# Résultat du recensement d'un objet
+# ============================================================================
+
+
+class CensusObject:
+    """
+    Un objet identifié
+    kind : "still_life", "oscillator", "spaceship" ou "unknown"
+    """
+
+    def __init__(self, name: str, code: str, kind: str, period: int, population: int):
+        self.name = name
+        self.code = code
+        self.kind = kind
+        self.period = period
+        self.population = population
+
+    def __repr__(self):
+        return f"CensusObject({self.name}, {self.kind}, période {self.period}, {self.population} cellules)"
+
+
+# ============================================================================
+# Simulation isolée et forme canonique
+# ============================================================================
+
+
+def _normalise(cells) -> tuple:
+    """Recale les cellules en (0, 0) : (forme triée, coin haut-gauche)"""
+    min_x = min(x for x, _ in cells)
+    min_y = min(y for _, y in cells)
+    return tuple(sorted((x - min_x, y - min_y) for x, y in cells)), (min_x, min_y)
+
+
+def _evolve(cells: frozenset, born: set, survive: set) -> frozenset:
+    """Une génération d'un ensemble de cellules sur un plan infini"""
+    counts = Counter((x + dx, y + dy) for x, y in cells for dx, dy in _NEIGHBOURS)
+    alive = {cell for cell, n in counts.items() if (n in survive if cell in cells else n in born)}
+    if 0 in survive:
+        alive.update(cell for cell in cells if cell not in counts)
+    return frozenset(alive)
+
+
+def find_period(cells, rule: str = CONWAY_RULE, max_period: int = MAX_PERIOD):
+    """
+    Simule un objet seul jusqu'à ce qu'il reprenne sa forme
+    :return: (période, déplacement (dx, dy), phases) ou None s'il ne revient pas
+    """
+    born, survive = parse_rule(rule)
+    shape, origin = _normalise(cells)
+    current = frozenset(cells)
+    phases = [shape]
+    for generation in range(1, max_period + 1):
+        current = _evolve(current, born, survive)
+        if not current:
+            return None
+        phase, corner = _normalise(current)
+        if phase == shape:
+            return generation, (corner[0] - origin[0], corner[1] - origin[1]), phases
+        phases.append(phase)
+    return None
+
+
+def canonical_form(phases) -> tuple:
+    """Plus petite forme parmi toutes les phases et les 8 symétries"""
+    return min(
+        tuple(sorted(transform_pattern(phase, transform)))
+        for phase in phases for transform in TRANSFORMS
+    )
+
+
+def object_code(prefix: str, population: int, shape: tuple) -> str:
+    """
+    Code lisible d'un objet inconnu, ex : "xs4_3_3" pour le bloc
+    (une ligne de la forme canonique = un entier, bit 0 = colonne 0, en hexadécimal)
+    """
+    rows = {}
+    for x, y in shape:
+        rows[y] = rows.get(y, 0) | (1 << x)
+    return f"{prefix}{population}_" + "_".join(format(rows.get(y, 0), "x") for y in range(max(rows) + 1))
+
+
+def _build_known(rule: str) -> dict:
+    known = {}
+    for name, pattern in KNOWN_OBJECTS.items():
+        found = find_period(pattern, rule)
+        if found is not None:
+            known[canonical_form(found[2])] = name
+    return known
+
+
+# ============================================================================
+# Composantes connexes sur la grille torique
+# ============================================================================
+
+
+def _flood(seed: int, alive: set, width: int, height: int, offsets) -> list:
+    """
+    Parcours en largeur depuis la cellule d'index seed (retirée de alive avec
+    toutes les cellules atteintes). Les coordonnées sont « déroulées » : un
+    objet à cheval sur un bord reste d'un seul tenant
+    """
+    x0, y0 = seed % width, seed // width
+    alive.discard(seed)
+    cells = [(x0, y0)]
+    for x, y in cells:      # la liste grandit pendant le parcours
+        for dx, dy in offsets:
+            nx, ny = x + dx, y + dy
+            index = (ny % height) * width + nx % width
+            if index in alive:
+                alive.discard(index)
+                cells.append((nx, ny))
+    return cells
+
+
+def components(state, width: int, height: int) -> list:
+    """Composantes connexes des cellules vivantes : liste de listes de (x, y)"""
+    labelling = label(state, width, height, connectivity=8, wrap=True)
+    groups = labelling.cells_by_label()
+    for number, (_x, _y, box_width, box_height) in enumerate(labelling.boxes):
+        if box_width == width or box_height == height:
+            # peut-être à cheval sur un bord : on déroule les coordonnées
+            alive = {y * width + x for x, y in groups[number]}
+            x, y = groups[number][0]
+            groups[number] = _flood(y * width + x, alive, width, height, _NEIGHBOURS)
+    return groups
+
+
+# ============================================================================
+# Recensement
+# ============================================================================
+
+
+class Census:
+    """
+    Recensement cumulé sur plusieurs soupes
+    Les formes déjà rencontrées sont mémorisées (une simulation par forme)
+    """
+
+    def __init__(self, rule: str = CONWAY_RULE, max_period: int = MAX_PERIOD):
+        self._rule = rule.upper()
+        self._max_period = max_period
+        self._known = _build_known(self._rule)   # forme canonique -> nom
+        self._cache = {}                         # forme (une phase) -> CensusObject ou None
+        self._tally = Counter()                  # nom -> nombre d'objets
+        self._soups = 0
+
+    @property
+    def soups(self):
+        return self._soups
+
+    @property
+    def tally(self):
+        return Counter(self._tally)
+
+    def classify(self, cells) -> CensusObject:
+        """Identifie un objet (None s'il ne reprend pas sa forme seul)"""
+        shape, _corner = _normalise(cells)
+        if shape in self._cache:
+            return self._cache[shape]
+
+        found = find_period(shape, self._rule, self._max_period)
+        if found is None:
+            result = None
+        else:
+            period, moved, phases = found
+            population = min(len(phase) for phase in phases)
+            if moved != (0, 0):
+                kind, prefix = "spaceship", f"xq{period}_"
+            elif period == 1:
+                kind, prefix = "still_life", "xs"
+            else:
+                kind, prefix = "oscillator", f"xp{period}_"
+            canonical = canonical_form(phases)
+            code = object_code(prefix, population, canonical)
+            result = CensusObject(self._known.get(canonical, code), code, kind, period, population)
+        self._cache[shape] = result
+        return result
+
+    def objects(self, state, width: int, height: int) -> list:
+        """Liste des objets d'un état (bytes, 1 octet par cellule)"""
+        parts = components(state, width, height)
+        results = [self.classify(cells) for cells in parts]
+        if None not in results:
+            return results
+
+        # Composantes qui ne tiennent pas seules : on les regroupe avec leurs voisines
+        # (à 2 cases près) et on réévalue le groupe
+        owner = {}
+        for number, cells in enumerate(parts):
+            for x, y in cells:
+                owner[(y % height) * width + x % width] = number
+        alive = set(owner)
+        merged = list(results)
+        for number, result in enumerate(results):
+            x, y = parts[number][0]
+            seed = (y % height) * width + x % width
+            if result is not None or seed not in alive:
+                continue
+            group = _flood(seed, alive, width, height, _NEAR)
+            for gx, gy in group:
+                merged[owner[(gy % height) * width + gx % width]] = None
+            merged.append(self.classify(group) or CensusObject(
+                "unknown", object_code("zz", len(group), _normalise(group)[0]), "unknown", None, len(group)))
+        return [result for result in merged if result is not None]
+
+    def add(self, model) -> list:
+        """Recense l'état courant d'un LiveModel et l'ajoute au total"""
+        found = self.objects(model.get_state(), model.matrix_width, model.matrix_height)
+        self._tally.update(obj.name for obj in found)
+        self._soups += 1
+        return found
+
+    def merge(self, tally, soups: int):
+        """Ajoute le résultat d'un autre recensement (ex : d'un autre processus)"""
+        self._tally.update(tally)
+        self._soups += soups
+
+    def most_common(self, n: int = None) -> list:
+        return self._tally.most_common(n)
+
+    def to_dict(self) -> dict:
+        return {"rule": self._rule, "soups": self._soups, "objects": dict(self._tally.most_common())}
+
+    def __str__(self):
+        return f"Census({self._soups} soupes, {sum(self._tally.values())} objets)"
+
+
+def _census_range(first_seed: int, count: int, size: int, density: float, rule: str,
+                  max_generations: int) -> tuple:
+    """Recense count soupes consécutives (exécuté dans un processus du pool)"""
+    census = Census(rule)
+    model = LiveModel(size, size, 1, rule=rule)
+    strategy = RandomStrategy(density)
+    model.set_strategy(strategy)
+    for seed in range(first_seed, first_seed + count):
+        strategy.reseed(seed)
+        model.apply_strategy()
+        run_to_stabilisation(model, max_generations)
+        census.add(model)
+    return census.tally, census.soups
+
+
+def census_soups(count: int, size: int = 32, density: float = 37.5, seed: int = 0,
+                 rule: str = CONWAY_RULE, max_generations: int = 5000, workers: int = 1) -> Census:
+    """
+    Lance count soupes (graines seed, seed + 1, ...) et recense chacune après stabilisation
+    :param workers: nombre de processus (None : nombre de cœurs)
+    """
+    census = Census(rule)
+    if workers == 1:
+        census.merge(*_census_range(seed, count, size, density, rule, max_generations))
+        return census
+
+    workers = workers or os.cpu_count() or 1
+    chunk = max(1, -(-count // (workers * 4)))     # quelques paquets par processus
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_census_range, first, min(chunk, seed + count - first),
+                               size, density, rule, max_generations)
+                   for first in range(seed, seed + count, chunk)]
+        for future in as_completed(futures):
+            census.merge(*future.result())
+    return census
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Recensement des objets issus de soupes aléatoires")
+    parser.add_argument("--soups", type=int, default=100)
+    parser.add_argument("--size", type=int, default=32)
+    parser.add_argument("--density", type=float, default=37.5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rule", default=CONWAY_RULE)
+    parser.add_argument("--workers", type=int, default=None, help="défaut : nombre de cœurs")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    census = census_soups(args.soups, args.size, args.density, args.seed, args.rule, workers=args.workers)
+    elapsed = time.perf_counter() - start
+    for name, count in census.most_common(args.top):
+        print(f"{name:<28} {count:>8}")
+    print(f"\n{census} en {elapsed:.1f} s ({census.soups / elapsed * 60:.0f} soupes/minute)")
+
+
+if __name__ == "__main__":
+    main()
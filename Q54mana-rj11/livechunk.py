@@ -0,0 +1,354 @@
+"""
+Module livechunk.py
+Univers sans bords découpé en tuiles denses de 64x64, allouées à la demande
+
+Une grille fixe (tore) finit par rattraper ses planeurs ; HashLife est trop
+lourd pour des soupes chaotiques. Ici l'univers est un dictionnaire de
+tuiles (tx, ty) -> buffer de 64x64 octets (1 = vivante) :
+- une tuile n'existe que si elle contient au moins une cellule vivante ;
+  une tuile qui devient vide est libérée à la génération suivante
+- chaque génération, seules les tuiles qui ont changé à la génération
+  précédente (ou qui ont été modifiées) et leurs 8 voisines sont
+  recalculées : une tuile dont tout le voisinage est resté identique ne
+  peut pas changer (nature morte, zone vide)
+- une tuile est calculée par un noyau dense, le même que LiveModel
+  (sommes de 3 cellules, table des règles), sur la tuile entourée d'une
+  bordure d'une cellule prise dans les tuiles voisines
+
+La mémoire suit donc l'activité, pas l'étendue : un planeur parti du canon
+n'occupe que les quelques tuiles qu'il traverse, pendant des millions de
+générations.
+
+ChunkedLiveModel garde l'API de LiveModel : sa grille (matrix_width x
+matrix_height) est une fenêtre sur l'univers, déplaçable avec move_viewport.
+
+    model = ChunkedLiveModel(500, 500, 10)
+    model.set_strategy(CanonStrategy())
+    model.apply_strategy()
+    for _ in range(10000):
+        model.next_generation()
+    model.universe.tile_count, model.universe.bounding_box()
+"""
+
+from livedelta import changed_indices
+from livemodel import LiveModel, CONWAY_RULE, rule_table
+
+TILE_SIZE = 64
+_TILE_OVERHEAD = 100    # octets estimés par tuile en plus de son buffer (clé, entrée du dict)
+
+
+class ChunkedUniverse:
+    """Univers sans bords : tuiles denses allouées là où il y a des cellules vivantes"""
+
+    def __init__(self, rule: str = CONWAY_RULE, tile_size: int = TILE_SIZE):
+        if tile_size < 2:
+            raise ValueError("Une tuile doit faire au moins 2x2 cellules")
+        self._size = tile_size
+        self._tiles = {}        # (tx, ty) -> bytearray(taille * taille), index y * taille + x
+        self._active = set()    # tuiles modifiées depuis la dernière génération (à recalculer avec leurs voisines)
+        self._generation = 0
+        self._rule_table = rule_table(rule)
+
+    @property
+    def tile_size(self):
+        return self._size
+
+    @property
+    def generation(self):
+        return self._generation
+
+    @property
+    def tile_count(self):
+        return len(self._tiles)
+
+    def set_rule(self, rule: str):
+        self._rule_table = rule_table(rule)
+        self._active.update(self._tiles)     # tout peut changer avec la nouvelle règle
+
+    def memory_used(self) -> int:
+        """Mémoire estimée des tuiles (octets)"""
+        return len(self._tiles) * (self._size * self._size + _TILE_OVERHEAD)
+
+    def population(self) -> int:
+        return sum(tile.count(1) for tile in self._tiles.values())
+
+    def clear(self):
+        self._tiles.clear()
+        self._active.clear()
+
+    # ------------------------------------------------------------------
+    # Cellules
+    # ------------------------------------------------------------------
+
+    def get(self, x: int, y: int) -> bool:
+        size = self._size
+        tile = self._tiles.get((x // size, y // size))
+        return tile is not None and tile[(y % size) * size + x % size] == 1
+
+    def set(self, x: int, y: int, alive: bool):
+        size = self._size
+        key = (x // size, y // size)
+        tile = self._tiles.get(key)
+        if tile is None:
+            if not alive:
+                return
+            tile = self._tiles[key] = bytearray(size * size)
+        tile[(y % size) * size + x % size] = 1 if alive else 0
+        self._active.add(key)      # tuile vide : libérée par la prochaine génération
+
+    def set_many(self, coords, alive: bool = True):
+        for x, y in coords:
+            self.set(x, y, alive)
+
+    def neighbours(self, x: int, y: int) -> int:
+        """Nb de voisins vivants de (x, y)"""
+        return sum(self.get(x + dx, y + dy)
+                   for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy)
+
+    def read_region(self, x: int, y: int, width: int, height: int) -> bytearray:
+        """État du rectangle (1 octet par cellule, index ligne * width + colonne)"""
+        size = self._size
+        region = bytearray(width * height)
+        for tx in range(x // size, (x + width - 1) // size + 1):
+            x0, x1 = max(x, tx * size), min(x + width, (tx + 1) * size)
+            for ty in range(y // size, (y + height - 1) // size + 1):
+                tile = self._tiles.get((tx, ty))
+                if tile is None:
+                    continue
+                for cy in range(max(y, ty * size), min(y + height, (ty + 1) * size)):
+                    start = (cy % size) * size
+                    out = (cy - y) * width
+                    region[out + x0 - x:out + x1 - x] = tile[start + x0 % size:start + (x1 - 1) % size + 1]
+        return region
+
+    def bounding_box(self):
+        """(x0, y0, x1, y1) des cellules vivantes (x1, y1 exclus), None si l'univers est vide"""
+        size = self._size
+        box = None
+        for (tx, ty), tile in self._tiles.items():
+            rows = [y for y in range(size) if 1 in tile[y * size:(y + 1) * size]]
+            if not rows:
+                continue
+            columns = [x for x in range(size) if 1 in tile[x::size]]
+            x0, y0 = tx * size + columns[0], ty * size + rows[0]
+            x1, y1 = tx * size + columns[-1] + 1, ty * size + rows[-1] + 1
+            if box is None:
+                box = (x0, y0, x1, y1)
+            else:
+                box = (min(box[0], x0), min(box[1], y0), max(box[2], x1), max(box[3], y1))
+        return box
+
+    # ------------------------------------------------------------------
+    # Génération
+    # ------------------------------------------------------------------
+
+    def step(self):
+        """Une génération : tuiles actives et leurs voisines seulement"""
+        candidates = {(tx + dx, ty + dy) for tx, ty in self._active
+                      for dy in (-1, 0, 1) for dx in (-1, 0, 1)}
+        results = {}
+        for key in candidates:
+            padded = self._padded(key)
+            if padded is not None:
+                results[key] = self._kernel(padded)
+            elif key in self._tiles:
+                results[key] = None     # tuile vide, rien autour : libérée
+
+        # tous les calculs sont faits sur l'ancien état : on peut appliquer
+        tiles = self._tiles
+        active = set()
+        for key, new in results.items():
+            old = tiles.get(key)
+            if new is None or 1 not in new:
+                if old is not None:
+                    del tiles[key]
+                    if 1 in old:
+                        active.add(key)
+            else:
+                if old != new:
+                    active.add(key)
+                tiles[key] = new
+        self._active = active
+        self._generation += 1
+
+    def _padded(self, key):
+        """Tuile entourée d'une bordure d'une cellule prise chez les voisines ; None si tout est vide"""
+        size = self._size
+        tx, ty = key
+        tiles = self._tiles
+        p = size + 2
+        buffer = bytearray(p * p)
+        tile = tiles.get(key)
+        if tile is not None:
+            for y in range(size):
+                buffer[(y + 1) * p + 1:(y + 1) * p + 1 + size] = tile[y * size:(y + 1) * size]
+        neighbour = tiles.get((tx - 1, ty))
+        if neighbour is not None:
+            buffer[p:p * (size + 1):p] = neighbour[size - 1::size]
+        neighbour = tiles.get((tx + 1, ty))
+        if neighbour is not None:
+            buffer[p + size + 1:p * (size + 1):p] = neighbour[0::size]
+        neighbour = tiles.get((tx, ty - 1))
+        if neighbour is not None:
+            buffer[1:1 + size] = neighbour[(size - 1) * size:]
+        neighbour = tiles.get((tx, ty + 1))
+        if neighbour is not None:
+            buffer[(size + 1) * p + 1:(size + 1) * p + 1 + size] = neighbour[:size]
+        for dx, dy, at, source in ((-1, -1, 0, size * size - 1), (1, -1, p - 1, (size - 1) * size),
+                                   (-1, 1, (size + 1) * p, size - 1), (1, 1, p * p - 1, 0)):
+            neighbour = tiles.get((tx + dx, ty + dy))
+            if neighbour is not None:
+                buffer[at] = neighbour[source]
+        return buffer if 1 in buffer else None
+
+    def _kernel(self, padded) -> bytes:
+        """Noyau dense sans tore (le même que LiveModel) : tuile bordée -> nouvelle tuile"""
+        size = self._size
+        p = size + 2
+        rows = [padded[y * p:(y + 1) * p] for y in range(p)]
+        sums = [[a + b + c for a, b, c in zip(row, row[1:], row[2:])] for row in rows]
+        keys = bytearray()
+        for y in range(size):
+            keys += bytes([a + b + c + 8 * s for a, b, c, s in
+                           zip(sums[y], sums[y + 1], sums[y + 2], rows[y + 1][1:-1])])
+        return keys.translate(self._rule_table)
+
+    def __str__(self):
+        return f"ChunkedUniverse({len(self._tiles)} tuiles de {self._size}x{self._size}, gen={self._generation})"
+
+
+class ChunkedLiveModel(LiveModel):
+    """
+    LiveModel sur un univers sans bords : la grille est une fenêtre
+    (origine x, y ; matrix_width x matrix_height) sur un ChunkedUniverse
+    - les écritures passent par l'API de LiveModel (clics, stratégies,
+      set_many...) sur la fenêtre, puis sont reportées dans l'univers avant
+      la génération suivante (sync)
+    - next_generation fait avancer tout l'univers, puis relit la fenêtre
+    - ce qui sort de la fenêtre continue de vivre (univers.population,
+      bounding_box) ; un retour arrière (rewind) ne restaure que la fenêtre
+    """
+
+    def __init__(self, canvas_width: int, canvas_height: int, cell_size: int,
+                 rule: str = CONWAY_RULE, tile_size: int = TILE_SIZE):
+        super().__init__(canvas_width, canvas_height, cell_size, rule)
+        self._universe = ChunkedUniverse(rule, tile_size)
+        self._origin = (0, 0)
+        # Fenêtre telle que l'univers la connaît : buffer partagé, la
+        # première écriture en fait une copie et sync compare les deux
+        self._shown = self._cells
+        self._shared = True
+
+    @property
+    def universe(self):
+        return self._universe
+
+    @property
+    def origin(self):
+        return self._origin
+
+    def set_rule(self, rule: str):
+        super().set_rule(rule)
+        self._universe.set_rule(rule)
+
+    def sync(self):
+        """Reporte dans l'univers les écritures faites sur la fenêtre depuis la dernière lecture"""
+        state = self._cells
+        if state is self._shown:
+            return
+        ox, oy = self._origin
+        width = self._matrix_width
+        universe = self._universe
+        for index in changed_indices(self._shown, state):
+            universe.set(ox + index % width, oy + index // width, state[index])
+        self._shown = state
+        self._shared = True
+
+    def move_viewport(self, x: int, y: int):
+        """Déplace la fenêtre (coin haut-gauche en (x, y) dans l'univers)"""
+        self.sync()
+        self._origin = (x, y)
+        self._load_window()
+
+    def population(self) -> int:
+        """Cellules vivantes dans tout l'univers (fenêtre comprise)"""
+        self.sync()
+        return self._universe.population()
+
+    def resize(self, width: int, height: int, anchor: str = "topleft"):
+        """
+        Change la taille de la fenêtre : le motif ne bouge pas dans l'univers
+        (anchor="center" : la fenêtre grandit autour de son centre)
+        """
+        if width <= 0 or height <= 0:
+            raise ValueError("La grille doit avoir au moins une cellule")
+        if anchor not in ("topleft", "center"):
+            raise ValueError(f"Ancrage inconnu : {anchor}")
+        old_width, old_height = self._matrix_width, self._matrix_height
+        if (width, height) == (old_width, old_height):
+            return
+        self.sync()
+        (left, top), (new_left, new_top) = self._move_corner(width, height, anchor)
+        ox, oy = self._origin
+        self._origin = (ox + new_left - left, oy + new_top - top)
+        self._matrix_width, self._matrix_height = width, height
+        self._canvas_width = width * self._cell_size
+        self._canvas_height = height * self._cell_size
+        self._cell_objects = {}
+        self._load_window()
+        if self._history is not None:
+            self._reset_history()
+
+    def reset_all_cells(self):
+        """Vide tout l'univers (pas seulement la fenêtre)"""
+        super().reset_all_cells()
+        self._universe.clear()
+        self._shown = self._cells
+        self._shared = True
+
+    def memory_estimate(self) -> int:
+        return super().memory_estimate() + self._universe.memory_used()
+
+    def next_generation(self):
+        super().next_generation()
+        self._shown = self._cells       # la fenêtre vient d'être relue dans l'univers
+        self._shared = True
+
+    def _compute_generation(self, old_cells, t):
+        """Tout l'univers avance, puis la fenêtre est relue"""
+        self.sync()
+        profiler = self._profiler
+        ox, oy = self._origin
+        width = self._matrix_width
+        universe = self._universe
+        # clés (voisins + 9 * état) seulement pour les objets LiveCell
+        keys = {index: universe.neighbours(ox + index % width, oy + index // width) + 9 * old_cells[index]
+                for index in self._cell_objects}
+        universe.step()
+        if profiler is not None:
+            t = profiler.mark("kernel", t)
+        new_cells = universe.read_region(ox, oy, width, self._matrix_height)
+        if profiler is not None:
+            t = profiler.mark("window", t)
+        return new_cells, keys, t
+
+    def _load_window(self):
+        """Remplace la fenêtre par l'univers (un seul événement pour les observers)"""
+        new = self._universe.read_region(*self._origin, self._matrix_width, self._matrix_height)
+        now = int.from_bytes(new, "little")
+        if len(self._cells) == len(new):
+            old = int.from_bytes(self._cells, "little")
+            born, died = (now & ~old).bit_count(), (old & ~now).bit_count()
+        else:
+            born, died = now.bit_count(), self._cells.count(1)
+        self._cells = self._shown = new
+        self._shared = True
+        self._forget_box()
+        self._marks.clear()     # même génération, autre contenu : les différences ne valent plus
+        self._steps.clear()
+        self._edits += 1
+        self._changed(born, died)
+
+    def __str__(self):
+        return (f"ChunkedLiveModel({self._matrix_width}x{self._matrix_height} en {self._origin}, "
+                f"gen={self._generation}, {self._universe.tile_count} tuiles)")
@@ -1,5 +1,33 @@
 from livemodel import LiveModel, RandomStrategy, CanonStrategy, EmptyStrategy
 from livecounter import LiveCounter
+from liveprofiler import LiveProfiler
+from liverecord import LiveRecorder, LivePlayer
+from liveworker import SimulationWorker, FrameMirror
+
+# Intervalle entre deux rafraîchissements (ms) : lecture de la file d'images
+# en mode thread, application des cellules peintes à la souris
+FRAME_INTERVAL = 30
+
+
+def line_cells(x0: int, y0: int, x1: int, y1: int) -> list:
+    """Cellules du segment (x0, y0) -> (x1, y1), extrémités comprises (algorithme de Bresenham)"""
+    dx, dy = abs(x1 - x0), -abs(y1 - y0)
+    sx = 1 if x0 < x1 else -1
+    sy = 1 if y0 < y1 else -1
+    error = dx + dy
+    cells = []
+    while True:
+        cells.append((x0, y0))
+        if x0 == x1 and y0 == y1:
+            return cells
+        double = 2 * error
+        if double >= dy:
+            error += dy
+            x0 += sx
+        if double <= dx:
+            error += dx
+            y0 += sy
+
 
 class LiveController:
     """
@@ -7,15 +35,26 @@ class LiveController:
     gère la logique de l'application et fait le lien entre modèle et vue
     """
 
-    def __init__(self, canvas_width: int = 500, canvas_height: int = 500, cell_size: int = 10):
-        # Créer le modèle (SINGLETON)
-        self._model = LiveModel.get_instance(canvas_width, canvas_height, cell_size)
+    def __init__(self, canvas_width: int = 500, canvas_height: int = 500, cell_size: int = 10,
+                 model: LiveModel = None, counter: LiveCounter = None, threaded: bool = False):
+        """
+        :param threaded: simulation dans un thread à part (SimulationWorker) ; la vue
+            affiche alors un miroir de l'état mis à jour par les images du thread
+        """
+        # Modèle : celui fourni (un univers parmi d'autres) ou l'instance par défaut (SINGLETON)
+        if model is None:
+            model = LiveModel.get_instance(canvas_width, canvas_height, cell_size)
+        self._model = model
         self._view = None
 
         # Créer le compteur (OBSERVER)
-        self._counter = LiveCounter()
+        self._counter = counter if counter is not None else LiveCounter()
         self._model.set_counter(self._counter)
 
+        # Historique pour le bouton Back (mémoire bornée)
+        if self._model.history is None:
+            self._model.enable_history()
+
         # Créer les stratégies (STRATEGY)
         self.gui_random_strategy = RandomStrategy(25)
         self._canon_strategy = CanonStrategy()
@@ -31,9 +70,38 @@ class LiveController:
         self._refresh_delay = 100   # millisecondes entre chaque génération
         self._flag = False          # True = simulation en cours
 
+        # Profileur des phases (désactivé par défaut)
+        self._profiler = LiveProfiler()
+        self._profiling = False
+
+        # Enregistrement / relecture (la vue affiche le lecteur à la place du modèle)
+        self._recorder = None
+        self._player = None
+
+        # Thread de simulation : toutes les modifications du modèle passent par lui
+        self._worker = None
+        self._mirror = None
+        if threaded:
+            self._worker = SimulationWorker(self._model, delay=self._refresh_delay / 1000)
+            self._mirror = FrameMirror(self._model)
+            self._worker.start()
+
+        # Dessin à la souris : cellules en attente, appliquées en un seul bloc par image
+        self._paint_alive = None    # état peint pendant un glisser (None : pas de glisser)
+        self._paint_last = None
+        self._paint_pending = []
+        self._paint_scheduled = False
+
     def set_view(self, view):
         """Lie la vue au contrôleur"""
         self._view = view
+        if self._worker is not None:
+            self._view.schedule_next_iteration(FRAME_INTERVAL, self.poll_frames)
+
+    def close(self):
+        """Arrête le thread de simulation (mode thread)"""
+        if self._worker is not None:
+            self._worker.shutdown()
 
     @property
     def model(self):
@@ -43,6 +111,57 @@ class LiveController:
     def refresh_delay(self):
         return self._refresh_delay
 
+    @property
+    def profiler(self):
+        """Profileur actif, ou None si le profilage est désactivé"""
+        return self._profiler if self._profiling else None
+
+    @property
+    def display_source(self):
+        """Ce que la vue affiche : le lecteur en mode relecture, sinon le miroir (mode thread) ou le modèle"""
+        if self._player is not None:
+            return self._player
+        return self._mirror if self._mirror is not None else self._model
+
+    @property
+    def recording(self):
+        return self._recorder is not None
+
+    @property
+    def player(self):
+        return self._player
+
+    @property
+    def worker(self):
+        """Thread de simulation, ou None sans le mode thread"""
+        return self._worker
+
+    def _halt(self):
+        """Arrête la simulation automatique"""
+        self._flag = False
+        if self._worker is not None:
+            self._worker.stop()
+        else:
+            self._model.pause()
+
+    def _edit(self, command, *args, cells=None):
+        """
+        Modifie le modèle : command(model, *args) est envoyée au thread de
+        simulation (exécutée dans l'ordre, affichée à la prochaine image), ou
+        exécutée tout de suite sans le mode thread
+        :param cells: cellules (x, y) que la commande peut modifier : seules
+            celles-ci sont redessinées (None : tout redessiner)
+        """
+        if self._worker is not None:
+            self._worker.submit(command, *args)
+            return
+        command(self._model, *args)
+        if self._view:
+            if cells is None:
+                self._view.update_display()
+            else:
+                self._view.update_cells(cells)
+
 # ========================================================================
 # Méthodes GUI - Appelées par les boutons de la vue
 # ========================================================================
@@ -50,56 +169,79 @@ class LiveController:
     def gui_go(self):
         """démarrer la simulation"""
         if not self._flag:
-            self._model.start()
             self._flag = True
+            if self._worker is not None and self._player is None:
+                self._worker.go()
+                return
+            self._model.start()
             self.play()
 
     def gui_stop(self):
         """Arreter la simulation"""
-        self._model.pause()
-        self._flag = False
+        self._halt()
 
     def gui_reset(self):
         """ Reset complet : tout remettre à zéro"""
-        self._flag = False
-        self._model.reset()
-        if self._view:
-            self._view.update_display()
+        self._halt()
+        self._edit(LiveModel.reset)
 
     def gui_step(self):
         """ Avancer d'une génération (mode pas-à-pas"""
-        self._flag = False  # Arrêter la simulation auto
-        self._model.pause()
+        self._halt()  # Arrêter la simulation auto
+        if self._worker is not None and self._player is None:
+            self._worker.step()
+            return
         self._next_generation()
         if self._view:
-            self._view.update_display()
+            self._show_generation()
+
+    def gui_back(self):
+        """Revenir d'une génération en arrière (historique du modèle)"""
+        self._halt()
+        if self._player is not None:
+            self.gui_seek(self._player.position - 1)
+            return
+        self._edit(self._step_back)
+
+    @staticmethod
+    def _step_back(model):
+        generation = model.generation
+        if not model.step_back():
+            print("Historique épuisé : impossible de revenir plus loin")
+        elif generation - model.generation > 1:
+            print(f"Différences oubliées : retour à l'image clé de la génération {model.generation}")
 
     def gui_canon(self):
         """ Appliquer la config canon (STRATEGY)"""
-        self._flag = False
-        self._model.pause()
-        self._model.set_strategy(self._canon_strategy)
-        self._model.apply_strategy()
-        if self._view:
-            self._view.update_display()
+        self._halt()
+        self._edit(self._apply_strategy, self._canon_strategy)
 
     def gui_random(self):
         """Appliquer la config aléatoire (STRATEGY)"""
-        self._flag = False
-        self._model.pause()
-        self._model.set_strategy(self.gui_random_strategy)
-        self._model.apply_strategy()
-        if self._view:
-            self._view.update_display()
+        self._halt()
+        self._edit(self._apply_strategy, self.gui_random_strategy)
 
     def gui_empty(self):
         """Vider la grille (STRATEGY)"""
-        self._flag = False
-        self._model.pause()
-        self._model.set_strategy(self._empty_strategy)
-        self._model.apply_strategy()
-        if self._view:
-            self._view.update_display()
+        self._halt()
+        self._edit(self._apply_strategy, self._empty_strategy)
+
+    @staticmethod
+    def _apply_strategy(model, strategy):
+        model.set_strategy(strategy)
+        model.apply_strategy()
+
+    def gui_resize(self, width: int, height: int, anchor: str = "center"):
+        """
+        Redimensionne la grille (en cellules) en gardant le motif
+        Appelée en direct quand la fenêtre change de taille
+        """
+        if width <= 0 or height <= 0:
+            return
+        if (width, height) == (self._model.matrix_width, self._model.matrix_height):
+            return
+        self._matrix_width, self._matrix_height = width, height
+        self._edit(LiveModel.resize, width, height, anchor)
 
     def gui_change_speed(self, speed_str: str):
         """Changer la vitesse de simulation"""
@@ -107,12 +249,65 @@ class LiveController:
             speed = int(speed_str)
             if speed > 0:
                 self._refresh_delay = speed
+                if self._worker is not None:
+                    self._worker.set_delay(speed / 1000)
                 print(f"Vitesse changée : {speed} ms")
             else:
                 print(" La vitesse doit être positive")
         except ValueError:
             print("Vitesse invalide (entrer un nombre")
 
+    def gui_toggle_profiler(self):
+        """Active/désactive la mesure du temps de chaque phase"""
+        self._profiling = not self._profiling
+        if self._profiling:
+            self._profiler.reset()
+        self._edit(LiveModel.set_profiler, self.profiler)
+
+    def gui_dump_profile(self, path: str = "profile.json"):
+        """Écrit les statistiques du profileur dans un fichier JSON"""
+        self._profiler.dump(path)
+        print(f"Profil écrit dans {path}")
+
+    def gui_toggle_recording(self, path: str = "recording.liferec"):
+        """Démarre / arrête l'enregistrement de la simulation (une image par génération)"""
+        if self._recorder is None:
+            recorder = self._recorder = LiveRecorder(path)
+            self._edit(lambda model: recorder.attach(model))
+            print(f"Enregistrement dans {path}")
+        else:
+            recorder = self._recorder
+            self._edit(lambda model: recorder.close())
+            if self._worker is not None:
+                self._worker.wait_idle(2.0)     # fichier fermé avant de le relire
+            print(f"Enregistrement terminé : {self._recorder.frames} images dans {self._recorder.path}")
+            self._recorder = None
+
+    def gui_toggle_playback(self, path: str = "recording.liferec"):
+        """Passe en relecture d'un enregistrement (ou revient à la simulation en direct)"""
+        self._halt()
+        if self._player is None:
+            if self._recorder is not None and self._recorder.path == path:
+                self.gui_toggle_recording()
+            try:
+                self._player = LivePlayer(path)
+            except (OSError, ValueError) as error:
+                print(f"Relecture impossible : {error}")
+                return
+        else:
+            self._player.close()
+            self._player = None
+        if self._view:
+            self._view.update_display()
+
+    def gui_seek(self, frame: int):
+        """Relecture : affiche l'image demandée"""
+        if self._player is None or frame == self._player.position:
+            return
+        self._player.seek(max(0, min(int(frame), self._player.frame_count - 1)))
+        if self._view:
+            self._view.update_display()
+
     def gui_cell_click(self, pixel_x: int, pixel_y: int, button: int):
         """
         gestion du clic sur une cellule
@@ -122,9 +317,12 @@ class LiveController:
         """
         # Convertir pixels -> coordonnées grille
         grid_x, grid_y = self._model.pixel_to_grid(pixel_x, pixel_y)
+        self._edit(self._click_cell, grid_x, grid_y, button, cells=[(grid_x, grid_y)])
 
+    @staticmethod
+    def _click_cell(model, grid_x: int, grid_y: int, button: int):
         # Récupérer la cellule
-        cell = self._model.get_cell(grid_x, grid_y)
+        cell = model.get_cell(grid_x, grid_y)
 
         if cell:
             if button == 1:
@@ -135,14 +333,76 @@ class LiveController:
                 # clic droit : tuer
                 cell.set_alive(False)
 
-            # Mettre à jour l'affichage
-            if self._view:
-                self._view.update_display()
+    def gui_paint_start(self, pixel_x: int, pixel_y: int, button: int):
+        """
+        Début d'un dessin à la souris (bouton enfoncé)
+        :param button: 1=clic gauche (cellules vivantes), 3=clic droit (cellules mortes)
+        """
+        self._paint_alive = button == 1
+        self._paint_last = self._model.pixel_to_grid(pixel_x, pixel_y)
+        self._paint_pending.append(self._paint_last)
+        self._schedule_paint()
+
+    def gui_paint_move(self, pixel_x: int, pixel_y: int):
+        """
+        Glisser : les événements de mouvement sautent des cases quand la souris
+        va vite, on peint tout le segment depuis la position précédente
+        """
+        if self._paint_alive is None:
+            return
+        cell = self._model.pixel_to_grid(pixel_x, pixel_y)
+        if cell != self._paint_last:
+            self._paint_pending += line_cells(*self._paint_last, *cell)[1:]
+            self._paint_last = cell
+            self._schedule_paint()
+
+    def gui_paint_end(self):
+        """Fin du dessin (bouton relâché) : applique ce qui reste en attente"""
+        self.flush_paint()
+        self._paint_alive = None
+
+    def _schedule_paint(self):
+        """Au plus une application (et un redessin) par image"""
+        if self._view is None:
+            self.flush_paint()
+        elif not self._paint_scheduled:
+            self._paint_scheduled = True
+            self._view.schedule_next_iteration(FRAME_INTERVAL, self.flush_paint)
+
+    def flush_paint(self):
+        """Applique en un seul bloc les cellules peintes depuis la dernière image"""
+        self._paint_scheduled = False
+        cells, self._paint_pending = self._paint_pending, []
+        if cells and self._paint_alive is not None:
+            self._edit(LiveModel.set_many, cells, self._paint_alive, cells=cells)
 
 # ========================================================================
 # Méthodes de simulation
 # ========================================================================
 
+    def poll_frames(self) -> int:
+        """
+        Mode thread : applique les images publiées par la simulation au miroir
+        et redessine une seule fois, quel que soit leur nombre ; se reprogramme
+        tant que le thread tourne
+        :return: nombre d'images appliquées
+        """
+        frames = self._worker.drain()
+        for frame in frames:
+            self._mirror.apply(frame)
+        if self._view:
+            if frames and self._player is None:
+                if any(frame.flips is None for frame in frames):
+                    self._view.update_display()
+                else:
+                    # que des différences : on ne redessine que les cellules qui ont changé
+                    width = self._mirror.matrix_width
+                    changed = set().union(*(frame.flips for frame in frames))
+                    self._view.update_cells([(index % width, index // width) for index in changed])
+            if self._worker.alive:
+                self._view.schedule_next_iteration(FRAME_INTERVAL, self.poll_frames)
+        return len(frames)
+
     def play(self):
         """
         Boucle principale de simulation
@@ -155,11 +415,18 @@ class LiveController:
 
             # Mettre a jour l'affichage
             if self._view:
-                self._view.update_display()
+                self._show_generation()
                 # Programmer la prochaine itération
                 # self._view.get_root.ai().update()   ######@@@@@@@@@  Force tkinter à redessiner !
                 self._view.schedule_next_iteration(self._refresh_delay, self.play)
 
+    def _show_generation(self):
+        """Redessin après une génération : ce qui a changé (modèle), ou toute l'image (relecture)"""
+        if self._player is not None:
+            self._view.update_display()
+        else:
+            self._view.update_changes()
+
     def _next_generation(self):
         """
         Calcule la prochaine génération
@@ -168,6 +435,11 @@ class LiveController:
         """
         # self._count_neighbours()
         # self._apply_conway_rules()
+        if self._player is not None:
+            # relecture : image suivante, arrêt à la fin de l'enregistrement
+            if not self._player.step():
+                self._flag = False
+            return
         self._model.next_generation()
 
     def _count_neighbours(self):
@@ -16,21 +16,23 @@ class LiveCounter:
         """
         Methode appelée quand une cellule change d'état
         (interface du pattern Observer)
-        Note : Dans cette implémentation, on préfère recompter
-        toutes les cellules plutôt que de tracker chaque changement
-        individuellement pour éviter les incohérences
+        La cellule ne notifie que si son état a vraiment changé
         """
+        self._alive_count += 1 if cell.is_alive() else -1
+
+    def update_many(self, model, born: int, died: int):
+        """
+        Methode appelée après une écriture en bloc dans le modèle
+        (un seul événement pour toutes les cellules modifiées)
+        """
+        self._alive_count += born - died
 
     def count_all(self, model):
         """
         Compte toutes les cellules vivantes dans le modèle
         Méthode principale utilisée pour mettre à jour le compteur
         """
-        count = 0
-        for cell in model.get_all_cells():
-            if cell.is_alive():
-                count += 1
-        self._alive_count = count
+        self._alive_count = model.count_alive_cells()
 
     def reset(self):
         """Remet le compteur à zéro"""
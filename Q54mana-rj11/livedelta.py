@@ -0,0 +1,72 @@
+"""
+Module livedelta.py
+Différences entre deux états de grille et empaquetage compact des états
+
+Un état est un buffer de 1 octet par cellule (0 morte, 1 vivante,
+index y * largeur + x), comme LiveModel.get_state().
+- changed_indices / diff_states : cellules qui changent, nées / mortes entre
+  deux états (XOR sur de grands entiers)
+- apply_delta : rejoue une différence sur un état
+- pack_state / unpack_state : 1 bit par cellule (bit de poids faible en premier)
+"""
+
+import re
+
+_CHANGED = re.compile(b"[^\x00]")
+
+# Taille des tranches comparées par changed_indices (pas de copie de tout l'état)
+_CHUNK = 4096
+
+# Table : octet -> 8 cellules, et l'inverse (8 cellules -> octet)
+_BYTE_TO_CELLS = [bytes((value >> bit) & 1 for bit in range(8)) for value in range(256)]
+_CELLS_TO_BYTE = {tuple(cells): value for value, cells in enumerate(_BYTE_TO_CELLS)}
+
+
+def changed_indices(old, new) -> list:
+    """Indices (triés) des cellules qui diffèrent entre deux états de même taille"""
+    if len(old) != len(new):
+        raise ValueError(f"États de tailles différentes : {len(old)} et {len(new)}")
+    size = len(new)
+    old, new = memoryview(old), memoryview(new)
+    indices = []
+    # par tranches : la mémoire temporaire ne dépend pas de la taille de la grille
+    for start in range(0, size, _CHUNK):
+        end = min(size, start + _CHUNK)
+        changed = int.from_bytes(old[start:end], "little") ^ int.from_bytes(new[start:end], "little")
+        if changed:
+            indices += [start + match.start()
+                        for match in _CHANGED.finditer(changed.to_bytes(end - start, "little"))]
+    return indices
+
+
+def diff_states(old, new) -> tuple:
+    """
+    Cellules qui changent entre deux états de même taille
+    :return: (indices des naissances, indices des morts), triés
+    """
+    born, died = [], []
+    for index in changed_indices(old, new):
+        if new[index]:
+            born.append(index)
+        else:
+            died.append(index)
+    return born, died
+
+
+def apply_delta(state: bytearray, born, died):
+    """Applique des naissances / morts à un état (modifié sur place)"""
+    for index in born:
+        state[index] = 1
+    for index in died:
+        state[index] = 0
+
+
+def pack_state(state) -> bytes:
+    """1 bit par cellule : 8 fois plus petit qu'un état"""
+    padded = bytes(state) + bytes(-len(state) % 8)
+    return bytes(map(_CELLS_TO_BYTE.__getitem__, zip(*[iter(padded)] * 8)))
+
+
+def unpack_state(packed, total: int) -> bytearray:
+    """Inverse de pack_state : renvoie un état de total cellules"""
+    return bytearray(b"".join(map(_BYTE_TO_CELLS.__getitem__, packed))[:total])
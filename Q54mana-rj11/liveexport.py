@@ -0,0 +1,352 @@
+"""
+Module liveexport.py
+Export d'images (PNG) et d'animations (GIF) sans Tk, directement depuis le
+buffer d'état (1 octet par cellule, index y * largeur + x)
+
+Tout est fait avec la bibliothèque standard (zlib, struct) :
+- une cellule est un index de palette : l'état sert tel quel de pixels
+- agrandissement (cell_size) : bytes.replace pour élargir les cellules,
+  répétition des lignes pour la hauteur (fait en C, pas cellule par cellule)
+- PNG : image à palette (type 3, 8 bits), compressée par zlib
+- GIF : LZW « sans compression » (un code clear tous les 2 pixels, la taille
+  des codes ne change jamais) ; les codes sont assemblés 8 par 8 sur de grands
+  entiers, et chaque image ne contient que les lignes qui ont changé
+
+Palettes à 2 couleurs (morte, vivante) ou à 4 couleurs (morte, née, morte à
+cette génération, survivante) : avec 4 couleurs, l'image dépend aussi de
+l'état précédent.
+
+    export_model(model, "run.gif", generations=1000, cell_size=2, palette="dark")
+    write_png("gen.png", model.get_state(), model.matrix_width, model.matrix_height)
+"""
+
+import argparse
+import os
+import struct
+import time
+import zlib
+
+from livemodel import CONWAY_RULE, LiveModel, RandomStrategy
+
+PALETTES = {
+    "classic": ((255, 255, 255), (0, 0, 0)),
+    "dark": ((0, 0, 0), (0, 230, 118)),
+    "blueprint": ((16, 42, 84), (220, 235, 255)),
+    # morte, née, morte à cette génération, survivante
+    "changes": ((255, 255, 255), (0, 170, 0), (240, 150, 150), (0, 0, 0)),
+}
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# GIF : codes LZW sur 3 bits (taille minimale 2), clear = 4, fin = 5
+_GIF_CLEAR = 4
+_GIF_END = 5
+# paire de pixels (p0 + 4 * p1) -> clear, p0, p1 (9 bits dont le dernier est nul)
+_PAIR_CODES = bytes((_GIF_CLEAR | (value & 3) << 3 | (value >> 2 & 3) << 6) for value in range(256))
+
+
+def get_palette(palette) -> tuple:
+    """Palette par son nom ou liste de 2 ou 4 couleurs (r, g, b)"""
+    if isinstance(palette, str):
+        if palette not in PALETTES:
+            raise ValueError(f"Palette inconnue : {palette} ({', '.join(PALETTES)})")
+        palette = PALETTES[palette]
+    colours = tuple(tuple(colour) for colour in palette)
+    if len(colours) not in (2, 4):
+        raise ValueError(f"Une palette a 2 ou 4 couleurs, pas {len(colours)}")
+    return colours
+
+
+# ============================================================================
+# Pixels : état -> index de palette, agrandissement
+# ============================================================================
+
+
+def state_pixels(state, previous=None) -> bytes:
+    """
+    Index de palette de chaque cellule (1 octet par cellule)
+    Sans état précédent : 0 morte, 1 vivante ; avec : 2 * avant + maintenant
+    (0 morte, 1 née, 2 morte à cette génération, 3 survivante)
+    """
+    if previous is None:
+        return bytes(state)
+    if len(previous) != len(state):
+        raise ValueError(f"États de tailles différentes : {len(previous)} et {len(state)}")
+    # octets à 0 / 1 : 2 * avant + maintenant <= 3, pas de retenue d'un octet à l'autre
+    value = 2 * int.from_bytes(previous, "little") + int.from_bytes(state, "little")
+    return value.to_bytes(len(state), "little")
+
+
+def scale_pixels(pixels, width: int, height: int, cell_size: int = 1, prefix: bytes = b"") -> bytes:
+    """
+    Agrandit une image d'index (1 octet par pixel) : chaque cellule devient un
+    carré de cell_size pixels ; prefix est ajouté au début de chaque ligne
+    (octet de filtre des PNG)
+    """
+    if cell_size > 1:
+        for value in range(4):
+            pixels = pixels.replace(bytes((value,)), bytes((value,)) * cell_size)
+    row = width * cell_size
+    return b"".join((prefix + pixels[y * row:(y + 1) * row]) * cell_size for y in range(height))
+
+
+# ============================================================================
+# PNG
+# ============================================================================
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def encode_png(state, width: int, height: int, cell_size: int = 1, palette="classic",
+               previous=None, level: int = 1) -> bytes:
+    """Image PNG à palette d'un état (previous : pour les palettes à 4 couleurs)"""
+    colours = get_palette(palette)
+    if len(colours) == 2:
+        previous = None
+    elif previous is None:
+        previous = state            # pas d'état précédent : tout est « survivant » ou mort
+    pixels = state_pixels(state, previous)
+    raw = scale_pixels(pixels, width, height, cell_size, prefix=b"\x00")
+    header = struct.pack(">IIBBBBB", width * cell_size, height * cell_size, 8, 3, 0, 0, 0)
+    return (_PNG_SIGNATURE
+            + _png_chunk(b"IHDR", header)
+            + _png_chunk(b"PLTE", bytes(channel for colour in colours for channel in colour))
+            + _png_chunk(b"IDAT", zlib.compress(raw, level))
+            + _png_chunk(b"IEND", b""))
+
+
+def write_png(path: str, state, width: int, height: int, **options):
+    """Écrit l'image PNG d'un état (options : voir encode_png)"""
+    with open(path, "wb") as file:
+        file.write(encode_png(state, width, height, **options))
+
+
+def save_png(model, path: str, **options):
+    """Écrit l'image PNG de l'état courant d'un modèle (ou d'un LivePlayer)"""
+    write_png(path, model.get_state(), model.matrix_width, model.matrix_height, **options)
+
+
+# ============================================================================
+# GIF animé
+# ============================================================================
+
+
+def encode_lzw(pixels) -> bytes:
+    """
+    Données LZW d'une image GIF (taille minimale des codes : 2) sans
+    compression : clear, p0, p1, clear, p2, p3... Le dictionnaire n'atteint
+    jamais 8 entrées, les codes restent sur 3 bits : 9 bits par paire de
+    pixels, soit 9 octets par groupe de 16 pixels.
+    """
+    total = len(pixels)
+    full = total - total % 16
+    groups = full // 16
+    pairs = int.from_bytes(pixels[0:full:2], "little") + 4 * int.from_bytes(pixels[1:full:2], "little")
+    codes = pairs.to_bytes(full // 2, "little").translate(_PAIR_CODES)
+
+    # le code i = 8g + k commence au bit 72g + 9k = 8 * (9g + k) + k
+    packed = 0
+    for k in range(8):
+        spread = bytearray(9 * groups)
+        spread[k::9] = codes[k::8]
+        packed |= int.from_bytes(spread, "little") << k
+    data = packed.to_bytes(9 * groups, "little")
+
+    # fin (moins de 16 pixels) et code de fin, bit par bit
+    bits = count = 0
+    for start in range(full, total, 2):
+        pair = pixels[start:start + 2]
+        code = _GIF_CLEAR | pair[0] << 3 | (pair[1] << 6 if len(pair) == 2 else 0)
+        bits |= code << count
+        count += 3 + 3 * len(pair)
+    bits |= _GIF_END << count
+    count += 3
+    return data + bits.to_bytes((count + 7) // 8, "little")
+
+
+def _sub_blocks(data: bytes) -> bytes:
+    """Découpe en blocs de 255 octets au plus, terminés par un bloc vide"""
+    return b"".join(bytes((len(data[i:i + 255]),)) + data[i:i + 255]
+                    for i in range(0, len(data), 255)) + b"\x00"
+
+
+class GifWriter:
+    """
+    Écrit un GIF animé image par image
+    Chaque image ne contient que les lignes entre la première et la dernière
+    qui ont changé (les autres restent affichées) : une animation où peu de
+    cellules bougent reste petite et rapide à écrire
+    """
+
+    def __init__(self, path: str, width: int, height: int, cell_size: int = 1, palette="classic",
+                 delay: int = 10, loop: int = 0):
+        """
+        :param width, height: taille de la grille (en cellules)
+        :param delay: durée d'une image en centièmes de seconde
+        :param loop: nombre de répétitions (0 = en boucle)
+        """
+        self._width = width
+        self._height = height
+        self._cell_size = cell_size
+        self._colours = get_palette(palette)
+        self._delay = delay
+        self._frames = 0
+        self._last_pixels = None
+        self._last_state = None
+        self._file = open(path, "wb")
+
+        colours = self._colours + ((0, 0, 0),) * (4 - len(self._colours))
+        # écran logique : table de couleurs globale de 4 entrées (0xF1)
+        self._file.write(b"GIF89a" + struct.pack("<HHBBB", width * cell_size, height * cell_size, 0xF1, 0, 0)
+                         + bytes(channel for colour in colours for channel in colour)
+                         + b"\x21\xff\x0bNETSCAPE2.0\x03\x01" + struct.pack("<H", loop) + b"\x00")
+
+    @property
+    def frames(self):
+        """Nombre d'images écrites"""
+        return self._frames
+
+    def add_frame(self, state, previous=None):
+        """
+        Ajoute l'état comme image suivante
+        :param previous: état précédent pour les palettes à 4 couleurs (défaut : la
+            dernière image ajoutée)
+        """
+        if len(self._colours) == 4:
+            if previous is None:
+                previous = self._last_state if self._last_state is not None else state
+            self._last_state = bytes(state)
+            pixels = state_pixels(state, previous)
+        else:
+            pixels = bytes(state)
+
+        top, bottom = 0, self._height
+        if self._last_pixels is not None:
+            top, bottom = self._changed_rows(pixels)
+        self._last_pixels = pixels
+
+        width, size = self._width, self._cell_size
+        region = scale_pixels(pixels[top * width:bottom * width], width, bottom - top, size)
+        self._file.write(b"\x21\xf9\x04" + struct.pack("<BHB", 0x04, self._delay, 0) + b"\x00"   # ne pas effacer
+                         + b"\x2c" + struct.pack("<HHHHB", 0, top * size, width * size, (bottom - top) * size, 0)
+                         + b"\x02" + _sub_blocks(encode_lzw(region)))
+        self._frames += 1
+
+    def _changed_rows(self, pixels) -> tuple:
+        """Lignes [début, fin) qui diffèrent de l'image précédente (au moins une ligne)"""
+        changed = (int.from_bytes(pixels, "little")
+                   ^ int.from_bytes(self._last_pixels, "little")).to_bytes(len(pixels), "little")
+        last = len(changed.rstrip(b"\x00"))
+        if not last:
+            return 0, 1         # rien n'a changé : image d'une ligne, pour garder le rythme
+        first = len(changed) - len(changed.lstrip(b"\x00"))
+        return first // self._width, (last - 1) // self._width + 1
+
+    def close(self):
+        if not self._file.closed:
+            self._file.write(b"\x3b")
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ============================================================================
+# Export d'une simulation (suite d'états)
+# ============================================================================
+
+
+def model_states(model, generations: int, stride: int = 1):
+    """État courant puis un état toutes les stride générations (fait avancer le modèle)"""
+    yield model.get_state()
+    for generation in range(1, generations + 1):
+        model.next_generation()
+        if generation % stride == 0:
+            yield model.get_state()
+
+
+def player_states(player, stride: int = 1):
+    """États d'un enregistrement (LivePlayer), une image sur stride, depuis l'image courante"""
+    yield player.get_state()
+    while True:
+        for _ in range(stride):
+            if not player.step():
+                return
+        yield player.get_state()
+
+
+def export_states(states, path: str, width: int, height: int, fmt: str = None, cell_size: int = 1,
+                  palette="classic", delay: int = 10, level: int = 1) -> int:
+    """
+    Exporte une suite d'états
+    :param fmt: "gif" (une animation) ou "png" (un dossier d'images frame_00000.png...) ;
+        par défaut d'après l'extension de path
+    :return: nombre d'images écrites
+    """
+    fmt = fmt or ("gif" if path.lower().endswith(".gif") else "png")
+    if fmt == "gif":
+        with GifWriter(path, width, height, cell_size, palette, delay) as writer:
+            for state in states:
+                writer.add_frame(state)
+            return writer.frames
+    if fmt != "png":
+        raise ValueError(f"Format inconnu : {fmt} (gif ou png)")
+
+    os.makedirs(path, exist_ok=True)
+    count, previous = 0, None
+    for state in states:
+        write_png(os.path.join(path, f"frame_{count:05d}.png"), state, width, height,
+                  cell_size=cell_size, palette=palette, previous=previous, level=level)
+        count, previous = count + 1, state
+    return count
+
+
+def export_model(model, path: str, generations: int, stride: int = 1, **options) -> int:
+    """Simule generations générations et exporte un état toutes les stride générations"""
+    return export_states(model_states(model, generations, stride), path,
+                         model.matrix_width, model.matrix_height, **options)
+
+
+def export_player(player, path: str, stride: int = 1, **options) -> int:
+    """Exporte un enregistrement (LivePlayer) depuis son image courante"""
+    return export_states(player_states(player, stride), path,
+                         player.matrix_width, player.matrix_height, **options)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export PNG / GIF d'une simulation du Jeu de la Vie")
+    parser.add_argument("out", help="fichier .gif ou dossier d'images PNG")
+    parser.add_argument("--replay", help="exporter un enregistrement (.liferec) au lieu d'une soupe")
+    parser.add_argument("--size", type=int, default=200)
+    parser.add_argument("--density", type=float, default=25)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rule", default=CONWAY_RULE)
+    parser.add_argument("--generations", type=int, default=200)
+    parser.add_argument("--stride", type=int, default=1)
+    parser.add_argument("--cell-size", type=int, default=2)
+    parser.add_argument("--palette", default="classic", choices=sorted(PALETTES))
+    parser.add_argument("--delay", type=int, default=10, help="centièmes de seconde par image")
+    args = parser.parse_args(argv)
+
+    options = {"cell_size": args.cell_size, "palette": args.palette, "delay": args.delay}
+    start = time.perf_counter()
+    if args.replay:
+        from liverecord import LivePlayer
+        player = LivePlayer(args.replay)
+        frames = export_player(player, args.out, args.stride, **options)
+        player.close()
+    else:
+        model = LiveModel(args.size, args.size, 1, rule=args.rule)
+        model.set_strategy(RandomStrategy(args.density, seed=args.seed))
+        model.apply_strategy()
+        frames = export_model(model, args.out, args.generations, args.stride, **options)
+    print(f"{frames} images écrites dans {args.out} en {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
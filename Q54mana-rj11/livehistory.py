@@ -0,0 +1,180 @@
+"""
+Module livehistory.py
+Historique des générations pour revenir en arrière (step_back / rewind)
+
+- Pour chaque génération, on garde la liste des cellules qui ont changé
+  (différence inverse) : revenir d'une génération = réinverser ces cellules,
+  le coût dépend du nombre de changements, pas de la taille de la grille ;
+  si le modèle donne ces cellules (changes), l'enregistrement aussi
+- Toutes les keyframe_interval générations, on garde aussi l'état complet
+  compressé (image clé)
+- Quand le budget mémoire est dépassé, les différences les plus anciennes sont
+  oubliées : le passé lointain ne reste accessible que par les images clés,
+  elles-mêmes espacées (une sur deux supprimée) si besoin
+
+L'historique ne connaît pas le modèle : LiveModel.step_back / rewind
+appliquent ce qu'il renvoie.
+"""
+
+import zlib
+from array import array
+from collections import deque
+
+from livedelta import changed_indices
+
+_ENTRY_OVERHEAD = 100   # octets estimés par entrée (tuple + array)
+
+
+class LiveHistory:
+    """Historique borné en mémoire (différences inverses + images clés)"""
+
+    def __init__(self, memory_budget: int = 16 * 1024 * 1024, keyframe_interval: int = 50, level: int = 1):
+        self._memory_budget = memory_budget
+        self._keyframe_interval = keyframe_interval
+        self._level = level
+        self._deltas = deque()      # (numéro d'étape, génération d'avant, indices qui changent)
+        self._keyframes = deque()   # (numéro d'étape, génération, état compressé)
+        self._memory = 0
+        self._tick = 0              # numéro de l'étape courante (augmente à chaque génération)
+        self._generation = 0
+        self._last = None           # état de l'étape courante
+
+    @property
+    def memory_budget(self):
+        return self._memory_budget
+
+    @property
+    def memory_used(self):
+        """Mémoire estimée des différences et des images clés (octets)"""
+        return self._memory
+
+    @property
+    def last(self):
+        """État de l'étape courante (celui que le modèle doit avoir)"""
+        return self._last
+
+    @property
+    def generation(self):
+        """Génération de l'étape courante"""
+        return self._generation
+
+    def exact_steps(self) -> int:
+        """Nombre de générations accessibles une par une (sans passer par une image clé)"""
+        return len(self._deltas)
+
+    def keyframe_generations(self) -> list:
+        return [generation for _tick, generation, _data in self._keyframes]
+
+    def reset(self, state, generation: int):
+        """Oublie tout et repart de cet état (image clé)"""
+        self._deltas.clear()
+        self._keyframes.clear()
+        self._memory = 0
+        self._tick = 0
+        self._generation = generation
+        self._last = bytearray(state)
+        self._add_keyframe()
+
+    def record(self, state, generation: int, previous=None, previous_generation: int = None, changes=None):
+        """
+        Nouvelle génération : on garde la différence pour pouvoir revenir
+        :param previous: état juste avant la génération ; s'il diffère du dernier état
+            connu (clics, stratégie...), ces modifications sont une étape à part
+        :param changes: index des cellules changées par la génération, si l'appelant
+            les connaît et que l'état d'avant est le dernier état connu : ni
+            comparaison ni copie de la grille
+        """
+        if self._last is None or len(state) != len(self._last):
+            self.reset(state, generation)       # grille redimensionnée : nouveau départ
+            return
+        if changes is not None:
+            indices = array("I", changes)
+            last = self._last
+            for index in indices:
+                last[index] ^= 1
+            self._append(indices, generation)
+        else:
+            if previous is not None and previous != self._last:
+                self._push(previous, previous_generation)
+            self._push(state, generation)
+        self._thin()
+
+    def _push(self, state, generation: int):
+        indices = array("I", changed_indices(self._last, state))
+        self._last[:] = state       # même taille (vérifié par record) : copie sur place
+        self._append(indices, generation)
+
+    def _append(self, indices, generation: int):
+        """Garde la différence de l'étape qui vient d'avoir lieu (self._last est déjà à jour)"""
+        self._tick += 1
+        self._deltas.append((self._tick, self._generation, indices))
+        self._memory += indices.itemsize * len(indices) + _ENTRY_OVERHEAD
+        self._generation = generation
+        if self._tick % self._keyframe_interval == 0:
+            self._add_keyframe()
+
+    def pop_delta(self):
+        """
+        Recule d'une génération grâce à la dernière différence
+        :return: (génération d'avant, indices à inverser) ou None si plus de différence
+        """
+        if not self._deltas:
+            return None
+        tick, generation, indices = self._deltas.pop()
+        self._memory -= indices.itemsize * len(indices) + _ENTRY_OVERHEAD
+        last = self._last
+        for index in indices:
+            last[index] ^= 1
+        self._tick = tick - 1
+        self._generation = generation
+        self._drop_future_keyframes()
+        return generation, indices
+
+    def pop_to_keyframe(self, steps: int):
+        """
+        Recule de steps étapes par les images clés (passé lointain, sans différences) :
+        on va à l'image clé la plus récente avant la cible, ou à la plus ancienne
+        :return: (génération, état, nb d'étapes reculées) ou None si impossible
+        """
+        target = self._tick - steps
+        older = [keyframe for keyframe in self._keyframes if keyframe[0] < self._tick]
+        if not older:
+            return None
+        before = [keyframe for keyframe in older if keyframe[0] <= target]
+        tick, generation, data = before[-1] if before else older[0]
+        went = self._tick - tick
+        self._deltas.clear()        # (déjà vide dans le cas normal)
+        self._tick = tick
+        self._generation = generation
+        self._last = bytearray(zlib.decompress(data))
+        self._drop_future_keyframes()
+        self._memory = sum(len(data) + _ENTRY_OVERHEAD for _t, _g, data in self._keyframes)
+        return generation, bytes(self._last), went
+
+    def _add_keyframe(self):
+        data = zlib.compress(self._last, self._level)
+        self._keyframes.append((self._tick, self._generation, data))
+        self._memory += len(data) + _ENTRY_OVERHEAD
+
+    def _drop_future_keyframes(self):
+        """Les images clés après l'étape courante n'existent plus (on a reculé)"""
+        while self._keyframes and self._keyframes[-1][0] > self._tick:
+            _tick, _generation, data = self._keyframes.pop()
+            self._memory -= len(data) + _ENTRY_OVERHEAD
+
+    def _thin(self):
+        """Respecte le budget : oublie les vieilles différences, puis espace les images clés"""
+        while self._memory > self._memory_budget and self._deltas:
+            _tick, _generation, indices = self._deltas.popleft()
+            self._memory -= indices.itemsize * len(indices) + _ENTRY_OVERHEAD
+        while self._memory > self._memory_budget and len(self._keyframes) > 1:
+            kept = list(self._keyframes)
+            # on garde toujours la plus récente ; une sur deux parmi les autres
+            thinned = kept[-2::-2][::-1] + [kept[-1]] if len(kept) > 2 else kept[1:]
+            self._keyframes = deque(thinned)
+            self._memory = (sum(len(data) + _ENTRY_OVERHEAD for _t, _g, data in self._keyframes)
+                            + sum(i.itemsize * len(i) + _ENTRY_OVERHEAD for _t, _g, i in self._deltas))
+
+    def __str__(self):
+        return (f"LiveHistory({len(self._deltas)} générations exactes, {len(self._keyframes)} images clés, "
+                f"{self._memory} / {self._memory_budget} octets)")
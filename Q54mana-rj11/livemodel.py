@@ -1,11 +1,157 @@
 import random
+import time
 from abc import ABC, abstractmethod
+from array import array
+from collections import deque
+from contextlib import contextmanager
+
+from livedelta import changed_indices
+from livehistory import LiveHistory
+
+# Rectangle des vivantes pas encore calculé (None = grille vide)
+_UNKNOWN_BOX = object()
 
 # ============================================================================
 # PATTERN STRATEGY : Stratégies de configuration
 # ============================================================================
 
 
+# Positions du canon à planeurs de Gosper (x, y)
+CANON_POSITIONS = [
+    (0, 5), (0, 6), (1, 5), (1, 6),
+    (10, 5), (10, 6), (10, 7),
+    (11, 4), (11, 8),
+    (12, 3), (12, 9),
+    (13, 3), (13, 9),
+    (14, 6),
+    (15, 4), (15, 8),
+    (16, 5), (16, 6), (16, 7),
+    (17, 6),
+    (20, 3), (20, 4), (20, 5),
+    (21, 3), (21, 4), (21, 5),
+    (22, 2), (22, 6),
+    (24, 1), (24, 2), (24, 6), (24, 7),
+    (34, 3), (34, 4),
+    (35, 3), (35, 4)
+]
+
+# Motifs prédéfinis pour LiveModel.stamp() : liste de (dx, dy)
+PATTERNS = {
+    "block": [(0, 0), (1, 0), (0, 1), (1, 1)],
+    "blinker": [(0, 0), (1, 0), (2, 0)],
+    "glider": [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)],
+    "r_pentomino": [(1, 0), (2, 0), (0, 1), (1, 1), (1, 2)],
+    "glider_gun": CANON_POSITIONS,
+}
+
+# Les 8 symétries du carré (rotations et réflexions) : (dx, dy) -> (dx', dy')
+TRANSFORMS = {
+    "identity": lambda dx, dy: (dx, dy),
+    "rot90": lambda dx, dy: (-dy, dx),
+    "rot180": lambda dx, dy: (-dx, -dy),
+    "rot270": lambda dx, dy: (dy, -dx),
+    "flip_x": lambda dx, dy: (-dx, dy),
+    "flip_y": lambda dx, dy: (dx, -dy),
+    "transpose": lambda dx, dy: (dy, dx),
+    "anti_transpose": lambda dx, dy: (-dy, -dx),
+}
+
+
+def transform_pattern(pattern, transform: str = "identity") -> list:
+    """
+    Applique une rotation / réflexion à un motif, puis le recale
+    pour que son coin haut-gauche soit en (0, 0)
+    """
+    if transform not in TRANSFORMS:
+        raise ValueError(f"Transformation inconnue : {transform}")
+    moved = [TRANSFORMS[transform](dx, dy) for dx, dy in pattern]
+    if not moved:
+        return []
+    min_x = min(dx for dx, _ in moved)
+    min_y = min(dy for _, dy in moved)
+    return [(dx - min_x, dy - min_y) for dx, dy in moved]
+
+
+# Table : octet -> 8 cellules (1 octet par cellule, bit de poids faible en premier)
+_BYTE_TO_CELLS = [bytes((value >> bit) & 1 for bit in range(8)) for value in range(256)]
+
+
+CONWAY_RULE = "B3/S23"
+
+
+def parse_rule(rule: str) -> tuple:
+    """
+    Lit une règle au format "B3/S23" (naissance / survie)
+    :return: (ensemble des nb de voisins pour naître, ensemble pour survivre)
+    """
+    try:
+        birth, survival = rule.upper().split("/")
+        if not (birth.startswith("B") and survival.startswith("S")):
+            raise ValueError
+        born = {int(digit) for digit in birth[1:]}
+        survive = {int(digit) for digit in survival[1:]}
+    except ValueError:
+        raise ValueError(f"Règle invalide : {rule} (format attendu : B3/S23)") from None
+    if not born | survive <= set(range(9)):
+        raise ValueError(f"Règle invalide : {rule} (voisins de 0 à 8)")
+    return born, survive
+
+
+def rule_table(rule: str) -> bytes:
+    """
+    Table des règles : clé = nb de voisins + 9 * état (0 morte, 1 vivante) -> nouvel état
+    Conway (B3/S23) : une morte naît avec 3 voisins, une vivante survit avec 2 ou 3
+    """
+    born, survive = parse_rule(rule)
+    return bytes(
+        1 if (key < 9 and key in born) or (9 <= key < 18 and key - 9 in survive) else 0
+        for key in range(256)
+    )
+
+
+def flip_table(table: bytes) -> bytes:
+    """Table clé (nb de voisins + 9 * état) -> 1 si la cellule change d'état, 0 sinon"""
+    return bytes(new ^ (key >= 9) for key, new in enumerate(table))
+
+
+def random_mask(total: int, alive_count: int, rng: random.Random) -> bytearray:
+    """
+    Tire un masque d'occupation de `total` cellules dont exactement
+    `alive_count` vivantes (1 octet par cellule : 1 = vivante)
+
+    1. chaque cellule est vivante avec une probabilité ~ alive_count / total,
+       en combinant quelques grands entiers aléatoires (getrandbits) bit à bit
+    2. on corrige ensuite l'écart (quelques cellules) pour tomber pile sur
+       alive_count ; par symétrie le résultat reste uniforme
+    """
+    alive_count = max(0, min(alive_count, total))
+    if alive_count == total:
+        return bytearray(b"\x01" * total)
+
+    # probabilité sur 8 bits : on traite les bits de poids faible en premier
+    # (bit à 1 : mask | r => p = (1 + p) / 2, bit à 0 : mask & r => p = p / 2)
+    level = alive_count * 256 // total
+    mask = 0
+    for bit in range(8):
+        bits = rng.getrandbits(total)
+        mask = (mask | bits) if (level >> bit) & 1 else (mask & bits)
+
+    packed = mask.to_bytes((total + 7) // 8, "little")
+    state = bytearray(b"".join(map(_BYTE_TO_CELLS.__getitem__, packed)))
+    del state[total:]
+
+    # correction : ajouter ou retirer des cellules tirées au hasard
+    missing = alive_count - mask.bit_count()
+    wanted = 1 if missing > 0 else 0
+    missing = abs(missing)
+    while missing:
+        index = rng.randrange(total)
+        if state[index] != wanted:
+            state[index] = wanted
+            missing -= 1
+    return state
+
+
 class ConfigStrategy(ABC):
     """Classe abstraite pour les différentes stratégies de config"""
 
@@ -15,20 +161,27 @@ class ConfigStrategy(ABC):
         pass
 
 class RandomStrategy(ConfigStrategy):
-    """Config aléatoire avec un pourcentage de cellules vivantes"""
+    """Config aléatoire avec un pourcentage de cellules vivantes
 
-    def __init__(self, percentage=25):
+    Le tirage se fait en un seul bloc (masque d'occupation) à partir d'un
+    générateur initialisé avec `seed` : même graine => même suite de soupes
+    """
+
+    def __init__(self, percentage=25, seed=None):
         self.percentage = percentage
+        self.seed = seed
+        self._rng = random.Random(seed)
+
+    def reseed(self, seed=None):
+        """Réinitialise le générateur (seed=None : graine aléatoire)"""
+        self.seed = seed
+        self._rng = random.Random(seed)
 
     def apply(self, model):
-        """Place aléatoirement des cellules vivantes"""
-        model.reset_all_cells()
+        """Place aléatoirement des cellules vivantes (une seule écriture en bloc)"""
         total_cells = model.matrix_width * model.matrix_height
         alive_count = int(total_cells * self.percentage / 100)
-        cells_list = list(model.get_all_cells())
-        alive_cells = random.sample(cells_list, alive_count)
-        for cell in alive_cells:
-            cell.set_alive(True)
+        model.load_state(random_mask(total_cells, alive_count, self._rng))
 
 class CanonStrategy(ConfigStrategy):
     """Config avec un canon à planeurs"""
@@ -36,28 +189,7 @@ class CanonStrategy(ConfigStrategy):
     def apply(self, model):
         """Place le caon à planeurs classique"""
         model.reset_all_cells()
-        # Positions du canon à planeurs
-        canon_positions = [
-            (0, 5), (0, 6), (1, 5), (1, 6),
-            (10, 5), (10, 6), (10, 7),
-            (11, 4), (11, 8),
-            (12, 3), (12, 9),
-            (13, 3), (13, 9),
-            (14, 6),
-            (15, 4), (15, 8),
-            (16, 5), (16, 6), (16, 7),
-            (17, 6),
-            (20, 3), (20, 4), (20, 5),
-            (21, 3), (21, 4), (21, 5),
-            (22, 2), (22, 6),
-            (24, 1), (24, 2), (24, 6), (24, 7),
-            (34, 3), (34, 4),
-            (35, 3), (35, 4)
-        ]
-        for x, y in canon_positions:
-            cell = model.get_cell(x, y)
-            if cell:
-                cell.set_alive(True)
+        model.stamp(PATTERNS["glider_gun"], 0, 0)
 
 class EmptyStrategy(ConfigStrategy):
     """Config vide (toutes les cellules sot mortes)"""
@@ -75,11 +207,17 @@ class LiveCell:
     """
     une cellule du jeu de la vie
     vivante/morte.. nb de voisins
+
+    Une cellule créée par le modèle ne stocke pas son état : elle lit et écrit
+    directement dans le buffer d'état du modèle (index y * largeur + x).
+    Une cellule créée seule (LiveCell(x, y)) garde son propre état.
     """
 
-    def __init__(self, x: int, y: int):
+    def __init__(self, x: int, y: int, model=None):
         self._x = x
         self._y = y
+        self._model = model
+        self._index = y * model.matrix_width + x if model is not None else 0
         self._state = False
         self._nb_neighbours = 0
         self._observers = []    # Liste des observers (pattern Observer)
@@ -95,7 +233,7 @@ class LiveCell:
 
     @property
     def state(self):
-        return self._state
+        return self.is_alive()
 
     @property
     def nb_neighbours(self):
@@ -103,12 +241,18 @@ class LiveCell:
 
     def is_alive(self) -> bool:
         """Retourne True si la cellule est vivante"""
-        return self._state
+        if self._model is None:
+            return self._state
+        return self._model._cells[self._index] == 1
 
     def set_alive(self, alive: bool):
         """Change l'état de la cellule et notifie les observers"""
-        old_state = self._state
-        self._state = alive
+        alive = bool(alive)
+        old_state = self.is_alive()
+        if self._model is None:
+            self._state = alive
+        else:
+            self._model._writable()[self._index] = alive
         # Notifier les observers si l'état a changé
         if old_state != alive:
             self._notify_observers()
@@ -119,7 +263,7 @@ class LiveCell:
 
     def toggle(self):
         """Inverse l'état de la cellule (vivant <-> morte)"""
-        self.set_alive(not self._state)
+        self.set_alive(not self.is_alive())
 
     # Pattern Observer
     def attach_observer(self, observer):
@@ -138,42 +282,115 @@ class LiveCell:
             observer.update(self)
 
     def __str__(self):
-        state_str = "vivante" if self._state else "morte"
+        state_str = "vivante" if self.is_alive() else "morte"
         return f"Cell{self._x}, {self._y}) - {state_str}"
 
 
 # ============================================================================
-# PATTERN SINGLETON : Modèle unique
+# VUE DE L'ÉTAT : lecture sans copie
+# ============================================================================
+
+
+class StateView:
+    """
+    État d'une grille en lecture seule, sans copie : un memoryview sur le
+    buffer (1 octet par cellule, index y * largeur + x) et la génération de
+    cet état
+    Même interface de lecture que LiveModel (matrix_width, matrix_height,
+    generation, get_state, count_alive_cells, get_cell, get_all_cells) : la vue
+    peut l'afficher directement
+    """
+
+    def __init__(self, buffer, width: int, height: int, generation: int):
+        self._buffer = memoryview(buffer).toreadonly()
+        self._width = width
+        self._height = height
+        self._generation = generation
+
+    @property
+    def buffer(self) -> memoryview:
+        return self._buffer
+
+    @property
+    def matrix_width(self):
+        return self._width
+
+    @property
+    def matrix_height(self):
+        return self._height
+
+    @property
+    def generation(self):
+        return self._generation
+
+    def state_view(self):
+        return self
+
+    def get_state(self) -> bytes:
+        """Copie de l'état (explicite)"""
+        return self._buffer.tobytes()
+
+    def count_alive_cells(self) -> int:
+        return int.from_bytes(self._buffer, "little").bit_count()    # 1 octet (0/1) par cellule
+
+    def get_cell(self, x: int, y: int) -> LiveCell:
+        """Cellule en lecture seule (copie)"""
+        if 0 <= x < self._width and 0 <= y < self._height:
+            cell = LiveCell(x, y)
+            cell.set_alive(self._buffer[y * self._width + x])
+            return cell
+        return None
+
+    def get_all_cells(self):
+        width = self._width
+        for index, value in enumerate(self._buffer):
+            cell = LiveCell(index % width, index // width)
+            cell.set_alive(value)
+            yield cell
+
+    def __str__(self):
+        return f"StateView({self._width}x{self._height}, gen={self._generation})"
+
+
+# ============================================================================
+# PATTERN SINGLETON : Modèle par défaut (d'autres univers restent possibles)
 # ============================================================================
 
 
 class LiveModel:
     """
-    Modèle principal du jeu de la vie (SINGLETON)
+    Modèle principal du jeu de la vie
     gère la grille de cellules et les règles du jeu
+
+    get_instance() renvoie le modèle par défaut de l'application (Singleton),
+    mais on peut créer d'autres modèles indépendants avec LiveModel(...)
+    (voir liveuniverse.UniverseManager)
     """
 
-    # Attribut de classe pour stocker l'unique instance
+    # Attribut de classe pour stocker l'instance par défaut
     _instance = None
 
+    # Mémoire par cellule : buffer d'état + pic pendant next_generation
+    BYTES_PER_CELL = 16
+
+    # Générations récentes dont l'état final est gardé (sans copie) pour changed_since
+    CHANGE_WINDOW = 8
+
     @classmethod
     def get_instance(cls, canvas_width=500, canvas_height=500, cell_size=10):
-        """Récupère l'instance unique du modèle (pattern Singleton)"""
+        """Récupère l'instance par défaut du modèle (pattern Singleton)"""
         if cls._instance is None:
             cls._instance = cls(canvas_width, canvas_height, cell_size)
         return cls._instance
 
-    def __init__(self, canvas_width: int, canvas_height: int, cell_size: int):
+    def __init__(self, canvas_width: int, canvas_height: int, cell_size: int, rule: str = CONWAY_RULE):
         """
-        Constructeur (devrait être appelé qu'une seule fois via get_instance)
+        Constructeur : chaque appel crée un univers indépendant
         :param canvas_width:
         :param canvas_height:
         :param cell_size:
+        :param rule: règle au format "B3/S23" (Conway par défaut)
         """
-        # protection Singleton
-        if LiveModel._instance is not None:
-            raise Exception("Cette classe est un Singleton ! Utilisez get_instance()")
-
         self._canvas_width = canvas_width
         self._canvas_height = canvas_height
         self._cell_size = cell_size
@@ -181,17 +398,71 @@ class LiveModel:
         self._matrix_width = canvas_width // cell_size
         self._matrix_height = canvas_height // cell_size
 
-        self._cells_matrix = []
+        # Buffer d'état : 1 octet par cellule (1 = vivante), index y * largeur + x
+        self._cells = bytearray(self._matrix_width * self._matrix_height)
+        # Centre en demi-cellules dans un repère fixe (voir _move_corner)
+        self._centre = (self._matrix_width, self._matrix_height)
+        # True quand le buffer est partagé avec une image figée (snapshot) :
+        # il sera recopié avant la prochaine écriture en place
+        self._shared = False
+        # Objets LiveCell créés à la demande (index -> cellule)
+        self._cell_objects = {}
         self._generation = 0
         self._running = False
 
+        # Règle du jeu (table de transition utilisée par next_generation)
+        self._rule_table = rule_table(rule)
+        self._flip_table = flip_table(self._rule_table)
+        self._rule = rule.upper()
+
         # Stratégie actuelle (pattern Strategy)
         self._current_strategy = None
 
         # Référence au compteur (observer)
         self._counter = None
 
-        self._init_matrix()
+        # Observers du modèle : reçoivent un seul événement par écriture en bloc
+        self._observers = []
+        self._batch_depth = 0
+        self._batch_changes = [0, 0]    # [naissances, morts] en attente
+
+        # Observers des générations : reçoivent le nouvel état après chaque next_generation
+        self._generation_observers = []
+
+        # Historique pour revenir en arrière (None = désactivé, voir enable_history) ;
+        # _history_edits : _edits quand l'état était celui de l'historique
+        self._history = None
+        self._history_edits = 0
+
+        # Profileur optionnel des phases (None = désactivé)
+        self._profiler = None
+
+        # Index des changements : (génération, état final de cette génération)
+        # pour les dernières générations passées ; ce sont les anciens buffers
+        # de next_generation, plus jamais modifiés : gardés sans copie
+        self._marks = deque(maxlen=self.CHANGE_WINDOW)
+        # Pour chaque génération calculée : [génération, nb d'écritures à ce
+        # moment, cellules changées (données par le noyau, ou relues dans les
+        # états gardés à la première demande)] ; _edits compte les écritures
+        # hors générations (clics, motifs, retours...) : tant qu'il ne bouge
+        # pas, les changements se lisent dans ces rectangles, sans parcourir
+        # toute la grille
+        self._steps = deque(maxlen=self.CHANGE_WINDOW)
+        self._edits = 0
+        self._next_flips = None
+
+        # Rectangle des cellules vivantes (voir live_box) : tenu à jour par
+        # next_generation, à recalculer (_UNKNOWN_BOX) après une écriture
+        self._box = None
+        self._next_box = _UNKNOWN_BOX
+
+        # Buffers réutilisés par next_generation (pas d'allocation par génération) :
+        # anciens buffers sortis de _marks, jamais confiés à un snapshot (_pinned : id
+        # des buffers de _marks qui l'ont été) ; clés et zéros préalloués
+        self._spare = []
+        self._pinned = set()
+        self._keys = bytearray()
+        self._zeros = bytearray()
 
     @property
     def canvas_width(self):
@@ -222,13 +493,253 @@ class LiveModel:
     def running(self):
         return self._running
 
+    @property
+    def rule(self):
+        return self._rule
+
+    def set_rule(self, rule: str):
+        """Change la règle du jeu (ex : "B36/S23" pour HighLife)"""
+        self._rule_table = rule_table(rule)
+        self._flip_table = flip_table(self._rule_table)
+        self._rule = rule.upper()
+
+    def get_state(self) -> bytes:
+        """Copie de l'état de la grille (1 octet par cellule, index y * largeur + x)"""
+        return bytes(self._cells)
+
+    def state_view(self) -> StateView:
+        """
+        État courant sans copie, en lecture seule : il suit les écritures en
+        place (clics, stratégies) tant que le modèle garde le même buffer ;
+        une génération, un redimensionnement ou une écriture après snapshot()
+        passent à un autre buffer (comparer generation pour savoir si la vue
+        est à jour ; un buffer quitté est réutilisé CHANGE_WINDOW générations
+        plus tard : pour garder un état, prendre snapshot())
+        """
+        return StateView(self._cells, self._matrix_width, self._matrix_height, self._generation)
+
+    def snapshot(self) -> StateView:
+        """
+        Image figée de l'état courant (pour un autre thread, un export...),
+        sans copie immédiate : le buffer est partagé et le modèle le recopie
+        avant sa prochaine écriture en place (copie à l'écriture)
+        """
+        self._shared = True
+        return self.state_view()
+
+    def changed_since(self, generation: int):
+        """
+        Indices (triés) des cellules dont l'état diffère de l'état final de la
+        génération donnée (clics compris) ; la génération courante n'a pas
+        encore d'état final : rien n'a changé depuis
+        :return: None si cet état n'est plus connu (trop ancien, autre taille,
+                 génération à venir) : tout est à considérer comme changé
+        """
+        if generation == self._generation:
+            return []
+        steps = [step for step in self._steps if step[0] >= generation]
+        if (steps and steps[0][0] == generation and len(steps) == self._generation - generation
+                and steps[0][1] == self._edits):
+            # que des générations depuis : réunion des changements de chacune
+            changes = self._steps_changes(steps)
+            if changes is not None:
+                return changes
+        for marked, state in self._marks:
+            if marked == generation:
+                if len(state) != len(self._cells):
+                    return None
+                return changed_indices(state, self._cells)
+        return None
+
+    @property
+    def edit_count(self) -> int:
+        """Nb d'écritures hors générations (clics, motifs, retours...) : s'il n'a pas bougé, seul next_generation a changé l'état"""
+        return self._edits
+
+    def _steps_changes(self, steps):
+        """Cellules changées par ces générations successives (sans écriture entre elles), None si inconnu"""
+        states = dict(self._marks)
+        changes = None
+        for step in steps:
+            generation, _edits, flips = step
+            if flips is None:
+                # moteur qui ne les donne pas : différence des états gardés
+                old = states.get(generation)
+                new = states.get(generation + 1) if generation + 1 < self._generation else self._cells
+                if not isinstance(old, (bytes, bytearray)) or not isinstance(new, (bytes, bytearray)) \
+                        or len(old) != len(new):
+                    return None
+                flips = step[2] = array("I", changed_indices(old, new))
+            if len(steps) == 1:
+                return sorted(flips)
+            changes = set(flips) if changes is None else changes.symmetric_difference(flips)
+        return sorted(changes)
+
+    def _changes_since_history(self):
+        """Cellules changées par la dernière génération si l'historique avait l'état d'avant, None sinon"""
+        if not self._steps or self._steps[-1][0] != self._generation - 1 \
+                or self._steps[-1][1] != self._history_edits:
+            return None
+        return self.changed_since(self._generation - 1)
+
+    def _forget_marks(self):
+        """La génération a reculé (retour arrière, remise à 0) : les états des générations suivantes ne sont plus le passé"""
+        generation = self._generation
+        while self._marks and self._marks[-1][0] >= generation:
+            self._recycle(self._marks.pop()[1])
+        while self._steps and self._steps[-1][0] >= generation:
+            self._steps.pop()
+
+    def _retire(self, cells):
+        """L'état final de la génération courante passe dans _marks ; le plus ancien en sort et est recyclé"""
+        if len(self._marks) == self._marks.maxlen:
+            self._recycle(self._marks[0][1])
+        if self._shared:
+            self._pinned.add(id(cells))     # une image figée le garde : jamais réutilisé
+        self._marks.append((self._generation, cells))
+
+    def _recycle(self, cells):
+        """Buffer qui n'est plus dans _marks : réutilisable sauf s'il a été confié à un snapshot"""
+        if id(cells) in self._pinned:
+            self._pinned.discard(id(cells))
+        elif type(cells) is bytearray and len(cells) == self._matrix_width * self._matrix_height:
+            self._spare.append(cells)
+
+    def _take_buffer(self) -> bytearray:
+        """Buffer d'état remis à zéro pour la génération suivante (recyclé si possible)"""
+        total = self._matrix_width * self._matrix_height
+        if len(self._zeros) != total:
+            self._zeros = bytearray(total)     # source bytearray : recopie sans tampon intermédiaire
+            self._spare = [cells for cells in self._spare if len(cells) == total]
+        if not self._spare:
+            return bytearray(total)
+        cells = self._spare.pop()
+        cells[:] = self._zeros
+        return cells
+
+    def _writable(self) -> bytearray:
+        """Buffer d'état à modifier en place (recopié d'abord s'il est partagé)"""
+        if self._shared:
+            self._cells = bytearray(self._cells)
+            self._shared = False
+        self._box = _UNKNOWN_BOX        # l'appelant va écrire : rectangle à recalculer
+        self._edits += 1
+        return self._cells
+
+    def live_box(self):
+        """
+        Plus petit rectangle qui contient toutes les cellules vivantes
+        Suivi génération après génération ; relu dans le buffer seulement
+        après une écriture (clic, motif...). La vue s'en sert pour ne pas
+        dessiner les zones vides.
+        :return: (x0, y0, x1, y1), x1 et y1 exclus ; None si la grille est vide
+        """
+        if self._box is _UNKNOWN_BOX:
+            self._box = self._scan_box(self._cells, 0, 0, self._matrix_width, self._matrix_height)
+        return self._box
+
+    def _forget_box(self):
+        """Le buffer a été remplacé sans passer par _writable : rectangle des vivantes à recalculer"""
+        self._box = _UNKNOWN_BOX
+
+    def _scan_box(self, cells, x0: int, y0: int, x1: int, y1: int):
+        """Rectangle des cellules vivantes de cells, cherchées dans le rectangle donné seulement"""
+        width = self._matrix_width
+        left, right, top, bottom = x1, x0, None, None
+        for y in range(y0, y1):
+            start = y * width
+            first = cells.find(1, start + x0, start + x1)
+            if first < 0:
+                continue
+            if top is None:
+                top = y
+            bottom = y + 1
+            left = min(left, first - start)
+            right = max(right, cells.rfind(1, start + x0, start + x1) - start + 1)
+        if top is None:
+            return None
+        return left, top, right, bottom
+
+    def _step_region(self):
+        """
+        Rectangle à calculer par next_generation : celui des vivantes agrandi
+        d'une cellule. S'il touche un bord, il déborde de l'autre côté du tore :
+        x0 (ou y0) vaut alors -1, x1 (ou y1) largeur + 1 ; toute la largeur (ou
+        hauteur) s'il n'est pas plus petit qu'elle.
+        None : aucune cellule ne peut changer
+        """
+        width, height = self._matrix_width, self._matrix_height
+        if self._rule_table[0]:
+            return 0, 0, width, height      # B0 : les cellules isolées naissent partout
+        box = self.live_box()
+        if box is None:
+            return None
+        x0, y0, x1, y1 = box
+        x0, x1 = (0, width) if x1 - x0 + 2 >= width else (x0 - 1, x1 + 1)
+        y0, y1 = (0, height) if y1 - y0 + 2 >= height else (y0 - 1, y1 + 1)
+        return x0, y0, x1, y1
+
     # Méthodes publiques
     def set_counter(self, counter):
-        """Définit le compteur (observer) et l'attache à toutes les cellules"""
+        """Définit le compteur (observer) et l'attache à toutes les cellules
+        (celles déjà créées ; les suivantes l'auront à leur création)"""
         self._counter = counter
-        for cell in self.get_all_cells():
+        self.attach_observer(counter)
+        for cell in self._cell_objects.values():
             cell.attach_observer(counter)
 
+    def attach_observer(self, observer):
+        """
+        Attache un observer au modèle
+        Il reçoit observer.update_many(model, born, died) après chaque
+        écriture en bloc (un seul événement, quel que soit le nb de cellules)
+        """
+        if observer not in self._observers:
+            self._observers.append(observer)
+
+    def detach_observer(self, observer):
+        """Détache un observer du modèle"""
+        if observer in self._observers:
+            self._observers.remove(observer)
+
+    def attach_generation_observer(self, observer):
+        """
+        Attache un observer des générations
+        Il reçoit observer.update_generation(model, state) à la fin de chaque
+        next_generation (state : nouvel état, 1 octet par cellule, à ne pas modifier ;
+        le buffer sera réutilisé par une génération suivante : le copier pour le garder)
+        """
+        if observer not in self._generation_observers:
+            self._generation_observers.append(observer)
+
+    def detach_generation_observer(self, observer):
+        """Détache un observer des générations"""
+        if observer in self._generation_observers:
+            self._generation_observers.remove(observer)
+
+    @contextmanager
+    def batch(self):
+        """
+        Regroupe plusieurs écritures en bloc en un seul événement :
+            with model.batch():
+                model.reset_all_cells()
+                model.stamp(...)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                born, died = self._batch_changes
+                self._batch_changes = [0, 0]
+                if born or died:
+                    self._notify_bulk(born, died)
+
+    def set_profiler(self, profiler):
+        """Branche (ou débranche avec None) le profileur des phases"""
+        self._profiler = profiler
+
     def set_strategy(self, strategy: ConfigStrategy):
         """Définit la stratégie de configuration actuelle"""
         self._current_strategy = strategy
@@ -236,37 +747,236 @@ class LiveModel:
     def apply_strategy(self):
         """Apllique la stratégie de configuration actuelle"""
         if self._current_strategy:
-            self._current_strategy.apply(self)
+            # Un seul événement pour toute la config (le compteur suit
+            # les naissances/morts, pas besoin de tout recompter)
+            with self.batch():
+                self._current_strategy.apply(self)
             self._generation = 0
-            # Recompter les cellules après config
-            if self._counter:
-                self._counter.count_all(self)
+            self._forget_marks()
 
     def get_cell(self, x: int, y: int) -> LiveCell:
         """Récupère une cellule à une position donnée"""
         if 0 <= x < self._matrix_width and 0 <= y < self._matrix_height:
-            return self._cells_matrix[y][x]
+            index = y * self._matrix_width + x
+            cell = self._cell_objects.get(index)
+            if cell is None:
+                cell = self._cell_objects[index] = self._create_cell(x, y)
+            return cell
         return None
 
     def get_all_cells(self):
         """Générateur qui yield toutes les cellules"""
-        for row in self._cells_matrix:
-            for cell in row:
-                yield cell
+        for y in range(self._matrix_height):
+            for x in range(self._matrix_width):
+                yield self.get_cell(x, y)
+
+    def load_state(self, state):
+        """
+        Remplace tout l'état de la grille en une seule écriture
+        :param state: octets (1 = vivante, 0 = morte), index y * largeur + x
+        """
+        if len(state) != len(self._cells):
+            raise ValueError(f"{len(state)} cellules reçues, {len(self._cells)} attendues")
+        # 1 octet (0/1) par cellule : le nb de bits à 1 = nb de cellules
+        old = int.from_bytes(self._cells, "little")
+        new = int.from_bytes(state, "little")
+        self._writable()[:] = state
+        self._changed((new & ~old).bit_count(), (old & ~new).bit_count())
+
+    def resize(self, width: int, height: int, anchor: str = "topleft"):
+        """
+        Change la taille de la grille sans perdre le motif en cours
+        Le buffer est réalloué une seule fois et l'ancien état y est recopié
+        ligne par ligne. Génération, compteur et observers sont conservés.
+        :param anchor: "topleft" (coin haut-gauche fixe) ou "center" (motif centré)
+        """
+        if width <= 0 or height <= 0:
+            raise ValueError("La grille doit avoir au moins une cellule")
+        if anchor not in ("topleft", "center"):
+            raise ValueError(f"Ancrage inconnu : {anchor}")
+        old_width, old_height = self._matrix_width, self._matrix_height
+        if (width, height) == (old_width, old_height):
+            return
+
+        # Décalage de l'ancien contenu dans la nouvelle grille
+        (left, top), (new_left, new_top) = self._move_corner(width, height, anchor)
+        dx, dy = left - new_left, top - new_top
+
+        old_cells = self._cells
+        new_cells = bytearray(width * height)
+        x0, x1 = max(0, -dx), min(old_width, width - dx)
+        for y in range(max(0, -dy), min(old_height, height - dy)):
+            if x0 < x1:
+                start = (y + dy) * width + x0 + dx
+                new_cells[start:start + x1 - x0] = old_cells[y * old_width + x0:y * old_width + x1]
+
+        lost = old_cells.count(1) - new_cells.count(1)
+        self._cells = new_cells
+        self._shared = False
+        self._forget_box()
+        self._edits += 1
+        self._matrix_width, self._matrix_height = width, height
+        self._canvas_width = width * self._cell_size
+        self._canvas_height = height * self._cell_size
+        # Les objets LiveCell sont liés à un index : ils seront recréés à la demande
+        self._cell_objects = {}
+        # L'historique ne traverse pas un changement de taille
+        if self._history is not None:
+            self._reset_history()
+        self._changed(0, lost)
+
+    def _move_corner(self, width: int, height: int, anchor: str) -> tuple:
+        """
+        Coin haut-gauche de la grille avant et après le redimensionnement, dans
+        un repère fixe : ((x, y) d'avant, (x, y) d'après)
+        Le centre y est gardé en demi-cellules (2 * bord + taille) : une suite de
+        redimensionnements centrés (fenêtre tirée à la souris) arrive au même
+        endroit qu'un seul, sans dérive d'arrondi
+        """
+        cx, cy = self._centre
+        before = ((cx - self._matrix_width) // 2, (cy - self._matrix_height) // 2)
+        if anchor == "center":
+            return before, ((cx - width) // 2, (cy - height) // 2)
+        self._centre = (2 * before[0] + width, 2 * before[1] + height)
+        return before, before
+
+    def set_many(self, coords, alive: bool = True) -> int:
+        """
+        Met toutes les cellules (x, y) de coords dans l'état alive
+        (positions hors grille ignorées), un seul événement à la fin
+        :return: nombre de cellules modifiées
+        """
+        value = 1 if alive else 0
+        width, height = self._matrix_width, self._matrix_height
+        cells = self._writable()
+        changed = 0
+        for x, y in coords:
+            if 0 <= x < width and 0 <= y < height:
+                index = y * width + x
+                if cells[index] != value:
+                    cells[index] = value
+                    changed += 1
+        self._changed(changed if alive else 0, 0 if alive else changed)
+        return changed
+
+    def fill_region(self, x: int, y: int, width: int, height: int, alive: bool = True) -> int:
+        """
+        Remplit un rectangle (coupé aux bords de la grille), ligne par ligne
+        :return: nombre de cellules modifiées
+        """
+        x0, x1 = max(0, x), min(self._matrix_width, x + width)
+        y0, y1 = max(0, y), min(self._matrix_height, y + height)
+        if x0 >= x1 or y0 >= y1:
+            return 0
+        value = 1 if alive else 0
+        fill = bytes([value]) * (x1 - x0)
+        cells = self._writable()
+        changed = 0
+        for row in range(y0, y1):
+            start = row * self._matrix_width
+            segment = cells[start + x0:start + x1]
+            changed += len(fill) - segment.count(value)
+            cells[start + x0:start + x1] = fill
+        self._changed(changed if alive else 0, 0 if alive else changed)
+        return changed
+
+    def stamp(self, pattern, x: int, y: int, transform: str = "identity") -> int:
+        """
+        Pose un motif (liste de (dx, dy) vivantes) avec son coin haut-gauche en (x, y)
+        :param transform: rotation / réflexion (voir TRANSFORMS)
+        :return: nombre de cellules modifiées
+        """
+        if isinstance(pattern, str):
+            pattern = PATTERNS[pattern]
+        return self.set_many(((x + dx, y + dy) for dx, dy in transform_pattern(pattern, transform)), True)
 
     def toggle_cell(self, x: int, y: int):
         """Inverse l'état d'une cellule (pour le clic utilisateur)"""
-        cell = self.get_cell(x, y)
-        if cell:
-            cell.toggle()
-            # Recompter après modification manuelle
-            if self._counter:
-                self._counter.count_all(self)
+        if 0 <= x < self._matrix_width and 0 <= y < self._matrix_height:
+            index = y * self._matrix_width + x
+            cells = self._writable()
+            cells[index] ^= 1
+            # une naissance ou une mort : le compteur suit sans tout recompter
+            alive = cells[index]
+            self._changed(alive, 1 - alive)
+
+    def enable_history(self, memory_budget: int = 16 * 1024 * 1024, keyframe_interval: int = 50):
+        """Garde un historique borné des générations (step_back / rewind)"""
+        self._history = LiveHistory(memory_budget, keyframe_interval)
+        self._reset_history()
+
+    def _reset_history(self):
+        """L'historique repart de l'état courant"""
+        self._history.reset(self._cells, self._generation)
+        self._history_edits = self._edits
+
+    def disable_history(self):
+        self._history = None
+
+    @property
+    def history(self):
+        return self._history
+
+    def step_back(self) -> bool:
+        """
+        Revient à la génération précédente ; False si l'historique est épuisé
+        Si sa différence a été oubliée (budget mémoire), on revient à l'image
+        clé la plus proche : plusieurs générations d'un coup (voir generation)
+        """
+        return self.rewind(1) > 0
+
+    def rewind(self, steps: int = 1) -> int:
+        """
+        Recule de steps générations (un seul événement pour les observers)
+        Les générations récentes sont retrouvées en réinversant les cellules qui
+        ont changé ; au-delà, on saute à l'image clé la plus proche
+        :return: le nb de générations effectivement reculées
+        """
+        history = self._history
+        if history is None or steps <= 0:
+            return 0
+        done = 0
+        with self.batch():
+            # (pas d'écriture depuis le dernier enregistrement : rien à comparer)
+            if self._edits != self._history_edits and self._cells != history.last:
+                # modifications depuis la dernière génération (clics...) : on les annule d'abord
+                self.load_state(history.last)
+                self._generation = history.generation
+                done += 1
+            while done < steps:
+                entry = history.pop_delta()
+                if entry is None:
+                    break
+                generation, indices = entry
+                self._flip_cells(indices)
+                self._generation = generation
+                done += 1
+            if done < steps:
+                keyframe = history.pop_to_keyframe(steps - done)
+                if keyframe is not None:
+                    generation, state, went = keyframe
+                    self.load_state(state)
+                    self._generation = generation
+                    done += went
+        self._history_edits = self._edits      # l'état est celui de l'historique
+        self._forget_marks()
+        return done
+
+    def _flip_cells(self, indices):
+        """Inverse l'état des cellules données (index y * largeur + x)"""
+        cells = self._writable()
+        born = 0
+        for index in indices:
+            cells[index] ^= 1
+            born += cells[index]
+        self._changed(born, len(indices) - born)
 
     def reset_all_cells(self):
         """Remet toutes les cellules à l'état mort"""
-        for cell in self.get_all_cells():
-            cell.set_alive(False)
+        died = self._cells.count(1)
+        self._writable()[:] = bytes(len(self._cells))
+        self._changed(0, died)
+        for cell in self._cell_objects.values():
             cell.set_nb_neighbours(0)
 
     def start(self):
@@ -282,16 +992,20 @@ class LiveModel:
         self._running = False
         self._generation = 0
         self.reset_all_cells()
+        self._forget_marks()
         if self._counter:
             self._counter.count_all(self)
 
+    def memory_estimate(self) -> int:
+        """Estimation de la mémoire utilisée (octets), pic de next_generation et historique compris"""
+        estimate = len(self._cells) * self.BYTES_PER_CELL
+        if self._history is not None:
+            estimate += self._history.memory_used
+        return estimate
+
     def count_alive_cells(self) -> int:
         """Compte le nombre de cellules vivantes"""
-        count = 0
-        for cell in self.get_all_cells():
-            if cell.is_alive():
-                count += 1
-        return count
+        return self._cells.count(1)
 
     def pixel_to_grid(self, pixel_x: int, pixel_y: int) -> tuple:
         """Convertit des coorndonnées pixel en coordonnées grille"""
@@ -303,73 +1017,189 @@ class LiveModel:
         """
         Clacule la prochaine génération selon les règles du jeu de la vie
 
-        Règles de Conway :
+        Règles de Conway (par défaut, voir set_rule) :
         - Naissance : cellule morte avec exactement 3 voisins vivants
         - Survie : cellule vivante avec 2 ou 3 voisins vivants
         - Mort : sinon
         """
 
-        # 1. Compter les voisins de chaque cellule
-        self._count_all_neighbours()
-
-        # 2. Calculer le nouvel état de chauqe cellule
-        new_states = []
-        for cell in self.get_all_cells():
-            neighbours = cell.nb_neighbours
-
-            if cell.is_alive():
-                # Cellule vivante : survit avec 2 ou 3 voisins
-                new_state = neighbours in [2, 3]
-            else:
-                # Cellule morte : nait avec exactement 3 voisins
-                new_state = neighbours == 3
-
-            new_states.append((cell, new_state))
-
-        # 3. Appliquer les nouveauc états
-        for cell, new_state in new_states:
-            cell.set_alive(new_state)
+        profiler = self._profiler
+        t = time.perf_counter_ns() if profiler is not None else 0
+
+        # L'ancien buffer n'est plus modifié (la génération suivante en prend un
+        # autre) : pas besoin de le copier ; il reste dans _marks CHANGE_WINDOW
+        # générations, puis il est réutilisé (sauf s'il a été confié à un snapshot)
+        old_cells = self._cells
+
+        # 1-2. Voisins puis règles (le noyau donne le nouveau rectangle
+        #      des vivantes dans _next_box s'il le connaît)
+        self._next_box = _UNKNOWN_BOX
+        self._next_flips = None
+        new_cells, keys, t = self._compute_generation(old_cells, t)
+        self._box = self._next_box
+        self._retire(old_cells)
+        self._steps.append([self._generation, self._edits, self._next_flips])
+
+        # 3. Appliquer les nouveaux états, puis notifier les observers
+        #    des cellules qui ont changé
+        self._cells = new_cells
+        self._shared = False
+        for index, cell in self._cell_objects.items():
+            cell.set_nb_neighbours(keys[index] % 9)
+            if new_cells[index] != old_cells[index]:
+                cell._notify_observers()
+        if profiler is not None:
+            t = profiler.mark("notify", t)
 
         self._generation += 1
 
         # 4. Recompter les cellules vivantes
         if self._counter:
             self._counter.count_all(self)
+        if profiler is not None:
+            t = profiler.mark("counter", t)
+
+        # 5. Historique, puis observers des générations (enregistrement...)
+        if self._history is not None:
+            # sans écriture depuis le dernier enregistrement, l'historique a
+            # l'état d'avant : seules les cellules changées lui sont données
+            changes = self._changes_since_history()
+            if changes is None:
+                self._history.record(new_cells, self._generation, old_cells, self._generation - 1)
+            else:
+                self._history.record(new_cells, self._generation, changes=changes)
+            self._history_edits = self._edits
+            if profiler is not None:
+                t = profiler.mark("history", t)
+        if self._generation_observers:
+            for observer in self._generation_observers:
+                observer.update_generation(self, new_cells)
+            if profiler is not None:
+                profiler.mark("observers", t)
+
+    def _compute_generation(self, old_cells, t):
+        """
+        Noyau dense sur le tore : nouvel état et clés (nb de voisins + 9 * état)
+        Seul le rectangle des vivantes agrandi d'une cellule est calculé (voir
+        _step_region) : ailleurs tout est mort et le reste.
+        Les sous-classes peuvent le remplacer (autre univers, autre moteur) :
+        keys n'est lu qu'aux index des objets LiveCell
+        :return: (nouvel état, clés, t du profileur)
+        """
+        profiler = self._profiler
+        width = self._matrix_width
+        height = self._matrix_height
+        # Buffers réutilisés d'une génération à l'autre : seuls des objets de
+        # la taille d'une ligne sont alloués pendant le calcul
+        new_cells = self._take_buffer()
+        keys = self._keys
+        if len(keys) != len(new_cells):
+            keys = self._keys = bytearray(len(new_cells))
+        else:
+            keys[:] = self._zeros
+        region = self._step_region()
+        if region is None:
+            self._next_flips = []
+            self._next_box = None
+            if profiler is not None:
+                t = profiler.mark("kernel", t)
+                t = profiler.mark("bbox", t)
+            return new_cells, keys, t
+        x0, y0, x1, y1 = region
+        full_width = x1 - x0 == width
+        table = self._rule_table
+        flips = self._flip_table
+
+        def columns(start, a, b):
+            # colonnes a..b-1 d'une ligne, recollées à travers le bord du tore
+            if a < 0:
+                return old_cells[start + width + a:start + width] + old_cells[start:start + b]
+            if b > width:
+                return old_cells[start + a:start + width] + old_cells[start:start + b - width]
+            return old_cells[start + a:start + b]
+
+        # 1-2. Compter les voisins de chaque cellule (avec wrap-around pour les bords)
+        #    clé = nb de voisins + 9 * état, calculée ligne par ligne :
+        #    somme horizontale sur 3 cellules, puis somme verticale sur 3 lignes,
+        #    puis nouvel état par la table des règles ; seules 3 lignes de sommes
+        #    sont gardées à la fois
+        def row_sums(y):
+            if full_width:
+                row = old_cells[y * width:(y + 1) * width]
+                return row, bytes([a + b + c for a, b, c in zip(row[-1:] + row[:-1], row, row[1:] + row[:1])])
+            around = columns(y * width, x0 - 1, x1 + 1)     # + une colonne de chaque côté
+            return around[1:-1], bytes([a + b + c for a, b, c in zip(around, around[1:], around[2:])])
+
+        # morceaux de ligne [début, fin) à écrire : deux si le rectangle passe le bord
+        if x0 < 0:
+            pieces = ((width + x0, width), (0, x1))
+        elif x1 > width:
+            pieces = ((x0, width), (0, x1 - width))
+        else:
+            pieces = ((x0, x1),)
+
+        _, above = row_sums((y0 - 1) % height)
+        row, current = row_sums(y0 % height)
+        # index des cellules qui changent (pour changed_since), 4 octets chacun ;
+        # au-delà d'une cellule sur 64, relire les deux états coûte autant :
+        # la liste est abandonnée (None)
+        changed = array("I")
+        limit = len(new_cells) // 64
+        for y in range(y0, y1):
+            next_row, below = row_sums((y + 1) % height)
+            line = bytes([a + b + c + 8 * s for a, b, c, s in zip(above, current, below, row)])
+            states = line.translate(table)
+            moved = changed is not None and states != row
+            if moved:
+                flipped = line.translate(flips)
+            offset = 0
+            for begin, end in pieces:
+                start = (y % height) * width
+                keys[start + begin:start + end] = line[offset:offset + end - begin]
+                new_cells[start + begin:start + end] = states[offset:offset + end - begin]
+                if moved:
+                    base = start + begin - offset
+                    found = flipped.find(1, offset, offset + end - begin)
+                    while found >= 0:
+                        changed.append(base + found)
+                        found = flipped.find(1, found + 1, offset + end - begin)
+                offset += end - begin
+            if moved and len(changed) > limit:
+                changed = None
+            above, current, row = current, below, next_row
+        self._next_flips = changed
+        if profiler is not None:
+            t = profiler.mark("kernel", t)      # voisins et règles, dans la même boucle par ligne
+
+        # nouveau rectangle : cherché dans la zone calculée (toute la largeur /
+        # hauteur si elle passe le bord)
+        wraps_x, wraps_y = x0 < 0 or x1 > width, y0 < 0 or y1 > height
+        self._next_box = self._scan_box(new_cells, 0 if wraps_x else x0, 0 if wraps_y else y0,
+                                        width if wraps_x else x1, height if wraps_y else y1)
+        if profiler is not None:
+            t = profiler.mark("bbox", t)
+        return new_cells, keys, t
+
+    def _changed(self, born: int, died: int):
+        """Signale une écriture en bloc (regroupée si on est dans batch())"""
+        if self._batch_depth:
+            self._batch_changes[0] += born
+            self._batch_changes[1] += died
+        elif born or died:
+            self._notify_bulk(born, died)
+
+    def _notify_bulk(self, born: int, died: int):
+        """Un seul événement pour les observers du modèle"""
+        for observer in self._observers:
+            observer.update_many(self, born, died)
 
-    def _init_matrix(self):
-        """Initialise la matrice de cellules"""
-        for y in range(self._matrix_height):
-            row = []
-            for x in range(self._matrix_width):
-                cell = LiveCell(x, y)
-                # Si un compteur existe déja, l'attacher
-                if self._counter:
-                    cell.attach_observer(self._counter)
-                row.append(cell)
-            self._cells_matrix.append(row)
-
-    def _count_all_neighbours(self):
-        """Compte les voisins vivants pour chaque cellule"""
-        for cell in self.get_all_cells():
-            count = self._count_neighbours(cell.x, cell.y)
-            cell.set_nb_neighbours(count)
-
-    def _count_neighbours(self, x: int, y: int) -> int:
-        """Compte les voisins vivants autour d'une cellule"""
-        count = 0
-        # Parcourir les 8 voisins
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue    # On ne compte pas la cellule ell-même
-
-                # Coordonnées du voisin (avec wrap-around pour les bords)
-                nx = (x + dx) % self._matrix_width
-                ny = (y + dy) % self._matrix_height
-
-                if self._cells_matrix[ny][nx].is_alive():
-                    count += 1
-        return count
+    def _create_cell(self, x: int, y: int) -> LiveCell:
+        """Crée l'objet LiveCell d'une position (lié au buffer d'état)"""
+        cell = LiveCell(x, y, self)
+        # Si un compteur existe déja, l'attacher
+        if self._counter:
+            cell.attach_observer(self._counter)
+        return cell
 
     def __str__(self):
         return f"LiveModel({self._matrix_width}x{self._matrix_height}, gen={self._generation})"
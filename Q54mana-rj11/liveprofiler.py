@@ -0,0 +1,161 @@
+"""
+Module liveprofiler.py
+Mesure du temps passé dans chaque phase de la boucle de simulation
+
+Phases mesurées :
+- modèle : kernel (voisins et règles, calculés ensemble ligne par ligne),
+           bbox (nouveau rectangle des vivantes), notify, counter, history,
+           observers (LiveModel.next_generation) ; les autres moteurs ont
+           leurs propres phases (creux : candidates, rules ; entier : kernel,
+           unpack ; univers par blocs : kernel, window)
+- vue    : redraw, info (rendu de LiveView, au plus un par image)
+
+Il compte aussi des événements (count) : par exemple les demandes de
+redessin absorbées par un rendu déjà programmé (coalesced).
+
+Le profileur est optionnel : quand il n'est pas branché, le modèle et la vue
+ne font qu'un test "is not None" par phase (coût négligeable).
+"""
+
+import json
+import time
+from collections import deque
+
+
+class PhaseStats:
+    """
+    Statistiques glissantes d'une phase
+    On garde les N dernières durées (en nanosecondes)
+    """
+
+    def __init__(self, window: int = 120):
+        self._samples = deque(maxlen=window)
+        self._total_count = 0
+
+    @property
+    def count(self):
+        """Nombre total de mesures depuis le début"""
+        return self._total_count
+
+    def add(self, duration_ns: int):
+        """Ajoute une mesure"""
+        self._samples.append(duration_ns)
+        self._total_count += 1
+
+    def last_ms(self) -> float:
+        """Dernière durée mesurée en millisecondes"""
+        return self._samples[-1] / 1e6 if self._samples else 0.0
+
+    def mean_ms(self) -> float:
+        """Durée moyenne sur la fenêtre glissante"""
+        if not self._samples:
+            return 0.0
+        return sum(self._samples) / len(self._samples) / 1e6
+
+    def percentile_ms(self, p: float) -> float:
+        """Percentile (0-100) sur la fenêtre glissante"""
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(len(ordered) * p / 100))
+        return ordered[index] / 1e6
+
+    def histogram(self) -> dict:
+        """
+        Histogramme de la fenêtre glissante, par puissance de 2 en microsecondes
+        ex : {"<1us": 3, "256-512us": 10, ...}
+        """
+        buckets = {}
+        for ns in self._samples:
+            us = ns // 1000
+            if us < 1:
+                label = "<1us"
+            else:
+                low = 1 << (us.bit_length() - 1)
+                label = f"{low}-{low * 2}us"
+            buckets[label] = buckets.get(label, 0) + 1
+        return buckets
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self._total_count,
+            "window": len(self._samples),
+            "last_ms": round(self.last_ms(), 4),
+            "mean_ms": round(self.mean_ms(), 4),
+            "p50_ms": round(self.percentile_ms(50), 4),
+            "p95_ms": round(self.percentile_ms(95), 4),
+            "max_ms": round(max(self._samples) / 1e6, 4) if self._samples else 0.0,
+            "histogram": self.histogram(),
+        }
+
+
+class LiveProfiler:
+    """
+    Profileur des phases (perf_counter_ns)
+    Utilisation :
+        t = time.perf_counter_ns()
+        ... phase 1 ...
+        t = profiler.mark("phase1", t)
+        ... phase 2 ...
+        t = profiler.mark("phase2", t)
+    """
+
+    def __init__(self, window: int = 120):
+        self._window = window
+        self._phases = {}   # nom de phase -> PhaseStats (ordre d'insertion conservé)
+        self._counters = {}  # nom d'événement -> nombre total
+
+    @staticmethod
+    def now() -> int:
+        return time.perf_counter_ns()
+
+    def record(self, phase: str, duration_ns: int):
+        """Enregistre une durée pour une phase"""
+        stats = self._phases.get(phase)
+        if stats is None:
+            stats = self._phases[phase] = PhaseStats(self._window)
+        stats.add(duration_ns)
+
+    def mark(self, phase: str, start_ns: int) -> int:
+        """Enregistre le temps écoulé depuis start_ns et renvoie l'instant présent"""
+        now = time.perf_counter_ns()
+        self.record(phase, now - start_ns)
+        return now
+
+    def count(self, event: str, n: int = 1):
+        """Ajoute n à un compteur d'événements"""
+        self._counters[event] = self._counters.get(event, 0) + n
+
+    def counter(self, event: str) -> int:
+        return self._counters.get(event, 0)
+
+    def get(self, phase: str) -> PhaseStats:
+        return self._phases.get(phase)
+
+    def phases(self):
+        return list(self._phases)
+
+    def reset(self):
+        """Oublie toutes les mesures"""
+        self._phases.clear()
+        self._counters.clear()
+
+    def summary(self) -> dict:
+        """Statistiques de toutes les phases"""
+        return {phase: stats.to_dict() for phase, stats in self._phases.items()}
+
+    def overlay_text(self) -> str:
+        """Texte court pour la barre d'infos : moyenne glissante de chaque phase"""
+        parts = [f"{phase} {stats.mean_ms():.1f}ms" for phase, stats in self._phases.items()]
+        parts += [f"{event} {n}" for event, n in self._counters.items()]
+        return " | ".join(parts)
+
+    def dump(self, path: str):
+        """Écrit les statistiques dans un fichier JSON"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"window": self._window, "phases": self.summary(), "counters": dict(self._counters)},
+                      f, indent=2)
+            f.write("\n")
+
+    def __str__(self):
+        return f"LiveProfiler({self.overlay_text() or 'aucune mesure'})"
@@ -0,0 +1,270 @@
+"""
+Module liverecord.py
+Enregistrement d'une simulation et relecture avec accès direct à une génération
+
+Fichier unique, en ajout seulement :
+    en-tête  : b"LIFEREC1" + intervalle entre images clés (I)
+    images   : type (B), numéro (I), génération (I), largeur (H), hauteur (H),
+               taille (I), puis les données compressées (zlib)
+- image clé (type 0) : l'état complet (1 octet par cellule)
+- différence (type 2) : index (I) des cellules qui ont changé depuis l'image
+  précédente ; le modèle les connaît déjà (changed_since, lu dans la zone
+  calculée par la génération) : le coût suit l'activité, pas la taille de
+  la grille
+- différence (type 1, anciens fichiers, encore lus) : XOR de l'état précédent
+  et du nouvel état
+Une image clé est écrite à la place d'une différence quand l'état a été
+modifié hors génération (clic, motif, retour arrière...) depuis l'image
+précédente.
+
+Pour aller à une image, le lecteur repart de l'image clé la plus proche
+(ou de l'image courante si elle est plus près) et applique les différences.
+
+    recorder = LiveRecorder("run.liferec")
+    recorder.attach(model)          # une image à chaque next_generation
+    ...
+    recorder.close()
+    player = LivePlayer("run.liferec")
+    player.seek(1234)               # même interface de lecture qu'un LiveModel
+"""
+
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_right
+
+from livemodel import LiveCell, StateView
+
+MAGIC = b"LIFEREC1"
+KEYFRAME = 0
+DELTA = 1
+DELTA_INDICES = 2
+_FILE_HEADER = struct.Struct("<I")
+_FRAME_HEADER = struct.Struct("<BIIHHI")
+
+
+class LiveRecorder:
+    """
+    Enregistreur (observer des générations du modèle)
+    Les modifications faites entre deux générations (clics, stratégies) sont
+    incluses dans l'image suivante
+    """
+
+    def __init__(self, path: str, keyframe_interval: int = 100, level: int = 1):
+        self._path = path
+        self._keyframe_interval = keyframe_interval
+        self._level = level
+        self._file = open(path, "wb")
+        self._file.write(MAGIC + _FILE_HEADER.pack(keyframe_interval))
+        self._model = None
+        self._frames = 0
+        self._since_keyframe = 0
+        self._last_size = None
+        self._last_generation = None
+        self._last_edits = None     # model.edit_count à la dernière image
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def frames(self):
+        """Nombre d'images enregistrées"""
+        return self._frames
+
+    def attach(self, model):
+        """Enregistre l'état courant (image clé) puis chaque génération"""
+        self._model = model
+        self.record(model, model.get_state())
+        model.attach_generation_observer(self)
+
+    def detach(self):
+        if self._model is not None:
+            self._model.detach_generation_observer(self)
+            self._model = None
+
+    def update_generation(self, model, state):
+        self.record(model, state)
+
+    def record(self, model, state):
+        """Ajoute une image : clé toutes les keyframe_interval images, différence sinon"""
+        size = (model.matrix_width, model.matrix_height)
+        edits = model.edit_count
+        changes = None
+        if (self._frames and size == self._last_size and edits == self._last_edits
+                and self._since_keyframe < self._keyframe_interval
+                and model.generation == self._last_generation + 1):
+            changes = model.changed_since(self._last_generation)
+        if changes is None:
+            kind, data = KEYFRAME, bytes(state)
+            self._since_keyframe = 0
+        else:
+            indices = array("I", changes)
+            if sys.byteorder != "little":
+                indices.byteswap()
+            kind, data = DELTA_INDICES, indices.tobytes()
+        payload = zlib.compress(data, self._level)
+        self._file.write(_FRAME_HEADER.pack(kind, self._frames, model.generation, size[0], size[1], len(payload)))
+        self._file.write(payload)
+        self._frames += 1
+        self._since_keyframe += 1
+        self._last_size, self._last_generation, self._last_edits = size, model.generation, edits
+
+    def close(self):
+        self.detach()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class LivePlayer:
+    """
+    Lecteur d'un enregistrement
+    Il expose la même interface de lecture que LiveModel (matrix_width,
+    generation, get_cell, get_all_cells, count_alive_cells, get_state) :
+    la vue peut l'afficher à la place du modèle
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._file = open(path, "rb")
+        if self._file.read(len(MAGIC)) != MAGIC:
+            self._file.close()
+            raise ValueError(f"{path} n'est pas un enregistrement du Jeu de la Vie")
+        (self._keyframe_interval,) = _FILE_HEADER.unpack(self._file.read(_FILE_HEADER.size))
+        self._index = []        # (type, génération, largeur, hauteur, position, taille)
+        self._keyframes = []    # numéros des images clés
+        self._scan()
+
+        self._position = -1
+        self._state = bytearray()   # état courant (1 octet par cellule)
+        self._size = (0, 0)
+        if self._index:
+            self.seek(0)
+
+    def _scan(self):
+        """Lit les en-têtes d'images (sans les données) ; ignore une fin tronquée"""
+        start = self._file.tell()
+        end = self._file.seek(0, 2)
+        self._file.seek(start)
+        while True:
+            header = self._file.read(_FRAME_HEADER.size)
+            if len(header) < _FRAME_HEADER.size:
+                break
+            kind, _number, generation, width, height, length = _FRAME_HEADER.unpack(header)
+            offset = self._file.tell()
+            if offset + length > end:
+                break
+            self._file.seek(length, 1)
+            if kind == KEYFRAME:
+                self._keyframes.append(len(self._index))
+            self._index.append((kind, generation, width, height, offset, length))
+
+    def _read(self, number: int) -> bytes:
+        offset, length = self._index[number][4:6]
+        self._file.seek(offset)
+        return zlib.decompress(self._file.read(length))
+
+    def _apply(self, number: int, state: bytearray):
+        """Applique la différence number à state (en place)"""
+        data = self._read(number)
+        if self._index[number][0] == DELTA_INDICES:
+            indices = array("I")
+            indices.frombytes(data)
+            if sys.byteorder != "little":
+                indices.byteswap()
+            for index in indices:
+                state[index] ^= 1
+        else:
+            changed = int.from_bytes(state, "little") ^ int.from_bytes(data, "little")
+            state[:] = changed.to_bytes(len(state), "little")
+
+    # ------------------------------------------------------------------
+    # Navigation
+    # ------------------------------------------------------------------
+
+    @property
+    def frame_count(self):
+        return len(self._index)
+
+    @property
+    def position(self):
+        """Numéro de l'image affichée"""
+        return self._position
+
+    def seek(self, number: int):
+        """Va à l'image number : image clé la plus proche + différences"""
+        if not 0 <= number < len(self._index):
+            raise IndexError(f"Image {number} hors de l'enregistrement (0 à {len(self._index) - 1})")
+        keyframe = self._keyframes[bisect_right(self._keyframes, number) - 1]
+        if keyframe <= self._position <= number:
+            start, state = self._position, self._state      # on avance depuis l'image courante
+        else:
+            start, state = keyframe, bytearray(self._read(keyframe))
+        for frame in range(start + 1, number + 1):
+            self._apply(frame, state)
+        self._state = state
+        self._position = number
+        self._size = self._index[number][2:4]
+
+    def step(self) -> bool:
+        """Image suivante ; False à la fin de l'enregistrement"""
+        if self._position + 1 >= len(self._index):
+            return False
+        self.seek(self._position + 1)
+        return True
+
+    def close(self):
+        self._file.close()
+
+    # ------------------------------------------------------------------
+    # Interface de lecture d'un LiveModel (pour la vue)
+    # ------------------------------------------------------------------
+
+    @property
+    def matrix_width(self):
+        return self._size[0]
+
+    @property
+    def matrix_height(self):
+        return self._size[1]
+
+    @property
+    def generation(self):
+        return self._index[self._position][1] if self._index else 0
+
+    def get_state(self) -> bytes:
+        return bytes(self._state)
+
+    def state_view(self) -> StateView:
+        """État de l'image courante (copie : seek modifie l'état en place)"""
+        width, height = self._size
+        return StateView(self.get_state(), width, height, self.generation)
+
+    def count_alive_cells(self) -> int:
+        return self._state.count(1)
+
+    def get_cell(self, x: int, y: int) -> LiveCell:
+        """Cellule en lecture seule (copie de l'état de l'image courante)"""
+        width, height = self._size
+        if 0 <= x < width and 0 <= y < height:
+            cell = LiveCell(x, y)
+            cell.set_alive(bool(self._state[y * width + x]))
+            return cell
+        return None
+
+    def get_all_cells(self):
+        state = self.get_state()
+        width = self._size[0]
+        for index, value in enumerate(state):
+            cell = LiveCell(index % width, index // width)
+            cell.set_alive(bool(value))
+            yield cell
+
+    def __str__(self):
+        return f"LivePlayer({self._path}, image {self._position + 1}/{len(self._index)})"
@@ -0,0 +1,480 @@
+"""
+Module liveserver.py
+Serveur WebSocket local : suivre une simulation depuis un navigateur
+
+Le serveur joue le rôle de la vue pour le LiveController (update_display,
+schedule_next_iteration) : les commandes sont celles des boutons de la vue Tk
+(go, stop, step, reset, canon, random, empty, speed, click).
+
+Protocole (messages WebSocket) :
+- client -> serveur : texte, ex "go", "speed 50", "click 10 4 1" (x, y en cellules, bouton)
+- serveur -> client : binaire, petit-boutiste
+    FULL  : type 0 (B), génération (I), largeur (H), hauteur (H), état 1 bit par cellule
+    DELTA : type 1 (B), génération (I), nb naissances (I), nb morts (I),
+            puis les indices (I) des naissances et des morts (index y * largeur + x)
+
+Chaque client a une file d'attente bornée. Si un client lent la remplit,
+ses images en attente sont abandonnées et remplacées par une image FULL
+de l'état courant : il saute des générations mais reste synchronisé.
+
+    python liveserver.py --port 8765     puis ouvrir http://127.0.0.1:8765/
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import os
+import struct
+import sys
+from array import array
+
+from livecontroller import LiveController
+from livedelta import diff_states, apply_delta, pack_state, unpack_state
+
+FRAME_FULL = 0
+FRAME_DELTA = 1
+_FULL_HEADER = struct.Struct("<BIHH")
+_DELTA_HEADER = struct.Struct("<BIII")
+
+# Codes d'opération WebSocket (RFC 6455)
+OP_CONTINUATION, OP_TEXT, OP_BINARY = 0x0, 0x1, 0x2
+OP_CLOSE, OP_PING, OP_PONG = 0x8, 0x9, 0xA
+_WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+# ============================================================================
+# Images (frames) du protocole
+# ============================================================================
+
+
+def _indices_bytes(indices) -> bytes:
+    values = array("I", indices)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
+def encode_full(generation: int, width: int, height: int, state) -> bytes:
+    """Image complète : en-tête + état 1 bit par cellule"""
+    return _FULL_HEADER.pack(FRAME_FULL, generation, width, height) + pack_state(state)
+
+
+def encode_delta(generation: int, born, died) -> bytes:
+    """Image différentielle : en-tête + indices des naissances puis des morts"""
+    return (_DELTA_HEADER.pack(FRAME_DELTA, generation, len(born), len(died))
+            + _indices_bytes(born) + _indices_bytes(died))
+
+
+def decode_frame(payload: bytes) -> dict:
+    """Décode une image binaire du serveur"""
+    if payload[0] == FRAME_FULL:
+        _type, generation, width, height = _FULL_HEADER.unpack_from(payload)
+        state = unpack_state(payload[_FULL_HEADER.size:], width * height)
+        return {"type": "full", "generation": generation, "width": width, "height": height, "state": state}
+    _type, generation, n_born, n_died = _DELTA_HEADER.unpack_from(payload)
+    indices = array("I")
+    indices.frombytes(payload[_DELTA_HEADER.size:])
+    if sys.byteorder == "big":
+        indices.byteswap()
+    return {"type": "delta", "generation": generation,
+            "born": indices[:n_born].tolist(), "died": indices[n_born:n_born + n_died].tolist()}
+
+
+# ============================================================================
+# WebSocket minimal (RFC 6455) sur les flux asyncio
+# ============================================================================
+
+
+def accept_key(key: str) -> str:
+    """Réponse à la clé Sec-WebSocket-Key de la poignée de main"""
+    return base64.b64encode(hashlib.sha1((key + _WS_GUID).encode()).digest()).decode()
+
+
+def _apply_mask(payload: bytes, mask: bytes) -> bytes:
+    """XOR avec le masque de 4 octets (en un seul calcul sur grand entier)"""
+    size = len(payload)
+    key = (mask * (size // 4 + 1))[:size]
+    return (int.from_bytes(payload, "big") ^ int.from_bytes(key, "big")).to_bytes(size, "big")
+
+
+def encode_ws(payload: bytes, opcode: int = OP_BINARY, mask: bool = False) -> bytes:
+    """Message WebSocket en une seule trame (masqué pour un client, pas pour le serveur)"""
+    size = len(payload)
+    if size < 126:
+        header = struct.pack("!BB", 0x80 | opcode, size | (0x80 if mask else 0))
+    elif size < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, 126 | (0x80 if mask else 0), size)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127 | (0x80 if mask else 0), size)
+    if mask:
+        key = os.urandom(4)
+        return header + key + _apply_mask(payload, key)
+    return header + payload
+
+
+async def read_ws(reader) -> tuple:
+    """Lit un message complet (trames de continuation réunies) : (opcode, payload)"""
+    message, message_opcode = b"", None
+    while True:
+        first, second = await reader.readexactly(2)
+        opcode, size = first & 0x0F, second & 0x7F
+        if size == 126:
+            size = struct.unpack("!H", await reader.readexactly(2))[0]
+        elif size == 127:
+            size = struct.unpack("!Q", await reader.readexactly(8))[0]
+        mask = await reader.readexactly(4) if second & 0x80 else None
+        payload = await reader.readexactly(size)
+        if mask:
+            payload = _apply_mask(payload, mask)
+        if opcode >= OP_CLOSE:      # trame de contrôle : jamais fragmentée
+            return opcode, payload
+        if opcode != OP_CONTINUATION:
+            message_opcode = opcode
+        message += payload
+        if first & 0x80:
+            return message_opcode, message
+
+
+# ============================================================================
+# Serveur
+# ============================================================================
+
+
+class _ClientSession:
+    """Un navigateur connecté : file d'images bornée + statistiques"""
+
+    def __init__(self, writer, max_pending: int):
+        self.writer = writer
+        self.queue = asyncio.Queue(maxsize=max_pending)
+        self.sent = 0
+        self.dropped = 0
+        self.task = None
+
+    def push(self, frame: bytes, full_frame) -> bool:
+        """
+        Met une image en file ; si la file est pleine, le client est trop lent :
+        on abandonne ce qui attend et on met une image complète à la place
+        :param full_frame: fonction qui renvoie l'image complète de l'état courant
+        :return: False si des images ont été abandonnées
+        """
+        if not self.queue.full():
+            self.queue.put_nowait(frame)
+            return True
+        self.dropped += self.queue.qsize() + 1
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(full_frame())
+        return False
+
+    async def send_loop(self):
+        while True:
+            frame = await self.queue.get()
+            opcode = OP_TEXT if isinstance(frame, str) else OP_BINARY
+            self.writer.write(encode_ws(frame.encode() if opcode == OP_TEXT else frame, opcode))
+            await self.writer.drain()
+            self.sent += 1
+
+
+class LiveServer:
+    """
+    Vue réseau du LiveController : diffuse chaque génération aux clients WebSocket
+    (à utiliser à la place de LiveView, dans une boucle asyncio)
+    """
+
+    def __init__(self, controller: LiveController, host: str = "127.0.0.1", port: int = 8765,
+                 max_pending: int = 8):
+        self._controller = controller
+        self._model = controller.model
+        self._host = host
+        self._port = port
+        self._max_pending = max_pending
+        self._clients = set()
+        self._server = None
+        self._loop = None
+        self._timer = None
+        self._last_state = self._model.get_state()
+        self._last_size = (self._model.matrix_width, self._model.matrix_height)
+
+        self._commands = {
+            "go": controller.gui_go,
+            "stop": controller.gui_stop,
+            "step": controller.gui_step,
+            "reset": controller.gui_reset,
+            "canon": controller.gui_canon,
+            "random": controller.gui_random,
+            "empty": controller.gui_empty,
+            "speed": controller.gui_change_speed,
+            "click": self._click,
+        }
+
+    @property
+    def port(self):
+        """Port d'écoute (utile avec port=0 : choisi par le système)"""
+        if self._server is not None:
+            return self._server.sockets[0].getsockname()[1]
+        return self._port
+
+    @property
+    def clients(self):
+        return list(self._clients)
+
+    async def start(self):
+        """Ouvre le port et se branche comme vue du contrôleur"""
+        self._loop = asyncio.get_running_loop()
+        self._server = await asyncio.start_server(self._handle, self._host, self._port)
+        self._controller.set_view(self)
+
+    async def stop(self):
+        """Arrête la simulation, ferme les connexions et le port"""
+        self._controller.gui_stop()
+        if self._timer is not None:
+            self._timer.cancel()
+        for client in list(self._clients):
+            client.writer.close()
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def serve_forever(self):
+        await self.start()
+        print(f"Serveur du Jeu de la Vie : http://{self._host}:{self.port}/")
+        async with self._server:
+            await self._server.serve_forever()
+
+    # ------------------------------------------------------------------
+    # Interface de vue (appelée par le contrôleur)
+    # ------------------------------------------------------------------
+
+    def update_display(self):
+        """Diffuse la différence avec l'état précédemment envoyé"""
+        model = self._model
+        state = model.snapshot().buffer     # image figée sans copie, gardée pour la prochaine différence
+        size = (model.matrix_width, model.matrix_height)
+        cache = []
+
+        def full_frame():
+            if not cache:
+                cache.append(encode_full(model.generation, size[0], size[1], state))
+            return cache[0]
+
+        if size != self._last_size:
+            frame = full_frame()
+        else:
+            born, died = diff_states(self._last_state, state)
+            frame = encode_delta(model.generation, born, died)
+        for client in self._clients:
+            client.push(frame, full_frame)
+        self._last_state, self._last_size = state, size
+
+    def update_cells(self, cells):
+        """Quelques cellules ont changé : la différence d'état suffit à les trouver"""
+        self.update_display()
+
+    def update_changes(self):
+        """Une génération a été calculée : même différence d'état"""
+        self.update_display()
+
+    def schedule_next_iteration(self, delay_ms: int, callback):
+        """Planifie la génération suivante dans la boucle asyncio"""
+        self._timer = self._loop.call_later(delay_ms / 1000, callback)
+
+    # ------------------------------------------------------------------
+    # Connexions
+    # ------------------------------------------------------------------
+
+    def _click(self, x: str, y: str, button: str = "1"):
+        size = self._model.cell_size
+        self._controller.gui_cell_click(int(x) * size, int(y) * size, int(button))
+
+    def run_command(self, text: str) -> str:
+        """Exécute une commande texte ; renvoie un message d'erreur ou une chaîne vide"""
+        words = text.split()
+        if not words or words[0] not in self._commands:
+            return f"erreur : commande inconnue '{text}'"
+        try:
+            self._commands[words[0]](*words[1:])
+        except (TypeError, ValueError) as error:
+            return f"erreur : {words[0]} : {error}"
+        return ""
+
+    async def _handle(self, reader, writer):
+        try:
+            request = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            writer.close()
+            return
+        lines = request.decode("latin-1").split("\r\n")
+        headers = {}
+        for line in lines[1:]:
+            name, _sep, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("upgrade", "").lower() != "websocket" or "sec-websocket-key" not in headers:
+            await self._send_page(writer, lines[0])
+            return
+
+        writer.write((
+            "HTTP/1.1 101 Switching Protocols\r\n"
+            "Upgrade: websocket\r\nConnection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {accept_key(headers['sec-websocket-key'])}\r\n\r\n"
+        ).encode())
+        client = _ClientSession(writer, self._max_pending)
+        client.push(encode_full(self._model.generation, *self._last_size, self._last_state), None)
+        client.task = asyncio.create_task(client.send_loop())
+        self._clients.add(client)
+        try:
+            while True:
+                opcode, payload = await read_ws(reader)
+                if opcode == OP_CLOSE:
+                    writer.write(encode_ws(payload[:2], OP_CLOSE))
+                    break
+                if opcode == OP_PING:
+                    writer.write(encode_ws(payload, OP_PONG))
+                elif opcode == OP_TEXT:
+                    error = self.run_command(payload.decode("utf-8", "replace"))
+                    if error and not client.queue.full():
+                        client.queue.put_nowait(error)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._clients.discard(client)
+            client.task.cancel()
+            writer.close()
+
+    async def _send_page(self, writer, request_line: str):
+        """Page HTML du client navigateur (GET /), 404 sinon"""
+        parts = request_line.split()
+        if len(parts) >= 2 and parts[0] == "GET" and parts[1] == "/":
+            body, status = _PAGE.encode(), "200 OK"
+        else:
+            body, status = b"introuvable\n", "404 Not Found"
+        writer.write(f"HTTP/1.1 {status}\r\nContent-Type: text/html; charset=utf-8\r\n"
+                     f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body)
+        await writer.drain()
+        writer.close()
+
+
+# ============================================================================
+# Client de test (asyncio) : garde une copie de l'état reçu
+# ============================================================================
+
+
+class LiveClient:
+    """
+    Client WebSocket minimal, pour les tests et les scripts
+        client = LiveClient()
+        await client.connect("127.0.0.1", 8765)
+        await client.send("go")
+        frame = await client.receive()      # client.state suit l'état du serveur
+    """
+
+    def __init__(self):
+        self._reader = None
+        self._writer = None
+        self.state = None
+        self.width = self.height = 0
+        self.generation = 0
+        self.frames = 0
+        self.full_frames = 0
+        self.messages = []      # messages texte (erreurs)
+
+    async def connect(self, host: str = "127.0.0.1", port: int = 8765):
+        self._reader, self._writer = await asyncio.open_connection(host, port)
+        key = base64.b64encode(os.urandom(16)).decode()
+        self._writer.write((
+            f"GET / HTTP/1.1\r\nHost: {host}:{port}\r\n"
+            "Upgrade: websocket\r\nConnection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n"
+        ).encode())
+        response = (await self._reader.readuntil(b"\r\n\r\n")).decode("latin-1")
+        if " 101 " not in response.split("\r\n")[0] or accept_key(key) not in response:
+            raise ConnectionError(f"Poignée de main refusée : {response.splitlines()[0]}")
+
+    async def send(self, command: str):
+        self._writer.write(encode_ws(command.encode(), OP_TEXT, mask=True))
+        await self._writer.drain()
+
+    async def receive(self) -> dict:
+        """Reçoit un message et l'applique à la copie locale de l'état"""
+        while True:
+            opcode, payload = await read_ws(self._reader)
+            if opcode == OP_TEXT:
+                self.messages.append(payload.decode())
+                return {"type": "text", "text": payload.decode()}
+            if opcode == OP_BINARY:
+                break
+        frame = decode_frame(payload)
+        self.frames += 1
+        self.generation = frame["generation"]
+        if frame["type"] == "full":
+            self.full_frames += 1
+            self.width, self.height, self.state = frame["width"], frame["height"], frame["state"]
+        else:
+            apply_delta(self.state, frame["born"], frame["died"])
+        return frame
+
+    async def close(self):
+        self._writer.write(encode_ws(struct.pack("!H", 1000), OP_CLOSE, mask=True))
+        await self._writer.drain()
+        self._writer.close()
+
+
+# Client navigateur (servi sur GET /)
+_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Jeu de la Vie</title></head>
+<body style="font-family: sans-serif">
+<div>
+  <button onclick="send('go')">Go</button> <button onclick="send('stop')">Stop</button>
+  <button onclick="send('step')">Step</button> <button onclick="send('reset')">Reset</button>
+  <button onclick="send('canon')">Canon</button> <button onclick="send('random')">Aléa</button>
+  <button onclick="send('empty')">Vider</button> <span id="info"></span>
+</div>
+<canvas id="grid"></canvas>
+<script>
+const SIZE = 8, canvas = document.getElementById("grid"), ctx = canvas.getContext("2d");
+let width = 0, state = null;
+const ws = new WebSocket("ws://" + location.host + "/");
+ws.binaryType = "arraybuffer";
+function send(command) { ws.send(command); }
+function draw(index, alive) {
+  ctx.fillStyle = alive ? "#222" : "#fff";
+  ctx.fillRect((index % width) * SIZE, Math.floor(index / width) * SIZE, SIZE - 1, SIZE - 1);
+}
+ws.onmessage = (event) => {
+  if (typeof event.data === "string") { document.getElementById("info").textContent = event.data; return; }
+  const view = new DataView(event.data), type = view.getUint8(0), generation = view.getUint32(1, true);
+  if (type === 0) {
+    width = view.getUint16(5, true); const height = view.getUint16(7, true);
+    canvas.width = width * SIZE; canvas.height = height * SIZE; state = new Uint8Array(width * height);
+    for (let i = 0; i < state.length; i++) { state[i] = (view.getUint8(9 + (i >> 3)) >> (i & 7)) & 1; draw(i, state[i]); }
+  } else {
+    const born = view.getUint32(5, true), died = view.getUint32(9, true);
+    for (let k = 0; k < born + died; k++) { const i = view.getUint32(13 + 4 * k, true); state[i] = k < born ? 1 : 0; draw(i, state[i]); }
+  }
+  document.getElementById("info").textContent = "Génération " + generation;
+};
+canvas.onclick = (event) => send("click " + Math.floor(event.offsetX / SIZE) + " " + Math.floor(event.offsetY / SIZE) + " 1");
+canvas.oncontextmenu = (event) => { event.preventDefault(); send("click " + Math.floor(event.offsetX / SIZE) + " " + Math.floor(event.offsetY / SIZE) + " 3"); };
+</script>
+</body></html>
+"""
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serveur WebSocket du Jeu de la Vie")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--width", type=int, default=80, help="largeur en cellules")
+    parser.add_argument("--height", type=int, default=60, help="hauteur en cellules")
+    args = parser.parse_args(argv)
+
+    controller = LiveController(canvas_width=args.width, canvas_height=args.height, cell_size=1)
+    server = LiveServer(controller, args.host, args.port)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("\nServeur arrêté")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""
+Module livesweep.py
+Balayage de paramètres (densité, taille, règle, graine) sur des soupes aléatoires
+
+Chaque configuration est simulée sans interface graphique jusqu'à
+stabilisation (retour d'un état déjà vu) ou jusqu'à max_generations.
+On mesure :
+- la durée de vie (génération à laquelle le cycle final commence)
+- la période du cycle final (1 = figé)
+- la population finale
+
+Les configurations sont réparties sur un pool de processus (une par tâche,
+aucune donnée partagée) et chaque résultat est écrit dès qu'il arrive, en
+JSONL ou en CSV. Un balayage interrompu peut être relancé avec la même
+commande : les configurations déjà présentes dans le fichier sont sautées.
+    python livesweep.py --densities 10,25,40 --sizes 32,64 --seeds 0-9 --out sweep.jsonl
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from livemodel import LiveModel, RandomStrategy, CONWAY_RULE
+
+DEFAULT_MAX_GENERATIONS = 5000
+
+FIELDS = ["key", "density", "size", "rule", "seed",
+          "lifespan", "period", "final_population", "stabilised", "seconds"]
+
+
+# ============================================================================
+# Configurations
+# ============================================================================
+
+
+def config_key(config: dict) -> str:
+    """Identifiant unique d'une configuration (sert à la reprise)"""
+    return f"d{config['density']}_s{config['size']}_{config['rule']}_seed{config['seed']}"
+
+
+def sweep_grid(densities, sizes, rules=(CONWAY_RULE,), seeds=(0,)) -> list:
+    """Produit cartésien des paramètres : une configuration (dict) par combinaison"""
+    return [
+        {"density": density, "size": size, "rule": rule.upper(), "seed": seed}
+        for density, size, rule, seed in itertools.product(densities, sizes, rules, seeds)
+    ]
+
+
+# ============================================================================
+# Simulation d'une configuration (exécutée dans un processus du pool)
+# ============================================================================
+
+
+def run_to_stabilisation(model, max_generations: int = DEFAULT_MAX_GENERATIONS) -> tuple:
+    """
+    Fait avancer le modèle jusqu'à ce qu'un état revienne
+    On garde l'empreinte de chaque état : dès qu'un état revient, le cycle final
+    est trouvé (durée de vie = première apparition, période = écart)
+    :return: (durée de vie, période), période None si pas stabilisé à max_generations
+    """
+    seen = {hash(model.get_state()): 0}     # empreinte -> génération
+    for generation in range(1, max_generations + 1):
+        model.next_generation()
+        fingerprint = hash(model.get_state())
+        first = seen.get(fingerprint)
+        if first is not None:
+            return first, generation - first
+        seen[fingerprint] = generation
+    return max_generations, None
+
+
+def run_config(config: dict, max_generations: int = DEFAULT_MAX_GENERATIONS) -> dict:
+    """Simule une soupe jusqu'à stabilisation et renvoie ses statistiques"""
+    size = config["size"]
+    model = LiveModel(size, size, 1, rule=config["rule"])
+    model.set_strategy(RandomStrategy(config["density"], seed=config["seed"]))
+
+    start = time.perf_counter()
+    model.apply_strategy()
+    lifespan, period = run_to_stabilisation(model, max_generations)
+
+    result = {"key": config_key(config)}
+    result.update(config)
+    result.update({
+        "lifespan": lifespan,
+        "period": period,
+        "final_population": model.count_alive_cells(),
+        "stabilised": period is not None,
+        "seconds": round(time.perf_counter() - start, 4),
+    })
+    return result
+
+
+# ============================================================================
+# Écriture des résultats (JSONL ou CSV) et reprise
+# ============================================================================
+
+
+def _format_of(path: str, fmt: str = None) -> str:
+    fmt = fmt or ("csv" if path.lower().endswith(".csv") else "jsonl")
+    if fmt not in ("jsonl", "csv"):
+        raise ValueError(f"Format inconnu : {fmt} (jsonl ou csv)")
+    return fmt
+
+
+def completed_keys(path: str, fmt: str = None) -> set:
+    """Clés des configurations déjà écrites dans le fichier (reprise)"""
+    if not os.path.exists(path):
+        return set()
+    keys = set()
+    with open(path, encoding="utf-8", newline="") as f:
+        if _format_of(path, fmt) == "csv":
+            for row in csv.DictReader(f):
+                if row.get("key") and row.get("seconds"):
+                    keys.add(row["key"])
+        else:
+            for line in f:
+                try:
+                    keys.add(json.loads(line)["key"])
+                except (ValueError, KeyError):
+                    pass    # ligne tronquée par une interruption
+    return keys
+
+
+def read_results(path: str, fmt: str = None) -> list:
+    """Relit un fichier de résultats (dicts, valeurs CSV converties)"""
+    with open(path, encoding="utf-8", newline="") as f:
+        if _format_of(path, fmt) == "jsonl":
+            return [json.loads(line) for line in f if line.strip()]
+        rows = []
+        for row in csv.DictReader(f):
+            for field in ("size", "seed", "lifespan", "final_population"):
+                row[field] = int(row[field])
+            row["density"] = _number(row["density"])
+            row["period"] = int(row["period"]) if row["period"] else None
+            row["stabilised"] = row["stabilised"] == "True"
+            row["seconds"] = float(row["seconds"])
+            rows.append(row)
+        return rows
+
+
+class _ResultWriter:
+    """Ajoute les résultats au fichier, ligne par ligne (flush à chaque écriture)"""
+
+    def __init__(self, path: str, fmt: str):
+        self._fmt = fmt
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        if not new_file:
+            with open(path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                truncated = f.read(1) != b"\n"
+        self._file = open(path, "a", encoding="utf-8", newline="")
+        if not new_file and truncated:
+            self._file.write("\n")    # termine une ligne coupée par une interruption
+        if fmt == "csv":
+            self._csv = csv.DictWriter(self._file, fieldnames=FIELDS)
+            if new_file:
+                self._csv.writeheader()
+
+    def write(self, result: dict):
+        if self._fmt == "csv":
+            self._csv.writerow({field: result[field] for field in FIELDS})
+        else:
+            self._file.write(json.dumps(result, sort_keys=True) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+# ============================================================================
+# Balayage
+# ============================================================================
+
+
+def run_sweep(configs, out_path: str, fmt: str = None, workers: int = None, resume: bool = True,
+              max_generations: int = DEFAULT_MAX_GENERATIONS, verbose: bool = False) -> list:
+    """
+    Lance toutes les configurations sur un pool de processus
+    :param workers: nombre de processus (défaut : nombre de cœurs), 1 = sans pool
+    :param resume: saute les configurations déjà présentes dans out_path
+    :return: les résultats calculés par cet appel (dans l'ordre d'arrivée)
+    """
+    fmt = _format_of(out_path, fmt)
+    if not resume and os.path.exists(out_path):
+        os.remove(out_path)
+    done = completed_keys(out_path, fmt)
+    pending = [config for config in configs if config_key(config) not in done]
+
+    results = []
+    writer = _ResultWriter(out_path, fmt)
+    try:
+        if workers == 1:
+            finished = (run_config(config, max_generations) for config in pending)
+            for result in finished:
+                _collect(result, writer, results, len(pending), verbose)
+        elif pending:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(run_config, config, max_generations) for config in pending]
+                for future in as_completed(futures):
+                    _collect(future.result(), writer, results, len(pending), verbose)
+    finally:
+        writer.close()
+    return results
+
+
+def _collect(result, writer, results, total, verbose):
+    writer.write(result)
+    results.append(result)
+    if verbose:
+        period = result["period"] if result["stabilised"] else "?"
+        print(f"[{len(results)}/{total}] {result['key']:<28} vie {result['lifespan']:>5} "
+              f"période {period:>3} population {result['final_population']:>6} "
+              f"({result['seconds']:.2f} s)")
+
+
+def _number(text: str):
+    """ "25" -> 25, "12.5" -> 12.5 (clés de configuration lisibles)"""
+    value = float(text)
+    return int(value) if value.is_integer() else value
+
+
+def _parse_values(text: str, cast=int) -> list:
+    """ "1,2,5" ou "0-9" (intervalle inclus) -> liste de valeurs"""
+    values = []
+    for part in text.split(","):
+        if cast is int and "-" in part.strip("-"):
+            low, high = part.split("-")
+            values.extend(range(int(low), int(high) + 1))
+        else:
+            values.append(cast(part))
+    return values
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Balayage de paramètres du Jeu de la Vie")
+    parser.add_argument("--densities", default="25", help="pourcentages, ex : 10,25,40")
+    parser.add_argument("--sizes", default="64", help="côtés de grille, ex : 32,64")
+    parser.add_argument("--rules", default=CONWAY_RULE, help="ex : B3/S23,B36/S23")
+    parser.add_argument("--seeds", default="0-9", help="ex : 0-99 ou 1,5,7")
+    parser.add_argument("--max-generations", type=int, default=DEFAULT_MAX_GENERATIONS)
+    parser.add_argument("--workers", type=int, default=None, help="défaut : nombre de cœurs")
+    parser.add_argument("--format", choices=("jsonl", "csv"), default=None,
+                        help="défaut : d'après l'extension de --out")
+    parser.add_argument("--out", default="sweep.jsonl")
+    parser.add_argument("--restart", action="store_true", help="ignore les résultats existants")
+    args = parser.parse_args(argv)
+
+    configs = sweep_grid(
+        densities=_parse_values(args.densities, _number),
+        sizes=_parse_values(args.sizes),
+        rules=args.rules.split(","),
+        seeds=_parse_values(args.seeds),
+    )
+    start = time.perf_counter()
+    results = run_sweep(configs, args.out, fmt=args.format, workers=args.workers,
+                        resume=not args.restart, max_generations=args.max_generations, verbose=True)
+    print(f"\n{len(results)} configurations calculées ({len(configs) - len(results)} déjà faites) "
+          f"en {time.perf_counter() - start:.1f} s -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+Module liveuniverse.py
+Plusieurs simulations indépendantes dans le même processus
+
+Chaque univers possède son propre modèle (LiveModel ou un autre moteur :
+BitLiveModel, AdaptiveLiveModel, ChunkedLiveModel...), son propre compteur
+et son budget mémoire. Le gestionnaire peut faire avancer les univers en
+cours à tour de rôle (round-robin) ou en parallèle (pool de threads).
+
+Les budgets sont vérifiés à la création, puis après chaque génération et
+chaque redimensionnement (l'historique et les tuiles grandissent) : un
+univers qui dépasse est mis en pause et MemoryError est levée.
+
+    manager = UniverseManager(memory_budget=64 * 1024 * 1024)
+    a = manager.create("gauche", 100, 100, RandomStrategy(25, seed=1))
+    b = manager.create("droite", 100, 100, RandomStrategy(25, seed=2), model_factory=BitLiveModel)
+    manager.start_all()
+    manager.step_round_robin(10)
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from livemodel import LiveModel
+from livecounter import LiveCounter
+
+
+class Universe:
+    """
+    Un univers : un modèle + son compteur (observer) + son budget mémoire
+    """
+
+    def __init__(self, name: str, width: int, height: int, memory_budget: int = None,
+                 model_factory=LiveModel):
+        """
+        :param model_factory: classe du modèle (LiveModel ou sous-classe) ou fonction
+                              appelée avec (largeur, hauteur, taille de cellule = 1)
+        """
+        self._name = name
+        self._model = model_factory(width, height, 1)
+        self._counter = LiveCounter()
+        self._model.set_counter(self._counter)
+        self._memory_budget = memory_budget
+        self.check_budget()
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def model(self):
+        return self._model
+
+    @property
+    def counter(self):
+        return self._counter
+
+    @property
+    def memory_budget(self):
+        return self._memory_budget
+
+    def memory_used(self) -> int:
+        """Mémoire estimée de l'univers (octets), relue dans le modèle à chaque appel"""
+        return self._model.memory_estimate()
+
+    def check_budget(self):
+        """Lève MemoryError (univers mis en pause) si l'univers dépasse son budget"""
+        if self._memory_budget is not None and self.memory_used() > self._memory_budget:
+            self._model.pause()
+            raise MemoryError(
+                f"Univers '{self._name}' : {self.memory_used()} octets utilisés, budget {self._memory_budget}")
+
+    def apply(self, strategy):
+        """Applique une stratégie de configuration (pattern Strategy)"""
+        self._model.set_strategy(strategy)
+        self._model.apply_strategy()
+
+    def step(self, generations: int = 1):
+        """Avance de n générations (budget vérifié après chacune)"""
+        for _ in range(generations):
+            self._model.next_generation()
+            self.check_budget()
+
+    def resize(self, width: int, height: int, anchor: str = "topleft"):
+        """Redimensionne le modèle, puis vérifie le budget"""
+        self._model.resize(width, height, anchor)
+        self.check_budget()
+
+    def __str__(self):
+        return f"Universe({self._name}, {self._model}, {self._counter.alive_count} vivantes)"
+
+
+class UniverseManager:
+    """
+    Gestionnaire d'univers : création, suppression et avance des simulations
+    Le budget mémoire global est partagé entre tous les univers
+    """
+
+    def __init__(self, memory_budget: int = None):
+        self._universes = {}    # nom -> Universe (ordre de création conservé)
+        self._memory_budget = memory_budget
+        self._next_turn = 0     # prochain univers pour le round-robin
+
+    def create(self, name: str, width: int, height: int, strategy=None, memory_budget: int = None,
+               model_factory=LiveModel) -> Universe:
+        """
+        Crée un univers indépendant
+        :param memory_budget: budget propre à l'univers (en plus du budget global)
+        :param model_factory: moteur de l'univers, voir Universe
+        """
+        if name in self._universes:
+            raise ValueError(f"L'univers '{name}' existe déjà")
+
+        # le modèle est créé pour être mesuré : chaque moteur a sa propre empreinte
+        universe = Universe(name, width, height, memory_budget, model_factory)
+        needed = universe.memory_used()
+        if self._memory_budget is not None and self.memory_used() + needed > self._memory_budget:
+            raise MemoryError(
+                f"Budget global dépassé : {self.memory_used() + needed} > {self._memory_budget} octets")
+        if strategy is not None:
+            universe.apply(strategy)
+        self._universes[name] = universe
+        return universe
+
+    def get(self, name: str) -> Universe:
+        return self._universes[name]
+
+    def remove(self, name: str):
+        """Supprime un univers (sa mémoire est libérée)"""
+        del self._universes[name]
+
+    @property
+    def names(self):
+        return list(self._universes)
+
+    def __iter__(self):
+        return iter(list(self._universes.values()))
+
+    def __len__(self):
+        return len(self._universes)
+
+    def memory_used(self) -> int:
+        """Mémoire estimée de tous les univers"""
+        return sum(universe.memory_used() for universe in self._universes.values())
+
+    def check_budget(self, universe: Universe = None):
+        """
+        Lève MemoryError si tous les univers ensemble dépassent le budget global
+        :param universe: univers qui vient de grandir, mis en pause en cas de dépassement
+        """
+        if self._memory_budget is not None and self.memory_used() > self._memory_budget:
+            if universe is not None:
+                universe.model.pause()
+            raise MemoryError(f"Budget global dépassé : {self.memory_used()} > {self._memory_budget} octets")
+
+    def resize(self, name: str, width: int, height: int, anchor: str = "topleft"):
+        """Redimensionne un univers, puis vérifie son budget et le budget global"""
+        universe = self._universes[name]
+        universe.resize(width, height, anchor)
+        self.check_budget(universe)
+
+    def start_all(self):
+        for universe in self._universes.values():
+            universe.model.start()
+
+    def pause_all(self):
+        for universe in self._universes.values():
+            universe.model.pause()
+
+    def running(self):
+        """Univers dont la simulation est en cours"""
+        return [universe for universe in self._universes.values() if universe.model.running]
+
+    def step_round_robin(self, turns: int = 1) -> list:
+        """
+        Avance les univers en cours une génération à la fois, à tour de rôle
+        (l'ordre reprend là où le tour précédent s'est arrêté)
+        :return: les noms des univers avancés, dans l'ordre
+        """
+        stepped = []
+        for _ in range(turns):
+            universes = self.running()
+            if not universes:
+                break
+            universe = universes[self._next_turn % len(universes)]
+            self._next_turn = (self._next_turn + 1) % len(universes)
+            universe.step()
+            stepped.append(universe.name)
+            self.check_budget(universe)
+        return stepped
+
+    def step_parallel(self, generations: int = 1, max_workers: int = None):
+        """
+        Avance tous les univers en cours de n générations, en parallèle
+        (un thread par univers : les modèles ne partagent aucune donnée)
+        """
+        universes = self.running()
+        if not universes:
+            return
+        with ThreadPoolExecutor(max_workers=max_workers or len(universes)) as pool:
+            for future in [pool.submit(universe.step, generations) for universe in universes]:
+                future.result()     # remonte les exceptions éventuelles (budget propre dépassé...)
+        if self._memory_budget is not None and self.memory_used() > self._memory_budget:
+            for universe in universes:
+                universe.model.pause()
+            self.check_budget()
@@ -1,3 +1,6 @@
+import re
+import time
+from itertools import chain
 from tkinter import *
 
 
@@ -8,12 +11,12 @@ from tkinter import *
 class CellIterator:
     """Itérateur pour parcourir toutes les cellules de la grille
     Pattern Iterator explicite
+    Les cellules sont lues une par une (pas de liste de toute la grille)
     """
 
     def __init__(self, model):
         self._model = model
-        self._cells = list(model.get_all_cells())   # on récupère toutes les cellules
-        self._index = 0
+        self._cells = iter(model.get_all_cells())
 
     def __iter__(self):
         """Retourne l'itérateur lui-meme"""
@@ -21,12 +24,144 @@ class CellIterator:
 
     def __next__(self):
         """Retourne la prochaine cellule"""
-        if self._index >= len(self._cells):
-            raise StopIteration
+        return next(self._cells)
 
-        call = self._cells[self._index]
-        self._index += 1
-        return call
+
+class LiveCellIterator(CellIterator):
+    """
+    Cellules vivantes seulement : (x, y)
+    Trouvées par recherche d'octets dans la vue de l'état (sans copie) :
+    les cellules mortes ne coûtent rien
+    """
+
+    def __init__(self, model):
+        self._model = model
+        view = model.state_view()
+        width = view.matrix_width
+        self._cells = (divmod(match.start(), width)[::-1] for match in re.finditer(b"\x01", view.buffer))
+
+
+class ChangedCellIterator(CellIterator):
+    """
+    Cellules dont l'état a changé depuis la génération donnée : (x, y, vivante)
+    Servies par l'index du modèle (changed_since) ; si le modèle ne connaît
+    pas cette génération (ou n'a pas d'index), toutes les cellules sont rendues
+    et known est faux : redessiner toute la grille coûte alors moins cher
+    """
+
+    def __init__(self, model, generation: int):
+        self._model = model
+        view = model.state_view()
+        width, state = view.matrix_width, view.buffer
+        changed_since = getattr(model, "changed_since", None)
+        indices = changed_since(generation) if changed_since is not None else None
+        self.known = indices is not None
+        if indices is None:
+            indices = range(len(state))
+        self._cells = ((index % width, index // width, state[index] == 1) for index in indices)
+
+
+class RegionIterator(CellIterator):
+    """
+    Cellules d'un rectangle (x, y, largeur, hauteur), ligne par ligne : (x, y, vivante)
+    Lit seulement les lignes du rectangle dans la vue de l'état ; la partie
+    hors de la grille est ignorée
+    """
+
+    def __init__(self, model, x: int, y: int, width: int, height: int):
+        self._model = model
+        view = model.state_view()
+        x0, x1 = max(0, x), min(view.matrix_width, x + width)
+        y0, y1 = max(0, y), min(view.matrix_height, y + height)
+        self._cells = self._walk(view.buffer, view.matrix_width, x0, x1, y0, y1)
+
+    @staticmethod
+    def _walk(state, width, x0, x1, y0, y1):
+        for y in range(y0, y1):
+            row = state[y * width + x0:y * width + x1]
+            for x, value in enumerate(row, x0):
+                yield x, y, value == 1
+
+# ============================================================================
+# PLANIFICATION DU RENDU : au plus un redessin par image
+# ============================================================================
+
+class RenderScheduler:
+    """
+    Regroupe les demandes de redessin
+    N'importe quel composant marque la vue à redessiner (mark_dirty) : la
+    première demande programme un seul rappel after_idle, les suivantes s'y
+    ajoutent (toute la grille, ou l'union des cellules demandées). Tk dessine
+    ensuite quand sa boucle d'événements est libre : pas de update() forcé.
+    Deux rendus sont espacés d'au moins frame_ms ; les demandes absorbées par
+    un rendu déjà programmé sont comptées (coalesced).
+    """
+
+    def __init__(self, window, render, frame_ms: int = 16, clock=time.perf_counter):
+        """
+        :param window: fenêtre Tk (ou tout objet avec after et after_idle)
+        :param render: render(cells, coalesced) ; cells = None : toute la grille,
+            coalesced = nb de demandes regroupées dans ce rendu
+        :param frame_ms: intervalle minimal entre deux rendus (ms)
+        """
+        self._window = window
+        self._render = render
+        self._frame = frame_ms / 1000
+        self._clock = clock
+        self._pending = False       # rendu programmé, pas encore fait
+        self._full = False          # toute la grille à redessiner
+        self._cells = set()         # sinon : cellules (x, y) à redessiner
+        self._merged = 0            # demandes regroupées dans le rendu programmé
+        self._last = None           # instant du dernier rendu
+        self._renders = 0
+        self._coalesced = 0
+
+    @property
+    def pending(self):
+        return self._pending
+
+    @property
+    def renders(self):
+        """Nombre de rendus faits"""
+        return self._renders
+
+    @property
+    def coalesced(self):
+        """Nombre de demandes absorbées par un rendu déjà programmé (images économisées)"""
+        return self._coalesced
+
+    def mark_dirty(self, cells=None):
+        """
+        Demande un redessin
+        :param cells: cellules (x, y) à redessiner, None : toute la grille
+        """
+        if cells is None:
+            self._full = True
+            self._cells.clear()
+        elif not self._full:
+            self._cells.update(cells)
+        if self._pending:
+            self._merged += 1
+            self._coalesced += 1
+            return
+        self._pending = True
+        wait = 0 if self._last is None else self._last + self._frame - self._clock()
+        if wait > 0:
+            # trop tôt après le rendu précédent : attendre la prochaine image
+            self._window.after(max(1, round(wait * 1000)), lambda: self._window.after_idle(self.flush))
+        else:
+            self._window.after_idle(self.flush)
+
+    def flush(self):
+        """Fait le rendu en attente (rappel after_idle) ; rien s'il n'y en a pas"""
+        if not self._pending:
+            return
+        cells = None if self._full else self._cells
+        merged = self._merged
+        self._pending, self._full, self._cells, self._merged = False, False, set(), 0
+        self._last = self._clock()
+        self._renders += 1
+        self._render(cells, merged)
 
 # ============================================================================
 # CANVAS - Affichage de la grille
@@ -43,10 +178,12 @@ class LiveCanvas:
         self._height = height
         self._cell_size = cell_size
         self._controller = controller
+        self._drawn_size = None     # taille (en cellules) de la grille dessinée
+        self._items = set()         # cellules (x, y) qui ont un rectangle sur le canvas
 
-        # créer le canvas tkinter
-        self._canvas = Canvas(parent, width=width, height=height, bg="white")
-        self._canvas.pack(side=TOP, padx=5, pady=5)
+        # créer le canvas tkinter (il suit la taille de la fenêtre)
+        self._canvas = Canvas(parent, width=width, height=height, bg="white", highlightthickness=0)
+        self._canvas.pack(side=TOP, padx=5, pady=5, fill=BOTH, expand=True)
 
         self._bind_clicks()
         self.draw_grid()
@@ -55,14 +192,30 @@ class LiveCanvas:
         """ lie les clics souris au controller"""
         self._canvas.bind("<Button-1>", self._on_left_click)
         self._canvas.bind("<Button-3>", self._on_right_click)
+        # dessin en glissant (bouton enfoncé)
+        self._canvas.bind("<B1-Motion>", self._on_drag)
+        self._canvas.bind("<B3-Motion>", self._on_drag)
+        self._canvas.bind("<ButtonRelease-1>", self._on_release)
+        self._canvas.bind("<ButtonRelease-3>", self._on_release)
+        self._canvas.bind("<Configure>", self._on_resize)
 
     def _on_left_click(self, event):
-        """Clic gauche : active/desactive une cellule"""
-        self._controller.gui_cell_click(event.x, event.y, 1)
+        """Clic gauche : active une cellule (et celles du glisser qui suit)"""
+        self._controller.gui_paint_start(event.x, event.y, 1)
 
     def _on_right_click(self, event):
-        """Clic droit : tue une cellule"""
-        self._controller.gui_cell_click(event.x, event.y, 3)
+        """Clic droit : tue une cellule (et celles du glisser qui suit)"""
+        self._controller.gui_paint_start(event.x, event.y, 3)
+
+    def _on_drag(self, event):
+        self._controller.gui_paint_move(event.x, event.y)
+
+    def _on_release(self, event):
+        self._controller.gui_paint_end()
+
+    def _on_resize(self, event):
+        """La fenêtre change de taille : la grille suit (motif conservé)"""
+        self._controller.gui_resize(event.width // self._cell_size, event.height // self._cell_size)
 
     def draw_grid(self):
         """Dessine les lignes de la grille"""
@@ -87,7 +240,7 @@ class LiveCanvas:
         self._canvas.create_rectangle(
             pixel_x, pixel_y,
             pixel_x + self._cell_size, pixel_y + self._cell_size,
-            fill=color, outline="black"
+            fill=color, outline="black", tags=f"c{x}_{y}"
         )
 
     def clear(self):
@@ -97,16 +250,63 @@ class LiveCanvas:
     def redraw(self, model):
         """
         Redessine toutes les cellules,
-        Utilise le pattern Iterator via model.get_all_cells()
+        Utilise le pattern Iterator (RegionIterator sur toute la grille :
+        lecture directe de l'état, sans créer d'objets LiveCell)
+        Si le modèle connaît le rectangle des vivantes (live_box), seul ce
+        rectangle est dessiné : ailleurs le fond blanc et la grille suffisent
         :param model:
         :return:
         """
+        self._width = model.matrix_width * self._cell_size
+        self._height = model.matrix_height * self._cell_size
         self.clear()
         self.draw_grid()
-
-        # Tiliser l'itérateur explicite (pattern Iterator)
-        for cell in CellIterator(model):
-            self.draw_cell(cell.x, cell.y, cell.is_alive())
+        self._items = set()
+
+        live_box = getattr(model, "live_box", None)
+        box = live_box() if live_box is not None else (0, 0, model.matrix_width, model.matrix_height)
+        if box is not None:
+            x0, y0, x1, y1 = box
+            # Tiliser l'itérateur explicite (pattern Iterator)
+            for x, y, alive in RegionIterator(model, x0, y0, x1 - x0, y1 - y0):
+                self.draw_cell(x, y, alive)
+                self._items.add((x, y))
+        self._drawn_size = (model.matrix_width, model.matrix_height)
+
+    def redraw_cells(self, model, cells):
+        """
+        Redessine seulement quelques cellules (x, y) : on change la couleur du
+        rectangle existant, sans recréer la grille
+        """
+        width = model.matrix_width
+        if self._drawn_size != (width, model.matrix_height):
+            self.redraw(model)      # rien de dessiné à cette taille : tout redessiner
+            return
+        state = model.state_view().buffer     # lecture directe, sans copie
+        itemconfig = self._canvas.itemconfig
+        for x, y in cells:
+            if 0 <= x < width and 0 <= y < model.matrix_height:
+                if (x, y) in self._items:
+                    itemconfig(f"c{x}_{y}", fill='black' if state[y * width + x] else 'white')
+                else:       # hors du rectangle dessiné : pas encore de rectangle
+                    self.draw_cell(x, y, state[y * width + x] == 1)
+                    self._items.add((x, y))
+
+    def redraw_since(self, model, generation: int, cells=()):
+        """
+        Redessine les cellules changées depuis la génération dessinée
+        (ChangedCellIterator) et les cellules (x, y) données : le coût suit
+        l'activité, pas la taille de la grille. Tout est redessiné si la taille
+        a changé ou si le modèle ne connaît plus cette génération
+        """
+        if self._drawn_size != (model.matrix_width, model.matrix_height):
+            self.redraw(model)
+            return
+        changed = ChangedCellIterator(model, generation)
+        if not changed.known:
+            self.redraw(model)
+            return
+        self.redraw_cells(model, chain(cells, ((x, y) for x, y, _alive in changed)))
 
 # ============================================================================
 # BARRE DE COMMANDES
@@ -146,6 +346,10 @@ class LiveCommandBar:
         btn_step = Button(self._frame, text='Step', command=self._controller.gui_step, width=10)
         btn_step.pack(side=LEFT, padx=3, pady=3)
 
+        # Bouton Back (une génération en arrière)
+        btn_back = Button(self._frame, text='Back', command=self._controller.gui_back, width=10)
+        btn_back.pack(side=LEFT, padx=3, pady=3)
+
         # Bouton Canon à planeurs
         btn_canon = Button(self._frame, text='Canon planeur', command=self._controller.gui_canon, width=10)
         btn_canon.pack(side=LEFT, padx=3, pady=3)
@@ -158,6 +362,18 @@ class LiveCommandBar:
         btn_empty = Button(self._frame, text='Vider', command=self._controller.gui_empty, width=10)
         btn_empty.pack(side=LEFT, padx=3, pady=3)
 
+        # Bouton Profil (mesure des phases, affichée dans la barre d'infos)
+        btn_profile = Button(self._frame, text='Profil', command=self._controller.gui_toggle_profiler, width=10)
+        btn_profile.pack(side=LEFT, padx=3, pady=3)
+
+        # Bouton Enregistrer (une image par génération dans recording.liferec)
+        btn_record = Button(self._frame, text='Enreg.', command=self._controller.gui_toggle_recording, width=10)
+        btn_record.pack(side=LEFT, padx=3, pady=3)
+
+        # Bouton Relire (affiche l'enregistrement à la place de la simulation)
+        btn_playback = Button(self._frame, text='Relire', command=self._controller.gui_toggle_playback, width=10)
+        btn_playback.pack(side=LEFT, padx=3, pady=3)
+
     def _create_speed_entry(self):
         """Cree le champ de vitesse"""
         label = Label(self._frame, text="Attente entre chaque étape (ms) :")
@@ -184,7 +400,13 @@ class LiveView:
         # Creer la fenêtre principale
         self._window = Tk()
         self._window.title("Jeu de la vie - Conway's Game of life")
-        self._window.resizable(False, False)
+        self._window.resizable(True, True)
+
+        # Redessins regroupés : au plus un rendu par image
+        self._scheduler = RenderScheduler(self._window, self._render)
+        # Ce qui est à l'écran : source et génération dessinées
+        self._drawn_source = None
+        self._drawn_generation = None
 
         # Récupérer les dimensions depuis le modèle
         model = controller.model
@@ -194,7 +416,7 @@ class LiveView:
 
         # Frame principal
         main_frame = Frame(self._window, bg='lightblue')
-        main_frame.pack(fill=BOTH, expand=True, padx=10, pady=10)
+        main_frame.pack(fill=X, padx=10, pady=10)
 
         # Titre
         self._create_title(main_frame)
@@ -239,9 +461,20 @@ class LiveView:
         self._counter_label.pack(side=LEFT, padx=20)
 
         # Instructions
-        instructions = Label(info_frame, text='Clic gauche: activer • Clic droit: tuer', font=('Arial', 10, 'italic'), bg='lightblue', fg='darkblue')
+        instructions = Label(info_frame, text='Clic gauche: activer • Clic droit: tuer (glisser pour dessiner)', font=('Arial', 10, 'italic'), bg='lightblue', fg='darkblue')
         instructions.pack(side=RIGHT, padx=20)
 
+        # Curseur de relecture (actif seulement en mode relecture)
+        self._seek_scale = Scale(parent, from_=0, to=0, orient=HORIZONTAL, showvalue=False,
+                                 bg='lightblue', state=DISABLED,
+                                 command=lambda value: self._controller.gui_seek(int(float(value))))
+        self._seek_scale.pack(fill=X)
+
+        # Overlay du profileur (vide tant que le profilage est désactivé)
+        self._profile_label = Label(parent, text='', font=('Courier', 9), bg='lightblue', fg='darkred')
+        self._profile_label.pack(fill=X)
+        self._profile_label.bind("<Double-Button-1>", lambda event: self._controller.gui_dump_profile())
+
     def mainloop(self):
         """Lance la boucle principale Tkinter"""
         self._window.mainloop()
@@ -251,21 +484,63 @@ class LiveView:
         """Retourne la fenêtre tkinter"""
         return self._window
 
+    @property
+    def scheduler(self):
+        return self._scheduler
+
     def update_display(self):
-        """Met à jour l'affichage
-        Redessine toutes les cellules"""
-        # Redessiner le canvas
-        self._canvas.redraw(self._controller.model)
+        """Demande un redessin de toutes les cellules (fait au prochain moment libre)"""
+        self._scheduler.mark_dirty()
+
+    def update_cells(self, cells):
+        """Demande un redessin des seules cellules (x, y) données"""
+        self._scheduler.mark_dirty(cells)
+
+    def update_changes(self):
+        """Demande un redessin de ce que les générations calculées ont changé (lu au moment du rendu)"""
+        self._scheduler.mark_dirty(())
+
+    def _render(self, cells, coalesced: int):
+        """
+        Rendu programmé par le RenderScheduler : toute la grille (cells = None)
+        ou quelques cellules, puis la barre d'infos
+        """
+        profiler = self._controller.profiler
+        if profiler is not None:
+            t = time.perf_counter_ns()
+
+        # Redessiner le canvas (modèle, ou lecteur en mode relecture) : toute
+        # la grille seulement si demandé (taille, règle...) ou si la source a
+        # changé ; sinon ce qui a changé depuis la génération dessinée
+        source = self._controller.display_source
+        if cells is None or source is not self._drawn_source:
+            self._canvas.redraw(source)
+        elif getattr(source, "changed_since", None) is None:
+            self._canvas.redraw_cells(source, cells)    # miroir du mode thread : cellules données
+        else:
+            self._canvas.redraw_since(source, self._drawn_generation, cells)
+        self._drawn_source, self._drawn_generation = source, source.generation
+        if profiler is not None:
+            t = profiler.mark("redraw", t)
 
         # Mettre a jour les infos
-        generation = self._controller.model.generation
-        alive_count = self._controller.model.count_alive_cells()
+        generation = source.generation
+        alive_count = source.count_alive_cells()
+        player = self._controller.player
+        if player is not None:
+            self._seek_scale.config(state=NORMAL, to=max(0, player.frame_count - 1))
+            self._seek_scale.set(player.position)
+        else:
+            self._seek_scale.config(state=DISABLED, to=0)
 
         self._generation_label.config(text=f"Génération: {generation}")
         self._counter_label.config(text=f"Cellules vivantes: {alive_count}")
-
-        # force le rafraichissement de la fenêtre
-        self._window.update()
+        if profiler is not None:
+            profiler.mark("info", t)
+            profiler.count("coalesced", coalesced)
+            self._profile_label.config(text=profiler.overlay_text())
+        else:
+            self._profile_label.config(text='')
 
     def schedule_next_iteration(self, delay: int, callback):
         """
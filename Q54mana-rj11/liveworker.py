@@ -0,0 +1,262 @@
+"""
+Module liveworker.py
+Simulation dans un thread à part : l'interface Tk ne fait plus que dessiner
+
+- SimulationWorker possède le modèle pendant qu'il tourne : seules ses
+  commandes le modifient (go, stop, step, clics, stratégies...). Elles sont
+  exécutées dans le thread de simulation, dans l'ordre où elles ont été
+  envoyées (file de commandes)
+- Après chaque génération (ou chaque lot de commandes), le thread publie une
+  image dans une file bornée : l'état complet la première fois ou quand la
+  taille change, sinon les indices des cellules qui ont changé
+- File pleine (l'interface dessine moins vite que la simulation) : le thread
+  n'attend pas, il garde l'image en attente et enverra plus tard la différence
+  cumulée depuis la dernière image acceptée ; la file ne dépasse jamais
+  max_frames images et l'interface affiche toujours l'état le plus récent
+- FrameMirror, côté interface, rejoue ces images et expose l'interface de
+  lecture d'un LiveModel : la vue l'affiche à la place du modèle
+
+    worker = SimulationWorker(model)
+    worker.start()
+    worker.submit(lambda model: model.stamp(PATTERNS["glider"], 3, 3))
+    worker.go()
+    ...
+    for frame in worker.drain():    # dans une callback after de Tk
+        mirror.apply(frame)
+"""
+
+import queue
+import threading
+import time
+from collections import namedtuple
+
+from livedelta import changed_indices
+from livemodel import LiveCell, StateView
+
+# Image publiée par le thread : flips = indices qui changent (None pour une
+# image complète, state = l'état entier)
+Frame = namedtuple("Frame", "generation width height flips state")
+
+_SHUTDOWN = object()
+_RETRY = 0.02       # image en attente (file pleine) : nouvel essai après ce délai (s)
+
+
+class SimulationWorker:
+    """Thread de simulation piloté par une file de commandes"""
+
+    def __init__(self, model, max_frames: int = 4, delay: float = 0.1):
+        """
+        :param max_frames: taille de la file d'images
+        :param delay: attente entre deux générations (secondes)
+        """
+        self._model = model
+        self._commands = queue.Queue()
+        self._frames = queue.Queue(maxsize=max_frames)
+        self._delay = delay
+        self._running = False       # simulation en cours (lu et écrit dans le thread)
+        self._pending = False       # une image n'a pas pu être envoyée (file pleine)
+        self._published = None      # dernier état envoyé
+        self._published_size = None
+        self._last_generation = None
+        self._thread = None
+
+    @property
+    def model(self):
+        return self._model
+
+    @property
+    def alive(self):
+        """Le thread tourne"""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def running(self):
+        """La simulation avance toute seule (go)"""
+        return self._running
+
+    def start(self):
+        if self.alive:
+            return
+        self._published = None
+        self._thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+        self._thread.start()
+
+    def shutdown(self, timeout: float = 2.0):
+        """Arrête le thread (les commandes déjà envoyées sont exécutées avant)"""
+        if not self.alive:
+            return
+        self._commands.put(_SHUTDOWN)
+        self._thread.join(timeout)
+
+    # ------------------------------------------------------------------
+    # Commandes (appelées depuis le thread de l'interface)
+    # ------------------------------------------------------------------
+
+    def submit(self, command, *args):
+        """Exécute command(model, *args) dans le thread de simulation, après les commandes déjà envoyées"""
+        self._commands.put((command, args))
+
+    def go(self):
+        self.submit(self._set_running, True)
+
+    def stop(self):
+        self.submit(self._set_running, False)
+
+    def step(self):
+        """Arrête la simulation et avance d'une génération"""
+        self.stop()
+        self.submit(lambda model: model.next_generation())
+
+    def set_delay(self, delay: float):
+        self.submit(self._set_delay, delay)
+
+    def wait_idle(self, timeout: float = None) -> bool:
+        """Attend que toutes les commandes envoyées jusqu'ici soient exécutées"""
+        done = threading.Event()
+        self.submit(lambda model: done.set())
+        return done.wait(timeout)
+
+    def drain(self, limit: int = None) -> list:
+        """Images disponibles (sans attendre), dans l'ordre ; au plus limit"""
+        frames = []
+        while limit is None or len(frames) < limit:
+            try:
+                frames.append(self._frames.get_nowait())
+            except queue.Empty:
+                break
+        return frames
+
+    # ------------------------------------------------------------------
+    # Thread de simulation
+    # ------------------------------------------------------------------
+
+    def _set_running(self, model, running: bool):
+        self._running = running
+        if running:
+            model.start()
+        else:
+            model.pause()
+
+    def _set_delay(self, _model, delay: float):
+        self._delay = delay
+
+    def _run(self):
+        self._publish()
+        next_step = time.monotonic()
+        while True:
+            timeout = max(0.0, next_step - time.monotonic()) if self._running else None
+            if self._pending:
+                timeout = _RETRY if timeout is None else min(timeout, _RETRY)
+            try:
+                command = self._commands.get(timeout=timeout)
+            except queue.Empty:
+                command = None
+
+            if command is not None:
+                # toutes les commandes en attente, puis une seule image
+                while command is not None:
+                    if command is _SHUTDOWN:
+                        return
+                    function, args = command
+                    try:
+                        function(self._model, *args)
+                    except Exception as error:      # une commande ratée ne doit pas tuer le thread
+                        print(f"Commande de simulation en échec : {error!r}")
+                    try:
+                        command = self._commands.get_nowait()
+                    except queue.Empty:
+                        command = None
+                self._publish()
+                continue
+
+            # échéance atteinte, simulation en cours : une génération
+            if self._running and time.monotonic() >= next_step:
+                self._model.next_generation()
+                next_step = time.monotonic() + self._delay
+            self._publish()
+
+    def _publish(self):
+        """Envoie ce qui a changé depuis la dernière image envoyée (rien si rien n'a changé)"""
+        if self._frames.full():
+            self._pending = True        # l'interface est en retard : différence cumulée plus tard
+            return
+        model = self._model
+        state = model.snapshot().buffer     # image figée sans copie (copie à l'écriture)
+        size = (model.matrix_width, model.matrix_height)
+        if self._published is None or size != self._published_size:
+            frame = Frame(model.generation, size[0], size[1], None, state)
+        else:
+            flips = changed_indices(self._published, state)
+            if not flips and model.generation == self._last_generation:
+                self._pending = False
+                return
+            frame = Frame(model.generation, size[0], size[1], flips, None)
+        self._frames.put_nowait(frame)      # seul ce thread remplit la file : il y a de la place
+        self._pending = False
+        self._published, self._published_size = state, size
+        self._last_generation = model.generation
+
+
+class FrameMirror:
+    """
+    Copie de l'état côté interface, mise à jour par les images du thread
+    Même interface de lecture que LiveModel (matrix_width, generation,
+    get_cell, get_all_cells, count_alive_cells, get_state)
+    """
+
+    def __init__(self, model=None):
+        self._width = self._height = 0
+        self._generation = 0
+        self._state = bytearray()
+        if model is not None:
+            self.apply(Frame(model.generation, model.matrix_width, model.matrix_height, None, model.get_state()))
+
+    def apply(self, frame: Frame):
+        if frame.flips is None:
+            self._state = bytearray(frame.state)
+        else:
+            state = self._state
+            for index in frame.flips:
+                state[index] ^= 1
+        self._width, self._height = frame.width, frame.height
+        self._generation = frame.generation
+
+    @property
+    def matrix_width(self):
+        return self._width
+
+    @property
+    def matrix_height(self):
+        return self._height
+
+    @property
+    def generation(self):
+        return self._generation
+
+    def get_state(self) -> bytes:
+        return bytes(self._state)
+
+    def state_view(self) -> StateView:
+        """État sans copie (suit les images appliquées en place)"""
+        return StateView(self._state, self._width, self._height, self._generation)
+
+    def count_alive_cells(self) -> int:
+        return self._state.count(1)
+
+    def get_cell(self, x: int, y: int) -> LiveCell:
+        """Cellule en lecture seule (copie)"""
+        if 0 <= x < self._width and 0 <= y < self._height:
+            cell = LiveCell(x, y)
+            cell.set_alive(bool(self._state[y * self._width + x]))
+            return cell
+        return None
+
+    def get_all_cells(self):
+        width = self._width
+        for index, value in enumerate(self._state):
+            cell = LiveCell(index % width, index // width)
+            cell.set_alive(bool(value))
+            yield cell
+
+    def __str__(self):
+        return f"FrameMirror({self._width}x{self._height}, génération {self._generation})"
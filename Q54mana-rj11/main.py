@@ -28,11 +28,15 @@ def main():
     print("  • Go/Stop : Démarrer/Arrêter la simulation")
     print("  • Reset : Réinitialiser la grille")
     print("  • Step : Avancer d'une génération")
+    print("  • Back : Revenir d'une génération en arrière")
     print("  • Canon : Placer un canon à planeurs")
     print("  • Aléa : Configuration aléatoire (25%)")
     print("  • Vider : Effacer toute la grille")
+    print("  • Profil : Mesurer le temps de chaque phase (double-clic sur la mesure : export JSON)")
+    print("  • Enreg. / Relire : Enregistrer la simulation, puis la relire (curseur pour naviguer)")
     print("  • Clic gauche : Activer/désactiver une cellule")
     print("  • Clic droit : Tuer une cellule")
+    print("  • Glisser (bouton enfoncé) : Dessiner / effacer des cellules")
     print("=" * 60)
     print()
 
@@ -40,7 +44,8 @@ def main():
     controller = LiveController(
         canvas_width=500,   # Largeur en pixels
         canvas_height=500,  # Hauteur en pixels
-        cell_size=10        # Taille d'une cellule en pixels
+        cell_size=10,       # Taille d'une cellule en pixels
+        threaded=True       # Simulation dans un thread : l'interface reste réactive
     )
 
     # Créer la vue
@@ -48,6 +53,7 @@ def main():
 
     # Lancer la boucle principale
     view.mainloop()
+    controller.close()
 
     print("\n✓ Application fermée. Au revoir !")
 
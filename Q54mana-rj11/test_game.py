@@ -1,6 +1,35 @@
 import unittest
-from livemodel import LiveModel, LiveCell, RandomStrategy, CanonStrategy, EmptyStrategy
+import asyncio
+import contextlib
+import io
+import json
+import os
+import random
+import struct
+import tempfile
+import time
+import tracemalloc
+import zlib
+from collections import Counter
+from livemodel import LiveModel, LiveCell, RandomStrategy, CanonStrategy, EmptyStrategy, random_mask
+from livemodel import CANON_POSITIONS, PATTERNS, TRANSFORMS, transform_pattern, parse_rule
 from livecounter import LiveCounter
+import livebench
+from liveprofiler import LiveProfiler
+from liveuniverse import UniverseManager
+import livesweep
+from livecensus import Census, KNOWN_OBJECTS, census_soups
+from livelabel import label, label_model
+from livecontroller import LiveController, line_cells
+from livedelta import diff_states, apply_delta, pack_state, unpack_state, changed_indices
+from liveserver import LiveServer, LiveClient
+from liverecord import LiveRecorder, LivePlayer, KEYFRAME, DELTA_INDICES
+import liveexport
+from liveworker import SimulationWorker, FrameMirror
+from liveview import LiveCellIterator, ChangedCellIterator, RegionIterator, RenderScheduler, LiveCanvas
+from livechunk import ChunkedLiveModel, ChunkedUniverse
+from livebits import BitLiveModel
+from liveadaptive import AdaptiveLiveModel, DENSE, SPARSE, DENSE_COST, SPARSE_COST
 
 
 class TestSingleton(unittest.TestCase):
@@ -465,6 +494,1665 @@ class TestStrategy(unittest.TestCase):
             self.assertIsNotNone(cell_top)
             self.assertIsNotNone(cell_bottom)
 
+class TestBenchmark(unittest.TestCase):
+    """Test du banc d'essai des moteurs"""
+
+    def test_engines_agree_on_small_grid(self):
+        """Tous les moteurs donnent la même population (motif loin des bords)"""
+        populations = set()
+        for engine_cls in livebench.ENGINES.values():
+            result = livebench.run_case(engine_cls, "r_pentomino", 50, generations=3)
+            populations.add(result["final_population"])
+        self.assertEqual(len(populations), 1, f"Populations différentes : {populations}")
+
+    def test_large_grid_skipped(self):
+        """Une grille au-delà de la limite du moteur (pour cette charge) est ignorée, pas calculée"""
+        largest = max(livebench.DEFAULT_SIZES) ** 2
+        self.assertGreaterEqual(livebench.BitModelEngine.cell_limit("soup25"), largest)
+        for workload in livebench.SPARSE_WORKLOADS:
+            self.assertGreaterEqual(livebench.ModelEngine.cell_limit(workload), largest)
+        self.assertLess(livebench.ModelEngine.cell_limit("soup25"), largest)
+
+        result = livebench.run_case(livebench.ModelEngine, "soup25", 4096)
+        self.assertIn("skipped", result)
+        self.assertIn(str(livebench.ModelEngine.max_cells), result["skipped"])
+        result = livebench.run_case(livebench.ProceduralEngine, "empty", 1024)
+        self.assertIn("skipped", result)
+        result = livebench.run_case(livebench.ModelEngine, "empty", 4096, generations=1)
+        self.assertNotIn("skipped", result)
+        self.assertEqual(result["final_population"], 0)
+
+    def test_singleton_untouched(self):
+        """Le benchmark ne remplace pas l'instance unique du modèle"""
+        model = LiveModel.get_instance()
+        livebench.run_case(livebench.ModelEngine, "empty", 20, generations=1)
+        self.assertIs(LiveModel.get_instance(), model)
+
+    def test_incomplete_engine_rejected(self):
+        """Un moteur sans step ne peut pas être créé (interface abstraite)"""
+        class NoStep(livebench.BenchEngine):
+            def setup(self, width, height, alive):
+                pass
+
+            def population(self):
+                return 0
+
+        with self.assertRaises(TypeError):
+            NoStep()
+
+
+class TestProfiler(unittest.TestCase):
+    """Test du profileur des phases"""
+
+    def setUp(self):
+        self.model = LiveModel.get_instance()
+        self.model.reset_all_cells()
+
+    def tearDown(self):
+        self.model.set_profiler(None)
+
+    def test_disabled_by_default(self):
+        """Sans profileur branché, rien n'est mesuré"""
+        profiler = LiveProfiler()
+        self.model.next_generation()
+        self.assertEqual(profiler.phases(), [])
+
+    def test_model_phases_recorded(self):
+        """Chaque phase de next_generation est mesurée"""
+        profiler = LiveProfiler()
+        self.model.set_profiler(profiler)
+        self.model.next_generation()
+        self.model.next_generation()
+        self.assertEqual(profiler.phases(), ["kernel", "bbox", "notify", "counter"])
+        self.assertEqual(profiler.get("kernel").count, 2)
+
+    def test_rolling_window_and_dump(self):
+        """La fenêtre est glissante et le profil s'exporte en JSON"""
+        profiler = LiveProfiler(window=3)
+        for ns in (1000, 2000, 4000, 8000):
+            profiler.record("redraw", ns)
+        stats = profiler.get("redraw")
+        self.assertEqual(stats.count, 4)
+        self.assertAlmostEqual(stats.mean_ms(), 14000 / 3 / 1e6)
+        self.assertEqual(stats.histogram(), {"2-4us": 1, "4-8us": 1, "8-16us": 1})
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "profile.json")
+            profiler.dump(path)
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        self.assertEqual(data["phases"]["redraw"]["count"], 4)
+
+
+class TestSeededRandom(unittest.TestCase):
+    """Test de la stratégie aléatoire en bloc"""
+
+    def setUp(self):
+        self.model = LiveModel.get_instance()
+
+    def _alive_positions(self):
+        return [(cell.x, cell.y) for cell in self.model.get_all_cells() if cell.is_alive()]
+
+    def test_same_seed_same_soup(self):
+        """Même graine => même configuration"""
+        RandomStrategy(25, seed=42).apply(self.model)
+        first = self._alive_positions()
+        RandomStrategy(25, seed=42).apply(self.model)
+        self.assertEqual(self._alive_positions(), first)
+        RandomStrategy(25, seed=43).apply(self.model)
+        self.assertNotEqual(self._alive_positions(), first)
+
+    def test_exact_density(self):
+        """Le nombre de cellules vivantes est exact pour chaque densité"""
+        total = self.model.matrix_width * self.model.matrix_height
+        for percentage in (0, 1, 33, 50, 99, 100):
+            RandomStrategy(percentage, seed=percentage).apply(self.model)
+            self.assertEqual(self.model.count_alive_cells(), int(total * percentage / 100))
+
+    def test_random_mask_large(self):
+        """Masque d'une grande grille : taille et nombre exact"""
+        mask = random_mask(1000 * 1000, 250000, random.Random(0))
+        self.assertEqual(len(mask), 1000 * 1000)
+        self.assertEqual(mask.count(1), 250000)
+
+
+class EventRecorder:
+    """Observer de test : mémorise les événements en bloc"""
+
+    def __init__(self):
+        self.events = []
+
+    def update_many(self, model, born, died):
+        self.events.append((born, died))
+
+
+class TestBulkWrites(unittest.TestCase):
+    """Test de l'API d'écriture en bloc"""
+
+    def setUp(self):
+        self.model = LiveModel.get_instance()
+        self.model.reset_all_cells()
+        self.recorder = EventRecorder()
+        self.model.attach_observer(self.recorder)
+
+    def tearDown(self):
+        self.model.detach_observer(self.recorder)
+
+    def test_set_many_single_event(self):
+        """set_many modifie toutes les cellules et n'émet qu'un événement"""
+        changed = self.model.set_many([(1, 1), (2, 2), (3, 3), (1, 1), (-1, 5)], True)
+        self.assertEqual(changed, 3)
+        self.assertEqual(self.recorder.events, [(3, 0)])
+        self.model.set_many([(1, 1), (4, 4)], False)
+        self.assertEqual(self.recorder.events[-1], (0, 1))
+
+    def test_fill_region_clipped(self):
+        """fill_region est coupé aux bords de la grille"""
+        changed = self.model.fill_region(45, 45, 10, 10, True)
+        self.assertEqual(changed, 25)
+        self.assertEqual(self.model.count_alive_cells(), 25)
+        self.assertEqual(self.model.fill_region(40, 40, 10, 10, False), 25)
+
+    def test_stamp_transforms(self):
+        """Un motif tourné / réfléchi est posé recalé en (x, y)"""
+        self.model.stamp("glider", 10, 10, "rot90")
+        expected = {(10 + dx, 10 + dy) for dx, dy in transform_pattern(PATTERNS["glider"], "rot90")}
+        alive = {(c.x, c.y) for c in self.model.get_all_cells() if c.is_alive()}
+        self.assertEqual(alive, expected)
+        self.assertEqual(transform_pattern([(0, 0), (1, 0), (2, 0)], "rot90"), [(0, 0), (0, 1), (0, 2)])
+        for name in TRANSFORMS:
+            self.assertEqual(len(transform_pattern(PATTERNS["r_pentomino"], name)), 5)
+
+    def test_strategy_one_event_counter_in_sync(self):
+        """Une stratégie émet un seul événement et le compteur reste juste"""
+        counter = LiveCounter()
+        self.model.set_counter(counter)
+        try:
+            self.model.set_strategy(CanonStrategy())
+            self.model.apply_strategy()
+            self.assertEqual(len(self.recorder.events), 1)
+            self.assertEqual(counter.alive_count, len(CANON_POSITIONS))
+            self.model.get_cell(0, 0).set_alive(True)
+            self.assertEqual(counter.alive_count, len(CANON_POSITIONS) + 1)
+        finally:
+            self.model.detach_observer(counter)
+
+
+class TestResize(unittest.TestCase):
+    """Test du redimensionnement sur place"""
+
+    def setUp(self):
+        self.model = LiveModel.get_instance()
+        self.model.reset_all_cells()
+        self.counter = LiveCounter()
+        self.model.set_counter(self.counter)
+
+    def tearDown(self):
+        self.model.resize(50, 50)
+        self.model.reset_all_cells()
+        self.model.detach_observer(self.counter)
+
+    def test_topleft_keeps_pattern_and_generation(self):
+        """Le motif, la génération et le compteur survivent à l'agrandissement"""
+        self.model.stamp("glider", 5, 5)
+        self.model.next_generation()
+        self.model.resize(80, 60)
+        self.assertEqual((self.model.matrix_width, self.model.matrix_height), (80, 60))
+        self.assertEqual(self.model.generation, 1)
+        self.assertEqual(self.model.count_alive_cells(), 5)
+        self.assertEqual(self.counter.alive_count, 5)
+        self.assertEqual(self.model.canvas_width, 80 * self.model.cell_size)
+
+    def test_center_shrink_crops_and_counts(self):
+        """Réduction centrée : le motif central reste, le compteur suit les pertes"""
+        self.model.set_many([(25, 25), (0, 0)], True)
+        self.counter.count_all(self.model)
+        self.model.resize(10, 10, anchor="center")
+        self.assertTrue(self.model.get_cell(5, 5).is_alive())
+        self.assertEqual(self.model.count_alive_cells(), 1)
+        self.assertEqual(self.counter.alive_count, 1)
+
+    def test_center_resize_step_by_step_matches_one_resize(self):
+        """Fenêtre tirée cellule par cellule : même position qu'un seul redimensionnement centré"""
+        self.model.resize(20, 20)
+        self.model.stamp("glider", 9, 9)
+        for size in range(19, 9, -1):
+            self.model.resize(size, size + 1, anchor="center")
+        dragged = self.model.get_state()
+        single = LiveModel(20, 20, 1)
+        single.stamp("glider", 9, 9)
+        single.resize(10, 11, anchor="center")
+        self.assertEqual(dragged, single.get_state())
+        self.assertEqual(self.model.count_alive_cells(), 5)
+        for size in range(11, 21):                      # et retour à la taille de départ
+            self.model.resize(size, size, anchor="center")
+        start = LiveModel(20, 20, 1)
+        start.stamp("glider", 9, 9)
+        self.assertEqual(self.model.get_state(), start.get_state())
+
+    def test_chunked_center_resize_step_by_step(self):
+        """Fenêtre sur l'univers : l'origine ne dérive pas non plus"""
+        model = ChunkedLiveModel(20, 20, 1)
+        model.move_viewport(7, -3)
+        for size in range(19, 9, -1):
+            model.resize(size, size, anchor="center")
+        self.assertEqual(model.origin, (12, 2))
+        for size in range(11, 21):
+            model.resize(size, size, anchor="center")
+        self.assertEqual(model.origin, (7, -3))
+
+    def test_invalid_size(self):
+        """Taille nulle refusée"""
+        with self.assertRaises(ValueError):
+            self.model.resize(0, 10)
+
+
+class TestUniverses(unittest.TestCase):
+    """Test des univers multiples"""
+
+    def test_independent_models(self):
+        """Deux univers n'ont ni le même modèle ni le même compteur"""
+        manager = UniverseManager()
+        a = manager.create("a", 30, 30, CanonStrategy())
+        b = manager.create("b", 30, 30)
+        self.assertIsNot(a.model, b.model)
+        self.assertIsNot(a.model, LiveModel.get_instance())
+        self.assertEqual(a.counter.alive_count, len([p for p in CANON_POSITIONS if p[0] < 30]))
+        self.assertEqual(b.counter.alive_count, 0)
+        with self.assertRaises(ValueError):
+            manager.create("a", 10, 10)
+
+    def test_memory_budget(self):
+        """Les budgets mémoire (global et par univers) sont respectés"""
+        manager = UniverseManager(memory_budget=100 * 100 * LiveModel.BYTES_PER_CELL)
+        manager.create("a", 100, 50)
+        with self.assertRaises(MemoryError):
+            manager.create("b", 100, 60)
+        with self.assertRaises(MemoryError):
+            manager.create("c", 10, 10, memory_budget=100)
+        manager.remove("a")
+        manager.create("b", 100, 60)
+
+    def test_model_factory(self):
+        """Chaque univers choisit son moteur (classe ou fonction)"""
+        manager = UniverseManager()
+        bits = manager.create("bits", 40, 30, CanonStrategy(), model_factory=BitLiveModel)
+        adaptive = manager.create("adaptatif", 40, 30, CanonStrategy(),
+                                  model_factory=lambda w, h, size: AdaptiveLiveModel(w, h, size, sample_every=4))
+        dense = manager.create("dense", 40, 30, CanonStrategy())
+        self.assertIsInstance(bits.model, BitLiveModel)
+        self.assertIsInstance(adaptive.model, AdaptiveLiveModel)
+        self.assertEqual(bits.counter.alive_count, dense.counter.alive_count)
+        manager.start_all()
+        manager.step_parallel(8)
+        self.assertEqual(bits.model.get_state(), dense.model.get_state())
+        self.assertEqual(adaptive.model.get_state(), dense.model.get_state())
+
+    def test_budget_checked_after_steps_and_resizes(self):
+        """Le budget est relu après chaque génération (historique) et chaque redimensionnement"""
+        manager = UniverseManager()
+        universe = manager.create("a", 50, 50, RandomStrategy(30, seed=2), memory_budget=100 * 1024)
+        universe.model.enable_history(keyframe_interval=1000)
+        manager.start_all()
+        with self.assertRaises(MemoryError):
+            manager.step_round_robin(100)     # les différences gardées finissent par dépasser
+        self.assertFalse(universe.model.running)
+        self.assertTrue(1 < universe.model.generation < 100)
+
+        manager = UniverseManager(memory_budget=60 * 60 * LiveModel.BYTES_PER_CELL)
+        manager.create("a", 50, 50)
+        with self.assertRaises(MemoryError):
+            manager.resize("a", 70, 70)
+        chunked = UniverseManager()
+        universe = chunked.create("r", 16, 16, model_factory=ChunkedLiveModel, memory_budget=20000)
+        universe.model.stamp(PATTERNS["r_pentomino"], 7, 7)
+        universe.model.start()
+        with self.assertRaises(MemoryError):
+            chunked.step_parallel(600)        # le R-pentomino sort de la fenêtre et ouvre des tuiles
+        self.assertFalse(universe.model.running)
+        self.assertLess(universe.model.generation, 600)
+
+    def test_round_robin_and_parallel(self):
+        """Seuls les univers en cours avancent, à tour de rôle ou en parallèle"""
+        manager = UniverseManager()
+        for name in ("a", "b", "c"):
+            manager.create(name, 20, 20, RandomStrategy(30, seed=1))
+        manager.start_all()
+        manager.get("c").model.pause()
+        self.assertEqual(manager.step_round_robin(3), ["a", "b", "a"])
+        manager.step_parallel(2)
+        self.assertEqual([u.model.generation for u in manager], [4, 3, 0])
+        # même graine, même nombre de générations => même état
+        manager.step_round_robin(1)
+        self.assertEqual(manager.get("a").model.count_alive_cells(),
+                         manager.get("b").model.count_alive_cells())
+
+
+class TestSweep(unittest.TestCase):
+    """Test des règles et du balayage de paramètres"""
+
+    def test_parse_rule(self):
+        """Lecture des règles B/S et HighLife (B36/S23)"""
+        self.assertEqual(parse_rule("B3/S23"), ({3}, {2, 3}))
+        self.assertEqual(parse_rule("b36/s23"), ({3, 6}, {2, 3}))
+        with self.assertRaises(ValueError):
+            parse_rule("23/3")
+        with self.assertRaises(ValueError):
+            parse_rule("B9/S23")
+
+    def test_rule_changes_evolution(self):
+        """Avec B36/S23, une morte à 6 voisins naît (pas avec Conway)"""
+        coords = [(1, 1), (2, 1), (3, 1), (1, 3), (2, 3), (3, 3)]   # (2, 2) a 6 voisins
+        results = {}
+        for rule in ("B3/S23", "B36/S23"):
+            model = LiveModel(10, 10, 1, rule=rule)
+            model.set_many(coords, True)
+            model.next_generation()
+            results[rule] = model.get_cell(2, 2).is_alive()
+        self.assertEqual(results, {"B3/S23": False, "B36/S23": True})
+
+    def test_run_config_stabilises(self):
+        """Un bloc est figé dès le départ : durée de vie 0, période 1"""
+        result = livesweep.run_config({"density": 0, "size": 8, "rule": "B3/S23", "seed": 0})
+        self.assertTrue(result["stabilised"])
+        self.assertEqual((result["lifespan"], result["period"], result["final_population"]), (0, 1, 0))
+
+    def test_sweep_jsonl_and_resume(self):
+        """Le balayage écrit une ligne par configuration et reprend là où il s'est arrêté"""
+        configs = livesweep.sweep_grid([20, 40], [16], ["B3/S23"], [0, 1])
+        self.assertEqual(len(configs), 4)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "sweep.jsonl")
+            first = livesweep.run_sweep(configs[:2], path, workers=2, max_generations=300)
+            self.assertEqual(len(first), 2)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write('{"key": "tronq')     # interruption au milieu d'une ligne
+            rest = livesweep.run_sweep(configs, path, workers=1, max_generations=300)
+            self.assertEqual({r["key"] for r in rest}, {livesweep.config_key(c) for c in configs[2:]})
+            self.assertEqual(len(livesweep.completed_keys(path)), 4)
+            # même graine => même résultat, quel que soit le processus
+            by_key = {r["key"]: r for r in first}
+            again = livesweep.run_config(configs[0], max_generations=300)
+            self.assertEqual(again["lifespan"], by_key[again["key"]]["lifespan"])
+
+    def test_sweep_csv(self):
+        """Sortie CSV relisible"""
+        configs = livesweep.sweep_grid([30], [12], ["B3/S23", "B36/S23"], [3])
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "sweep.csv")
+            livesweep.run_sweep(configs, path, workers=1, max_generations=200)
+            rows = livesweep.read_results(path)
+        self.assertEqual(sorted(row["rule"] for row in rows), ["B3/S23", "B36/S23"])
+        self.assertEqual(rows[0]["density"], 30)
+
+
+class TestCensus(unittest.TestCase):
+    """Test du recensement des objets"""
+
+    def setUp(self):
+        self.census = Census()
+
+    def test_known_objects(self):
+        """Chaque objet connu est reconnu, quelle que soit son orientation"""
+        expected = {"block": "still_life", "blinker": "oscillator", "glider": "spaceship"}
+        for name, pattern in KNOWN_OBJECTS.items():
+            for transform in TRANSFORMS:
+                found = self.census.classify(transform_pattern(pattern, transform))
+                self.assertEqual(found.name, name)
+            if name in expected:
+                self.assertEqual(found.kind, expected[name])
+        self.assertEqual(self.census.classify(PATTERNS["glider"]).period, 4)
+
+    def test_unknown_object_code(self):
+        """Un objet absent de la table reçoit un code (xs = nature morte)"""
+        snake = [(0, 0), (1, 0), (3, 0), (0, 1), (2, 1), (3, 1)]     # serpent (snake)
+        found = self.census.classify(snake)
+        self.assertEqual(found.kind, "still_life")
+        self.assertTrue(found.name.startswith("xs6_"))
+
+    def test_model_census(self):
+        """Composantes séparées, objets à cheval sur un bord et beacon en deux morceaux"""
+        model = LiveModel(20, 20, 1)
+        model.stamp("block", 5, 5)
+        model.set_many([(19, 12), (0, 12), (1, 12)], True)                    # clignotant sur le bord
+        model.set_many([(10, 0), (11, 0), (10, 1), (13, 2), (12, 3), (13, 3)], True)   # beacon
+        found = self.census.add(model)
+        self.assertEqual(sorted(obj.name for obj in found), ["beacon", "blinker", "block"])
+        self.census.merge(Counter({"block": 2}), 3)
+        self.assertEqual(self.census.soups, 4)
+        self.assertEqual(self.census.tally["block"], 3)
+
+    def test_census_soups(self):
+        """Les soupes stabilisées ne contiennent que des objets identifiés"""
+        census = census_soups(3, size=24, seed=5)
+        self.assertEqual(census.soups, 3)
+        self.assertGreater(sum(census.tally.values()), 0)
+        self.assertEqual(census_soups(3, size=24, seed=5).tally, census.tally)
+
+
+class TestLabelling(unittest.TestCase):
+    """Test de l'étiquetage des composantes connexes"""
+
+    GRID = [
+        "##....#",
+        "##...#.",
+        ".......",
+        "..#.#..",
+        "...#...",
+    ]
+
+    def state(self, rows):
+        return bytes(1 if char == "#" else 0 for row in rows for char in row)
+
+    def test_eight_and_four_connectivity(self):
+        """En 8-connexité les diagonales relient les cellules, pas en 4-connexité"""
+        state = self.state(self.GRID)
+        eight = label(state, 7, 5)
+        self.assertEqual(eight.count, 3)
+        self.assertEqual(eight.sizes, [4, 2, 3])
+        self.assertEqual(eight.boxes, [(0, 0, 2, 2), (5, 0, 2, 2), (2, 3, 3, 2)])
+        four = label(state, 7, 5, connectivity=4)
+        self.assertEqual(four.sizes, [4, 1, 1, 1, 1, 1])
+        with self.assertRaises(ValueError):
+            label(state, 7, 5, connectivity=6)
+
+    def test_label_at_and_map(self):
+        """label_at et label_map donnent la même étiquette pour chaque cellule"""
+        state = self.state(self.GRID)
+        labelling = label(state, 7, 5)
+        labels = labelling.label_map()
+        for index, value in enumerate(state):
+            self.assertEqual(labelling.label_at(index % 7, index // 7), labels[index])
+            self.assertEqual(bool(labels[index]), bool(value))
+        self.assertEqual(sorted(labelling.cells(2)), [(5, 1), (6, 0)])
+
+    def test_wrap(self):
+        """Sur la grille torique, les bords opposés se touchent"""
+        state = self.state(["#.....#", ".......", ".......", ".......", "#......"])
+        self.assertEqual(label(state, 7, 5).count, 3)
+        self.assertEqual(label(state, 7, 5, wrap=True).count, 1)
+        self.assertEqual(label(state, 7, 5, connectivity=4, wrap=True).count, 1)
+
+    def test_random_against_flood_fill(self):
+        """Même découpage qu'un parcours en largeur cellule par cellule"""
+        rng = random.Random(4)
+        width, height = 40, 30
+        state = bytes(rng.random() < 0.35 for _ in range(width * height))
+        labelling = label(state, width, height)
+        alive = {index for index, value in enumerate(state) if value}
+        expected = []
+        while alive:
+            queue = [min(alive)]
+            alive.discard(queue[0])
+            for index in queue:
+                x, y = index % width, index // width
+                for nx in (x - 1, x, x + 1):
+                    for ny in (y - 1, y, y + 1):
+                        neighbour = ny * width + nx
+                        if 0 <= nx < width and 0 <= ny < height and neighbour in alive:
+                            alive.discard(neighbour)
+                            queue.append(neighbour)
+            expected.append(len(queue))
+        self.assertEqual(labelling.sizes, expected)
+
+    def test_label_model(self):
+        """Étiquetage direct d'un LiveModel"""
+        model = LiveModel(20, 20, 1)
+        model.stamp("block", 2, 2)
+        model.stamp("glider", 10, 10)
+        labelling = label_model(model)
+        self.assertEqual(labelling.sizes, [4, 5])
+        self.assertEqual(labelling.label_at(11, 10), 2)
+
+
+class TestServer(unittest.TestCase):
+    """Test du serveur WebSocket (client de test sur localhost)"""
+
+    def setUp(self):
+        self.model = LiveModel(30, 20, 1)
+        self.controller = LiveController(model=self.model, counter=LiveCounter())
+
+    def run_async(self, scenario):
+        async def main():
+            server = LiveServer(self.controller, port=0, max_pending=3)
+            await server.start()
+            try:
+                await asyncio.wait_for(scenario(server), timeout=10)
+            finally:
+                await server.stop()
+        asyncio.run(main())
+
+    def test_delta_helpers(self):
+        """Différences et empaquetage 1 bit par cellule"""
+        old = bytes([0, 1, 1, 0, 0, 1, 0, 0, 1, 1])
+        new = bytes([1, 1, 0, 0, 0, 1, 1, 0, 0, 1])
+        born, died = diff_states(old, new)
+        self.assertEqual((born, died), ([0, 6], [2, 8]))
+        state = bytearray(old)
+        apply_delta(state, born, died)
+        self.assertEqual(bytes(state), new)
+        self.assertEqual(unpack_state(pack_state(new), len(new)), bytearray(new))
+        self.assertEqual(len(pack_state(new)), 2)
+
+    def test_stream_and_commands(self):
+        """Le client reçoit l'état complet puis des différences, et pilote le contrôleur"""
+        async def scenario(server):
+            client = LiveClient()
+            await client.connect("127.0.0.1", server.port)
+            first = await client.receive()
+            self.assertEqual((first["type"], client.width, client.height), ("full", 30, 20))
+            await client.send("canon")
+            frame = await client.receive()
+            self.assertEqual(frame["type"], "delta")
+            self.assertEqual(len(frame["born"]), len([p for p in CANON_POSITIONS if p[0] < 30]))
+            await client.send("step")
+            await client.receive()
+            self.assertEqual(client.generation, 1)
+            self.assertEqual(bytes(client.state), self.model.get_state())
+            await client.send("click 5 15 1")
+            await client.receive()
+            self.assertTrue(self.model.get_cell(5, 15).is_alive())
+            await client.send("voler")
+            self.assertEqual((await client.receive())["type"], "text")
+            await client.close()
+        self.run_async(scenario)
+
+    def test_slow_client_drops_frames(self):
+        """Un client lent saute des générations mais reste synchronisé"""
+        async def scenario(server):
+            client = LiveClient()
+            await client.connect("127.0.0.1", server.port)
+            await client.receive()
+            self.controller.gui_random()
+            for _ in range(10):         # sans rendre la main : la file du client déborde
+                self.controller.gui_step()
+            self.assertGreater(server.clients[0].dropped, 0)
+            while client.generation < self.model.generation:
+                await client.receive()
+            self.assertEqual(bytes(client.state), self.model.get_state())
+            self.assertEqual(client.full_frames, 2)
+            await client.close()
+        self.run_async(scenario)
+
+    def test_browser_page(self):
+        """GET / renvoie la page du client navigateur"""
+        async def scenario(server):
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            writer.write(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n")
+            response = await reader.read()
+            writer.close()
+            self.assertTrue(response.startswith(b"HTTP/1.1 200"))
+            self.assertIn(b"new WebSocket", response)
+        self.run_async(scenario)
+
+
+class TestRecording(unittest.TestCase):
+    """Test de l'enregistrement et de la relecture"""
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, "run.liferec")
+        self.model = LiveModel(40, 30, 1)
+        self.model.set_strategy(RandomStrategy(30, seed=7))
+        self.model.apply_strategy()
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def record(self, generations, keyframe_interval=10):
+        """Enregistre et renvoie les états attendus pour chaque image"""
+        states = [self.model.get_state()]
+        with LiveRecorder(self.path, keyframe_interval) as recorder:
+            recorder.attach(self.model)
+            for _ in range(generations):
+                self.model.next_generation()
+                states.append(self.model.get_state())
+            self.assertEqual(recorder.frames, generations + 1)
+        return states
+
+    def test_seek_any_frame(self):
+        """Chaque image relue est identique à l'état enregistré, dans n'importe quel ordre"""
+        states = self.record(35)
+        player = LivePlayer(self.path)
+        self.assertEqual(player.frame_count, 36)
+        for frame in (35, 0, 17, 18, 9, 10, 11, 34):
+            player.seek(frame)
+            self.assertEqual(player.get_state(), states[frame])
+            self.assertEqual(player.generation, frame)
+        self.assertEqual(player.count_alive_cells(), states[34].count(1))
+        self.assertEqual(player.get_cell(3, 4).is_alive(), bool(states[34][4 * 40 + 3]))
+        with self.assertRaises(IndexError):
+            player.seek(36)
+        player.close()
+
+    def test_edits_between_generations(self):
+        """Un motif ajouté entre deux générations apparaît dans l'image suivante"""
+        with LiveRecorder(self.path) as recorder:
+            recorder.attach(self.model)
+            self.model.stamp("glider", 20, 20)
+            self.model.next_generation()
+        player = LivePlayer(self.path)
+        player.seek(1)
+        self.assertEqual(player.get_state(), self.model.get_state())
+        player.close()
+
+    def test_deltas_store_changed_cells_only(self):
+        """Une génération est enregistrée par les index des cellules changées ; une écriture force une image clé"""
+        with LiveRecorder(self.path, keyframe_interval=100) as recorder:
+            recorder.attach(self.model)
+            for _ in range(3):
+                self.model.next_generation()
+            self.model.stamp("glider", 20, 20)
+            self.model.next_generation()
+            self.model.next_generation()
+        player = LivePlayer(self.path)
+        self.assertEqual([frame[0] for frame in player._index],
+                         [KEYFRAME, DELTA_INDICES, DELTA_INDICES, DELTA_INDICES, KEYFRAME, DELTA_INDICES])
+        player.seek(5)
+        self.assertEqual(player.get_state(), self.model.get_state())
+        player.close()
+
+    def test_truncated_file(self):
+        """Un fichier coupé (enregistrement interrompu) reste lisible jusqu'à la coupure"""
+        states = self.record(12)
+        with open(self.path, "r+b") as f:
+            f.truncate(os.path.getsize(self.path) - 5)
+        player = LivePlayer(self.path)
+        self.assertEqual(player.frame_count, 12)
+        player.seek(11)
+        self.assertEqual(player.get_state(), states[11])
+        player.close()
+
+    def test_controller_playback(self):
+        """En relecture, la vue affiche le lecteur et Step avance dans l'enregistrement"""
+        controller = LiveController(model=self.model, counter=LiveCounter())
+        controller.gui_random()
+        controller.gui_toggle_recording(self.path)
+        for _ in range(5):
+            controller.gui_step()
+        expected = self.model.get_state()
+        controller.gui_toggle_playback(self.path)
+        self.assertFalse(controller.recording)
+        self.assertIsInstance(controller.display_source, LivePlayer)
+        controller.gui_seek(4)
+        controller.gui_step()
+        self.assertEqual(controller.display_source.get_state(), expected)
+        self.assertEqual(self.model.generation, 5)     # le modèle n'a pas bougé
+        controller.gui_toggle_playback()
+        self.assertIs(controller.display_source, self.model)
+
+
+class TestHistory(unittest.TestCase):
+    """Test du retour en arrière (step_back / rewind)"""
+
+    def setUp(self):
+        self.model = LiveModel(30, 30, 1)
+        self.counter = LiveCounter()
+        self.model.set_counter(self.counter)
+        self.model.set_strategy(RandomStrategy(35, seed=3))
+        self.model.apply_strategy()
+
+    def run_states(self, generations):
+        states = [self.model.get_state()]
+        for _ in range(generations):
+            self.model.next_generation()
+            states.append(self.model.get_state())
+        return states
+
+    def test_step_back_exact(self):
+        """Chaque step_back retrouve exactement la génération précédente"""
+        self.model.enable_history()
+        states = self.run_states(20)
+        for generation in range(19, 9, -1):
+            self.assertTrue(self.model.step_back())
+            self.assertEqual(self.model.generation, generation)
+            self.assertEqual(self.model.get_state(), states[generation])
+            self.assertEqual(self.counter.alive_count, states[generation].count(1))
+        self.assertEqual(self.model.rewind(10), 10)
+        self.assertEqual(self.model.get_state(), states[0])
+        self.assertFalse(self.model.step_back())
+
+    def test_step_forward_after_rewind(self):
+        """Après un retour, la simulation repart de l'état retrouvé"""
+        self.model.enable_history()
+        states = self.run_states(8)
+        self.model.rewind(3)
+        self.model.next_generation()
+        self.assertEqual(self.model.get_state(), states[6])
+        self.assertEqual(self.model.history.exact_steps(), 6)
+
+    def test_edits_undone_first(self):
+        """Un clic après la dernière génération est annulé par le premier Back"""
+        self.model.enable_history()
+        states = self.run_states(3)
+        self.model.stamp("block", 0, 0)
+        self.assertTrue(self.model.step_back())
+        self.assertEqual(self.model.get_state(), states[3])
+        self.model.step_back()
+        self.assertEqual(self.model.get_state(), states[2])
+
+    def test_sparse_generations_mixed_with_edits(self):
+        """Générations données par leurs changements, clics entre elles : chaque Back retrouve l'état d'avant"""
+        model = LiveModel(200, 200, 1)
+        model.set_strategy(CanonStrategy())
+        model.apply_strategy()
+        model.enable_history()
+        expected = [model.get_state()]
+        for step in range(12):
+            if step % 4 == 1:
+                model.toggle_cell(150, 150 + step)
+                expected.append(model.get_state())
+            model.next_generation()
+            expected.append(model.get_state())
+            self.assertEqual(model.history.last, model.get_state())
+        for state in reversed(expected[:-1]):
+            self.assertTrue(model.step_back())
+            self.assertEqual(model.get_state(), state)
+        self.assertFalse(model.step_back())
+
+    def test_memory_budget_thins_to_keyframes(self):
+        """Budget dépassé : les vieilles générations ne restent que par images clés"""
+        self.model.enable_history(memory_budget=12000, keyframe_interval=5)
+        states = self.run_states(60)
+        history = self.model.history
+        self.assertLessEqual(history.memory_used, 12000)
+        exact = history.exact_steps()
+        self.assertLess(exact, 60)
+        self.assertEqual(self.model.rewind(exact), exact)
+        self.assertEqual(self.model.get_state(), states[60 - exact])
+        # au-delà : image clé la plus proche (plus ancienne que la cible)
+        keyframes = [g for g in history.keyframe_generations() if g < self.model.generation]
+        went = self.model.rewind(1)
+        self.assertEqual(self.model.generation, keyframes[-1])
+        self.assertEqual(went, 60 - exact - keyframes[-1])
+        self.assertEqual(self.model.get_state(), states[keyframes[-1]])
+
+    def test_step_back_to_keyframe_reports_success(self):
+        """Différences oubliées : Back saute à l'image clé et le signale comme un succès"""
+        self.model.enable_history(memory_budget=12000, keyframe_interval=5)
+        self.run_states(60)
+        self.model.rewind(self.model.history.exact_steps())
+        generation = self.model.generation
+        keyframes = [g for g in self.model.history.keyframe_generations() if g < generation]
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            LiveController._step_back(self.model)
+        self.assertEqual(self.model.generation, keyframes[-1])
+        self.assertLess(self.model.generation, generation - 1)
+        self.assertIn(f"génération {keyframes[-1]}", output.getvalue())
+        self.assertNotIn("épuisé", output.getvalue())
+
+    def test_controller_back(self):
+        """Le bouton Back du contrôleur recule d'une génération"""
+        controller = LiveController(model=self.model, counter=self.counter)
+        controller.gui_random()
+        before = self.model.get_state()
+        controller.gui_step()
+        controller.gui_back()
+        self.assertEqual(self.model.get_state(), before)
+        self.assertEqual(self.model.generation, 0)
+
+
+class TestExport(unittest.TestCase):
+    """Export PNG / GIF depuis le buffer d'état"""
+
+    @staticmethod
+    def _read_png(data):
+        """Décode un PNG à palette 8 bits (filtre 0) : (largeur, hauteur, palette, pixels)"""
+        assert data[:8] == b"\x89PNG\r\n\x1a\n"
+        position, chunks = 8, {}
+        while position < len(data):
+            (length,) = struct.unpack(">I", data[position:position + 4])
+            kind = data[position + 4:position + 8]
+            body = data[position + 8:position + 8 + length]
+            assert struct.unpack(">I", data[position + 8 + length:position + 12 + length])[0] == zlib.crc32(kind + body)
+            chunks[kind] = chunks.get(kind, b"") + body
+            position += 12 + length
+        width, height = struct.unpack(">II", chunks[b"IHDR"][:8])
+        raw = zlib.decompress(chunks[b"IDAT"])
+        rows = [raw[y * (width + 1):(y + 1) * (width + 1)] for y in range(height)]
+        assert all(row[0] == 0 for row in rows)
+        return width, height, chunks[b"PLTE"], b"".join(row[1:] for row in rows)
+
+
+    @staticmethod
+    def _read_gif(data):
+        """Décode un GIF animé (LZW complet) : (largeur, hauteur, liste des images complètes)"""
+        assert data[:6] == b"GIF89a" and data[-1:] == b"\x3b"
+        width, height, flags = struct.unpack("<HHB", data[6:11])
+        position = 13 + 3 * (2 << (flags & 7))
+        canvas, frames = bytearray(width * height), []
+        while data[position] != 0x3b:
+            if data[position] == 0x21:                 # extension : on saute les blocs
+                position += 2
+                while data[position]:
+                    position += data[position] + 1
+                position += 1
+                continue
+            left, top, w, h, _flags = struct.unpack("<HHHHB", data[position + 1:position + 10])
+            minimum = data[position + 10]
+            position += 11
+            stream = b""
+            while data[position]:
+                stream += data[position + 1:position + 1 + data[position]]
+                position += data[position] + 1
+            position += 1
+            bits, clear = int.from_bytes(stream, "little"), 1 << minimum
+            offset, size, table, previous, out = 0, minimum + 1, None, None, bytearray()
+            while True:
+                code = bits >> offset & ((1 << size) - 1)
+                offset += size
+                if code == clear:
+                    table = [bytes((i,)) for i in range(clear)] + [b"", b""]
+                    size, previous = minimum + 1, None
+                    continue
+                if code == clear + 1:
+                    break
+                entry = table[code] if code < len(table) else previous + previous[:1]
+                if previous is not None:
+                    table.append(previous + entry[:1])
+                    if len(table) == 1 << size and size < 12:
+                        size += 1
+                out += entry
+                previous = entry
+            assert len(out) == w * h
+            for y in range(h):
+                canvas[(top + y) * width + left:(top + y) * width + left + w] = out[y * w:(y + 1) * w]
+            frames.append(bytes(canvas))
+        return width, height, frames
+
+    def setUp(self):
+        self.model = LiveModel(20, 12, 1)
+        self.model.stamp(PATTERNS["glider"], 3, 2)
+        self.folder = tempfile.TemporaryDirectory()
+        self.tmp = self.folder.name
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_png_scaled_pixels(self):
+        state = self.model.get_state()
+        width, height, palette, pixels = self._read_png(liveexport.encode_png(state, 20, 12, cell_size=3))
+        self.assertEqual((width, height), (60, 36))
+        self.assertEqual(palette, bytes((255, 255, 255, 0, 0, 0)))
+        for y in range(36):
+            for x in range(60):
+                self.assertEqual(pixels[y * 60 + x], state[(y // 3) * 20 + x // 3])
+
+    def test_png_change_palette(self):
+        previous = self.model.get_state()
+        self.model.next_generation()
+        state = self.model.get_state()
+        _w, _h, palette, pixels = self._read_png(
+            liveexport.encode_png(state, 20, 12, palette="changes", previous=previous))
+        self.assertEqual(len(palette), 12)
+        self.assertEqual(list(pixels), [2 * a + b for a, b in zip(previous, state)])
+        with self.assertRaises(ValueError):
+            liveexport.get_palette([(0, 0, 0)] * 3)
+
+    def test_lzw_round_trip(self):
+        for length in (0, 1, 15, 16, 17, 33, 1000):
+            pixels = bytes(i * 7 % 4 for i in range(length))
+            data = b"GIF89a" + struct.pack("<HHBBB", length, 1, 0xF1, 0, 0) + bytes(12)
+            data += b"\x2c" + struct.pack("<HHHHB", 0, 0, length, 1, 0) + b"\x02"
+            data += liveexport._sub_blocks(liveexport.encode_lzw(pixels)) + b"\x3b"
+            self.assertEqual(self._read_gif(data)[2], [pixels])
+
+    def test_gif_animation(self):
+        path = os.path.join(self.tmp, "run.gif")
+        expected = [self.model.get_state()]
+        frames = liveexport.export_model(self.model, path, generations=9, stride=3, cell_size=2)
+        self.assertEqual(frames, 4)
+        model = LiveModel(20, 12, 1)
+        model.stamp(PATTERNS["glider"], 3, 2)
+        for _ in range(3):
+            for _ in range(3):
+                model.next_generation()
+            expected.append(model.get_state())
+        with open(path, "rb") as file:
+            width, height, images = self._read_gif(file.read())
+        self.assertEqual((width, height), (40, 24))
+        self.assertEqual(images, [liveexport.scale_pixels(state, 20, 12, 2) for state in expected])
+
+    def test_png_sequence_from_player(self):
+        path = os.path.join(self.tmp, "run.liferec")
+        with LiveRecorder(path) as recorder:
+            recorder.attach(self.model)
+            for _ in range(4):
+                self.model.next_generation()
+        player = LivePlayer(path)
+        folder = os.path.join(self.tmp, "frames")
+        self.assertEqual(liveexport.export_player(player, folder, stride=2), 3)
+        player.close()
+        self.assertEqual(sorted(os.listdir(folder)), ["frame_00000.png", "frame_00001.png", "frame_00002.png"])
+        with open(os.path.join(folder, "frame_00002.png"), "rb") as file:
+            self.assertEqual(self._read_png(file.read())[3], self.model.get_state())
+
+
+class TestWorker(unittest.TestCase):
+    """Test de la simulation dans un thread (file de commandes, file d'images)"""
+
+    def setUp(self):
+        self.model = LiveModel(30, 20, 1)
+        self.model.stamp(PATTERNS["glider"], 2, 2)
+        self.worker = SimulationWorker(self.model, max_frames=2, delay=0)
+        self.mirror = FrameMirror()
+        self.worker.start()
+
+    def tearDown(self):
+        self.worker.shutdown()
+
+    def _sync(self):
+        """Attend le thread puis applique toutes les images (même si la file a débordé)"""
+        self.assertTrue(self.worker.wait_idle(2))
+        deadline = time.monotonic() + 2
+        while time.monotonic() < deadline:
+            for frame in self.worker.drain():
+                self.mirror.apply(frame)
+            if self.mirror.generation == self.model.generation and self.mirror.get_state() == self.model.get_state():
+                return
+            time.sleep(0.01)
+        self.fail("le miroir n'a pas rattrapé le modèle")
+
+    def test_commands_in_order(self):
+        self._sync()
+        self.worker.submit(lambda model: model.reset_all_cells())
+        self.worker.submit(lambda model: model.get_cell(5, 5).set_alive(True))
+        self.worker.step()
+        self._sync()
+        self.assertEqual(self.mirror.generation, 1)
+        self.assertEqual(self.mirror.count_alive_cells(), 0)    # cellule seule : morte à l'étape
+
+    def test_bounded_queue_coalesces(self):
+        self.worker.go()
+        deadline = time.monotonic() + 2
+        while self.model.generation < 30 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.worker.stop()
+        self.assertTrue(self.worker.wait_idle(2))
+        frames = self.worker.drain()
+        self.assertLessEqual(len(frames), 2)        # jamais plus que max_frames
+        for frame in frames:
+            self.mirror.apply(frame)
+        self._sync()
+        self.assertGreaterEqual(self.mirror.generation, 30)
+        self.assertEqual(self.mirror.count_alive_cells(), 5)
+        self.assertTrue(self.mirror.get_cell(0, 0) is not None)
+
+    def test_threaded_controller(self):
+        self.worker.shutdown()
+        controller = LiveController(model=LiveModel(30, 20, 1), threaded=True)
+        try:
+            controller.gui_canon()
+            controller.gui_step()
+            controller.gui_cell_click(25, 15, 1)
+            self.assertTrue(controller.worker.wait_idle(2))
+            deadline = time.monotonic() + 2
+            while controller.display_source.get_state() != controller.model.get_state() and time.monotonic() < deadline:
+                controller.poll_frames()    # images regroupées si la file a débordé
+                time.sleep(0.01)
+            source = controller.display_source
+            self.assertIsInstance(source, FrameMirror)
+            self.assertEqual(source.generation, 1)
+            self.assertEqual(source.get_state(), controller.model.get_state())
+            self.assertTrue(source.get_cell(25, 15).is_alive())
+        finally:
+            controller.close()
+        self.assertFalse(controller.worker.alive)
+
+
+class TestPainting(unittest.TestCase):
+    """Test du dessin à la souris (glisser, tracé de Bresenham, un seul lot)"""
+
+    def setUp(self):
+        self.model = LiveModel(200, 200, 10)
+        self.counter = LiveCounter()
+        self.controller = LiveController(model=self.model, counter=self.counter)
+        self.events = []
+        self.model.attach_observer(self)
+
+    def update_many(self, model, born, died):
+        self.events.append((born, died))
+
+    def test_line_cells(self):
+        self.assertEqual(line_cells(0, 0, 3, 0), [(0, 0), (1, 0), (2, 0), (3, 0)])
+        self.assertEqual(line_cells(2, 2, 2, 2), [(2, 2)])
+        line = line_cells(0, 0, 7, -3)
+        self.assertEqual((line[0], line[-1], len(line)), ((0, 0), (7, -3), 8))
+        for (x0, y0), (x1, y1) in zip(line, line[1:]):
+            self.assertLessEqual(max(abs(x1 - x0), abs(y1 - y0)), 1)     # pas de trou
+
+    def test_drag_fills_gaps_in_one_batch(self):
+        with self.model.batch():                  # sans vue : appliqué à chaque événement
+            self.controller.gui_paint_start(5, 5, 1)
+            self.controller.gui_paint_move(95, 5)   # la souris a sauté 8 cases
+            self.controller.gui_paint_move(95, 45)
+            self.controller.gui_paint_end()
+        self.assertEqual(self.events, [(14, 0)])
+        self.assertTrue(all(self.model.get_cell(x, 0).is_alive() for x in range(10)))
+        self.assertTrue(all(self.model.get_cell(9, y).is_alive() for y in range(5)))
+        self.assertEqual(self.counter.alive_count, 14)
+
+        self.controller.gui_paint_start(25, 5, 3)
+        self.controller.gui_paint_move(55, 5)
+        self.controller.gui_paint_end()
+        self.assertEqual(self.model.count_alive_cells(), 10)
+        self.controller.gui_paint_move(75, 75)     # bouton relâché : plus de dessin
+        self.assertEqual(self.model.count_alive_cells(), 10)
+
+    def test_toggle_cell_counts_incrementally(self):
+        self.model.toggle_cell(3, 3)
+        self.model.toggle_cell(4, 3)
+        self.model.toggle_cell(3, 3)
+        self.assertEqual(self.events, [(1, 0), (1, 0), (0, 1)])
+        self.assertEqual(self.counter.alive_count, 1)
+
+
+class TestStateView(unittest.TestCase):
+    """Test des vues de l'état sans copie et des images figées (copie à l'écriture)"""
+
+    def setUp(self):
+        self.model = LiveModel(20, 10, 1)
+        self.model.stamp(PATTERNS["blinker"], 4, 4)
+
+    def test_state_view_is_read_only_and_live(self):
+        view = self.model.state_view()
+        self.assertEqual(view.buffer.tobytes(), self.model.get_state())
+        with self.assertRaises(TypeError):
+            view.buffer[0] = 1
+        self.model.get_cell(0, 0).set_alive(True)        # écriture en place : visible sans rien recopier
+        self.assertEqual(view.buffer[0], 1)
+        self.assertEqual(view.count_alive_cells(), 4)
+        self.assertTrue(view.get_cell(0, 0).is_alive())
+        self.assertEqual((view.matrix_width, view.matrix_height, view.generation), (20, 10, 0))
+
+    def test_snapshot_copy_on_write(self):
+        snapshot = self.model.snapshot()
+        before = snapshot.get_state()
+        self.model.toggle_cell(0, 0)
+        self.model.fill_region(10, 0, 3, 3)
+        self.assertEqual(snapshot.get_state(), before)             # figée malgré les écritures
+        self.assertEqual(self.model.count_alive_cells(), 3 + 1 + 9)
+        again = self.model.snapshot()
+        self.model.next_generation()                                 # nouveau buffer : pas de copie
+        self.assertEqual(again.generation, 0)
+        self.assertEqual(again.count_alive_cells(), 13)
+        self.assertEqual(self.model.state_view().generation, 1)
+
+
+class TestCellIterators(unittest.TestCase):
+    """Test des itérateurs spécialisés (vivantes, changées, région)"""
+
+    def setUp(self):
+        self.model = LiveModel(60, 50, 10)
+        self.model.stamp(PATTERNS["glider"], 2, 2)
+        self.model.toggle_cell(5, 0)
+
+    def alive_set(self):
+        return {(cell.x, cell.y) for cell in self.model.get_all_cells() if cell.is_alive()}
+
+    def test_live_cells(self):
+        self.assertEqual(set(LiveCellIterator(self.model)), self.alive_set())
+        self.assertEqual(list(LiveCellIterator(LiveModel(30, 30, 10))), [])
+
+    def test_changed_since_generation(self):
+        model = self.model
+        model.next_generation()
+        model.toggle_cell(0, 4)                       # clic pendant la génération 1 : fait partie de son état
+        before = self.alive_set()
+        model.next_generation()
+        changed = {(x, y): alive for x, y, alive in ChangedCellIterator(model, 1)}
+        self.assertEqual(set(changed), before ^ self.alive_set())
+        self.assertTrue(all(alive == ((x, y) in self.alive_set()) for (x, y), alive in changed.items()))
+        # génération inconnue (à venir, ou trop ancienne) : toutes les cellules
+        self.assertEqual(len(list(ChangedCellIterator(model, 5))), 6 * 5)
+        for _ in range(LiveModel.CHANGE_WINDOW + 1):
+            model.next_generation()
+        self.assertIsNone(model.changed_since(0))
+        self.assertEqual(model.changed_since(model.generation), [])
+        model.reset()                                   # retour à la génération 0 : le passé est oublié
+        self.assertIsNone(model.changed_since(1))
+
+    def test_changes_reported_by_the_kernel(self):
+        """Les changements donnés par le noyau (à travers le bord du tore) sont ceux de la grille"""
+        model = LiveModel(80, 60, 1)
+        model.stamp(PATTERNS["glider"], 76, 56)        # passe les bords droit et bas
+        for _ in range(3):
+            model.next_generation()
+        states = [model.get_state()]
+        for _ in range(4):
+            model.next_generation()
+            states.append(model.get_state())
+        edits = model.edit_count
+        for back in range(1, 5):
+            self.assertEqual(model.changed_since(model.generation - back),
+                             changed_indices(states[-1 - back], states[-1]))
+        model.toggle_cell(0, 0)                        # écriture hors génération : relue dans la grille
+        self.assertEqual(model.edit_count, edits + 1)
+        self.assertEqual(model.changed_since(model.generation - 1),
+                         changed_indices(states[-2], model.get_state()))
+
+    class FakeCanvas:
+        """Canvas Tk remplacé par des compteurs d'appels"""
+
+        def __init__(self):
+            self.calls = Counter()
+
+        def create_line(self, *args, **options):
+            self.calls["line"] += 1
+
+        def create_rectangle(self, *args, **options):
+            self.calls["rectangle"] += 1
+
+        def itemconfig(self, tag, **options):
+            self.calls["itemconfig"] += 1
+
+        def delete(self, *tags):
+            self.calls["delete"] += 1
+
+    def test_redraw_since_touches_changed_cells_only(self):
+        """Une génération ne redessine que ses cellules changées ; génération oubliée : tout redessiner"""
+        model = LiveModel(300, 300, 1)
+        model.set_strategy(CanonStrategy())
+        model.apply_strategy()
+        canvas = LiveCanvas.__new__(LiveCanvas)         # sans fenêtre Tk
+        canvas._width = canvas._height = 0
+        canvas._cell_size, canvas._drawn_size, canvas._items = 1, None, set()
+        canvas._canvas = fake = self.FakeCanvas()
+        canvas.redraw(model)
+        drawn = model.generation
+        for _ in range(3):
+            model.next_generation()
+        fake.calls.clear()
+        canvas.redraw_since(model, drawn)
+        self.assertEqual(fake.calls["delete"] + fake.calls["line"], 0)
+        self.assertEqual(fake.calls["itemconfig"] + fake.calls["rectangle"], len(model.changed_since(drawn)))
+        self.assertTrue(ChangedCellIterator(model, drawn).known)
+        for _ in range(LiveModel.CHANGE_WINDOW + 1):
+            model.next_generation()
+        self.assertFalse(ChangedCellIterator(model, drawn).known)
+        fake.calls.clear()
+        canvas.redraw_since(model, drawn)
+        self.assertEqual(fake.calls["delete"], 1)
+
+    def test_region(self):
+        region = list(RegionIterator(self.model, 2, -1, 10, 3))     # coupé par le bord haut et droit
+        self.assertEqual(len(region), 4 * 2)
+        self.assertEqual({(x, y) for x, y, alive in region if alive},
+                         {(x, y) for x, y in self.alive_set() if x >= 2 and y <= 1})
+        self.assertEqual(list(RegionIterator(self.model, 10, 10, 3, 3)), [])
+
+
+class TestChunkedUniverse(unittest.TestCase):
+    """Test de l'univers sans bords en tuiles allouées à la demande"""
+
+    def test_same_as_torus_away_from_edges(self):
+        rng = random.Random(7)
+        coords = [(rng.randrange(40, 80), rng.randrange(40, 80)) for _ in range(900)]
+        torus = LiveModel(120, 120, 1)
+        chunked = ChunkedLiveModel(120, 120, 1, tile_size=16)
+        torus.set_many(coords)
+        chunked.set_many(coords)
+        for _ in range(15):
+            torus.next_generation()
+            chunked.next_generation()
+            self.assertEqual(chunked.get_state(), torus.get_state())
+        self.assertEqual(chunked.population(), torus.count_alive_cells())
+
+    def test_escaping_glider_keeps_bounded_memory(self):
+        model = ChunkedLiveModel(20, 20, 1, tile_size=8)
+        model.stamp(PATTERNS["glider"], 5, 5)
+        model.stamp(PATTERNS["block"], 1, 13)
+        counts = []
+        for _ in range(400):                              # le planeur parcourt ~100 cellules, soit ~12 tuiles
+            model.next_generation()
+            counts.append(model.universe.tile_count)
+        self.assertLessEqual(max(counts), 1 + 4)         # le bloc + au plus 4 tuiles autour du planeur
+        self.assertEqual(model.population(), 5 + 4)
+        self.assertEqual(model.count_alive_cells(), 4)   # seul le bloc est encore dans la fenêtre
+        x0, y0, x1, y1 = model.universe.bounding_box()
+        self.assertEqual((x0, y0), (1, 13))
+        self.assertGreater(min(x1, y1), 100)
+
+    def test_viewport_edits_and_panning(self):
+        model = ChunkedLiveModel(10, 10, 1, tile_size=4)
+        model.toggle_cell(2, 3)
+        model.sync()
+        self.assertTrue(model.universe.get(2, 3))
+        model.move_viewport(-5, 0)                        # coordonnées négatives : tuiles à gauche
+        self.assertEqual(model.count_alive_cells(), 1)
+        self.assertTrue(model.get_cell(7, 3).is_alive())
+        model.fill_region(0, 0, 3, 1)                     # clignotant en (-5..-3, 0)
+        model.next_generation()
+        self.assertEqual({(x, y) for x in range(-6, 0) for y in range(-2, 3) if model.universe.get(x, y)},
+                         {(-4, -1), (-4, 0), (-4, 1)})
+        self.assertEqual(model.universe.read_region(-5, -1, 3, 3), bytes([0, 1, 0] * 3))
+        model.reset()
+        self.assertEqual((model.universe.tile_count, model.population()), (0, 0))
+
+    def test_universe_steps_across_tile_borders(self):
+        universe = ChunkedUniverse(tile_size=4)
+        universe.set_many([(-1, 0), (0, 0), (1, 0)])      # clignotant à cheval sur deux tuiles
+        universe.set(10, 10, True)
+        universe.set(10, 10, False)                       # tuile devenue vide
+        self.assertEqual(universe.neighbours(0, -1), 3)
+        universe.step()
+        self.assertEqual({(x, y) for x in range(-3, 4) for y in range(-3, 4) if universe.get(x, y)},
+                         {(0, -1), (0, 0), (0, 1)})
+        self.assertEqual(universe.bounding_box(), (0, -1, 1, 2))
+        self.assertFalse(universe.get(10, 10))
+        universe.step()
+        self.assertEqual(universe.bounding_box(), (-1, 0, 2, 1))
+        self.assertEqual((universe.generation, universe.population()), (2, 3))
+        self.assertEqual(universe.tile_count, 2)          # la tuile vide a été libérée
+        universe.set_rule("B3/S")                         # plus de survie : seules les naissances restent
+        universe.step()
+        self.assertEqual({(x, y) for x in range(-3, 4) for y in range(-3, 4) if universe.get(x, y)},
+                         {(0, -1), (0, 1)})
+
+
+class TestBitEngine(unittest.TestCase):
+    """Test du moteur bit-parallèle (grille entière dans un entier)"""
+
+    def test_same_as_dense_on_torus(self):
+        state = random_mask(31 * 17, 150, random.Random(3))
+        dense = LiveModel(31, 17, 1)
+        fast = BitLiveModel(31, 17, 1)
+        dense.load_state(state)
+        fast.load_state(state)
+        for _ in range(20):
+            dense.next_generation()
+            fast.next_generation()
+        self.assertEqual(fast.get_state(), dense.get_state())
+        self.assertEqual(fast.count_alive_cells(), dense.count_alive_cells())
+        self.assertEqual(fast.changed_since(15), dense.changed_since(15))
+
+    def test_bounded_edges(self):
+        # un clignotant coupé par le bord : 2 cellules seulement, elles meurent
+        model = BitLiveModel(5, 5, 1, wrap=False)
+        model.set_many([(0, 2), (1, 2)])
+        model.next_generation()
+        self.assertEqual(model.count_alive_cells(), 0)
+        # sur le tore, le planeur revient ; avec des bords, il finit en bloc dans le coin
+        model = BitLiveModel(8, 8, 1, wrap=False)
+        model.stamp(PATTERNS["glider"], 1, 1)
+        for _ in range(40):
+            model.next_generation()
+        self.assertEqual(sorted(LiveCellIterator(model)), [(6, 6), (6, 7), (7, 6), (7, 7)])
+
+    def test_lazy_conversion(self):
+        model = BitLiveModel(16, 16, 1)
+        model.stamp(PATTERNS["glider"], 2, 2)
+        model.next_generation()
+        self.assertIsNone(model._buffer)                # rien n'a été relu en octets
+        self.assertEqual(model.count_alive_cells(), 5)
+        self.assertIsNone(model._buffer)
+        model.toggle_cell(0, 0)                         # une écriture repasse par le buffer
+        self.assertIsNone(model._bits)
+        self.assertEqual(model.get_bits().bit_count(), 6)
+
+    def test_cell_objects_and_rules(self):
+        model = BitLiveModel(10, 10, 1, rule="B36/S23")
+        cell = model.get_cell(4, 4)
+        model.set_many([(3, 3), (5, 3), (3, 5), (5, 5), (4, 3), (3, 4)])   # 6 voisins
+        model.next_generation()
+        self.assertTrue(cell.is_alive())
+        self.assertEqual(cell.nb_neighbours, 6)
+
+
+class TestBlockEngine(unittest.TestCase):
+    """Test du moteur par blocs 2x2 de Grid.step (Q54fusion / Q54bis) contre le moteur par cellule"""
+
+    MODULES = (livebench.FusionGridEngine, livebench.BisGridEngine)
+
+    @staticmethod
+    def _grids(module, rows, cols, alive):
+        grids = (module.Grid(rows, cols, module.CellStepEngine()), module.Grid(rows, cols, module.BlockStepEngine()))
+        for grid in grids:
+            for r, c in alive:
+                grid.set_alive(r, c, True)
+        return grids
+
+    @staticmethod
+    def _state(grid) -> bytes:
+        return bytes(cell.alive for _r, _c, cell in grid)
+
+    def test_same_as_cell_engine_on_random_grids(self):
+        """Tailles impaires (blocs 2x2 coupés au bord droit / en bas), plusieurs générations"""
+        rng = random.Random(7)
+        for bench in self.MODULES:
+            module = bench()._module
+            for rows, cols in ((1, 1), (1, 9), (9, 1), (13, 17), (31, 29), (24, 33)):
+                alive = [(r, c) for r in range(rows) for c in range(cols) if rng.random() < 0.35]
+                cell_grid, block_grid = self._grids(module, rows, cols, alive)
+                for generation in range(10):
+                    cell_grid.step()
+                    block_grid.step()
+                    with self.subTest(module=bench.folder, size=(rows, cols), generation=generation):
+                        self.assertEqual(self._state(block_grid), self._state(cell_grid))
+
+    def test_bounded_edges_match_reference(self):
+        """Les grilles Q54 ne sont pas des tores : mêmes résultats que BitLiveModel sans bords reliés"""
+        rows, cols = 15, 21
+        rng = random.Random(11)
+        alive = [(r, c) for r in range(rows) for c in range(cols)
+                 if (r in (0, rows - 1) or c in (0, cols - 1) or rng.random() < 0.2)]
+        reference = BitLiveModel(cols, rows, 1, wrap=False)
+        reference.set_many([(c, r) for r, c in alive])
+        for bench in self.MODULES:
+            module = bench()._module
+            grids = self._grids(module, rows, cols, alive)
+            model = BitLiveModel(cols, rows, 1, wrap=False)
+            model.load_state(reference.get_state())
+            for generation in range(8):
+                model.next_generation()
+                for grid in grids:
+                    grid.step()
+                    with self.subTest(module=bench.folder, engine=type(grid.engine).__name__, generation=generation):
+                        self.assertEqual(self._state(grid), bytes(model.get_state()))
+
+    def test_no_wrap_across_corners(self):
+        """Trois coins vivants : sur un tore le quatrième naîtrait, ici tout meurt"""
+        for bench in self.MODULES:
+            module = bench()._module
+            for grid in self._grids(module, 7, 9, [(0, 0), (0, 8), (6, 0)]):
+                grid.step()
+                self.assertEqual(self._state(grid).count(1), 0)
+
+
+class TestAdaptiveEngine(unittest.TestCase):
+    """Test du choix automatique dense / creux"""
+
+    def test_same_as_dense_across_switches(self):
+        state = random_mask(80 * 80, 2000, random.Random(4))
+        dense = LiveModel(80, 80, 1)
+        adaptive = AdaptiveLiveModel(80, 80, 1, sample_every=4)
+        dense.load_state(state)
+        adaptive.load_state(state)
+        cell = adaptive.get_cell(40, 40)
+        clicked = False
+        for _ in range(600):
+            if adaptive.mode == SPARSE and not clicked:
+                dense.toggle_cell(10, 10)                   # un clic pendant le mode creux
+                adaptive.toggle_cell(10, 10)
+                clicked = True
+            dense.next_generation()
+            adaptive.next_generation()
+            self.assertEqual(adaptive.get_state(), dense.get_state())
+        self.assertTrue(clicked)
+        self.assertEqual(cell.is_alive(), dense.get_cell(40, 40).is_alive())
+        self.assertEqual(adaptive.count_alive_cells(), dense.count_alive_cells())
+
+    def test_switch_back_when_dense_again_and_log(self):
+        messages = []
+        model = AdaptiveLiveModel(40, 40, 1, sample_every=2, log=messages.append)
+        model.stamp(PATTERNS["glider"], 2, 2)          # deux planeurs éloignés : grand rectangle
+        model.stamp(PATTERNS["glider"], 22, 22)
+        model.next_generation()
+        model.next_generation()
+        self.assertEqual(model.mode, SPARSE)
+        model.load_state(random_mask(40 * 40, 800, random.Random(1)))
+        for _ in range(4):
+            model.next_generation()
+        self.assertEqual(model.mode, DENSE)
+        self.assertEqual([(s.old, s.new) for s in model.switches], [(DENSE, SPARSE), (SPARSE, DENSE)])
+        self.assertIn("coût creux", model.switches[-1].reason)
+        self.assertEqual(len(messages), 2)
+
+    def test_no_thrash_near_threshold(self):
+        # clignotants à l'activité du seuil (4 cellules changent par génération
+        # chacun) : la marge empêche les allers-retours
+        model = AdaptiveLiveModel(40, 40, 1, sample_every=1)
+        threshold = 40 * 40 * DENSE_COST / SPARSE_COST
+        for index in range(int(threshold / 4)):
+            model.stamp(PATTERNS["blinker"], (index % 8) * 5, (index // 8) * 5 + 1)
+        for _ in range(50):
+            model.next_generation()
+        self.assertLessEqual(len(model.switches), 1)
+
+    def test_still_lifes_cost_nothing_in_sparse_mode(self):
+        # beaucoup de blocs fixes : aucune activité, le moteur creux ne réévalue rien
+        model = AdaptiveLiveModel(40, 40, 1, sample_every=1)
+        for index in range(64):
+            model.stamp(PATTERNS["block"], (index % 8) * 5, (index // 8) * 5)
+        before = model.get_state()
+        for _ in range(3):
+            model.next_generation()
+        self.assertEqual(model.mode, SPARSE)
+        self.assertEqual(model.switches[0].activity, 0.0)
+        self.assertEqual(model.get_state(), before)
+
+    def test_compact_soup_stays_dense(self):
+        # petite soupe au milieu d'une grande grille : le dense ne calcule que son rectangle
+        model = AdaptiveLiveModel(400, 400, 1, sample_every=2)
+        state = bytearray(400 * 400)
+        for index, alive in enumerate(random_mask(40 * 40, 400, random.Random(2))):
+            state[(180 + index // 40) * 400 + 180 + index % 40] = alive
+        model.load_state(state)
+        for _ in range(6):
+            model.next_generation()
+        self.assertEqual(model.mode, DENSE)
+
+    def test_b0_rule_stays_dense(self):
+        model = AdaptiveLiveModel(20, 20, 1, rule="B03/S23", sample_every=1)
+        for _ in range(5):
+            model.next_generation()
+        self.assertEqual(model.mode, DENSE)
+
+
+class TestLiveBox(unittest.TestCase):
+    """Test du calcul limité au rectangle des cellules vivantes"""
+
+    def test_box_follows_generations_and_edits(self):
+        model = LiveModel(50, 50, 1)
+        self.assertIsNone(model.live_box())
+        model.stamp(PATTERNS["glider"], 10, 20)
+        self.assertEqual(model.live_box(), (10, 20, 13, 23))
+        for _ in range(4):                          # un planeur avance d'une case en diagonale tous les 4 tours
+            model.next_generation()
+        self.assertEqual(model.live_box(), (11, 21, 14, 24))
+        self.assertEqual(model._step_region(), (10, 20, 15, 25))
+        model.toggle_cell(40, 2)
+        self.assertEqual(model.live_box(), (11, 2, 41, 24))
+        model.reset_all_cells()
+        self.assertIsNone(model.live_box())
+
+    def test_wrap_around_edges(self):
+        # planeur qui traverse les bords du tore : même résultat que le moteur sur toute la grille
+        model = LiveModel(12, 9, 1)
+        reference = BitLiveModel(12, 9, 1)
+        for target in (model, reference):
+            target.stamp(PATTERNS["glider"], 8, 5)
+        regions = set()
+        for _ in range(60):
+            regions.add(model._step_region())
+            model.next_generation()
+            reference.next_generation()
+            self.assertEqual(model.get_state(), reference.get_state())
+        self.assertEqual(model.count_alive_cells(), 5)
+        self.assertIn((0, 0, 12, 9), regions)       # à cheval sur les deux bords
+
+    def test_box_in_corner_steps_across_the_edge_only(self):
+        model = LiveModel(80, 60, 1)
+        reference = BitLiveModel(80, 60, 1)
+        for target in (model, reference):
+            target.stamp(PATTERNS["glider_gun"], 0, 0)
+        self.assertEqual(model._step_region(), (-1, -1, 37, 10))   # une colonne / ligne de l'autre côté
+        for _ in range(40):
+            model.next_generation()
+            reference.next_generation()
+        self.assertEqual(model.get_state(), reference.get_state())
+
+    def test_b0_rule_steps_whole_grid(self):
+        model = LiveModel(6, 6, 1, rule="B0/S")
+        model.next_generation()
+        self.assertEqual(model.count_alive_cells(), 36)
+        self.assertEqual(model.live_box(), (0, 0, 6, 6))
+
+
+class TestStepBuffers(unittest.TestCase):
+    """Test des buffers réutilisés par next_generation"""
+
+    @staticmethod
+    def _traced(model, generations: int = 3):
+        """Mémoire (gardée, pic) allouée par quelques générations, une fois les réserves pleines"""
+        for _ in range(LiveModel.CHANGE_WINDOW + 2):      # les buffers sortis de _marks sont en réserve
+            model.next_generation()
+        tracemalloc.start()
+        try:
+            base = tracemalloc.get_traced_memory()[0]
+            for _ in range(generations):
+                model.next_generation()
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return current - base, peak - base
+
+    def test_steady_state_allocates_no_grid_sized_memory(self):
+        size = 200
+        model = LiveModel(size, size, 1)
+        model.load_state(random_mask(size * size, size * size // 4, random.Random(5)))
+        kept, peak = self._traced(model)
+        # quelques lignes de calcul au plus, jamais un état entier (40 000 octets)
+        self.assertLess(peak, size * size // 4)
+        self.assertLess(kept, 1024)
+
+    def test_history_allocates_no_grid_sized_memory(self):
+        size = 300
+        model = LiveModel(size, size, 1)
+        model.enable_history(keyframe_interval=1000)
+        model.set_strategy(CanonStrategy())
+        model.apply_strategy()
+        kept, peak = self._traced(model)
+        # seules les différences (quelques dizaines de cellules) sont gardées
+        self.assertLess(peak, size * size // 4)
+        self.assertLess(kept, 4096)
+
+    def test_bits_model_with_history_reuses_buffers(self):
+        size = 300
+        model = BitLiveModel(size, size, 1)
+        model.enable_history(keyframe_interval=1000)
+        model.set_strategy(CanonStrategy())
+        model.apply_strategy()
+        kept, _peak = self._traced(model, 20)
+        self.assertLess(kept, size * size // 4)     # pas un état entier gardé par génération
+        self.assertLessEqual(len(model._spare), 1)
+
+    def test_snapshot_buffer_is_never_reused(self):
+        model = LiveModel(20, 20, 1)
+        model.stamp(PATTERNS["glider"], 3, 3)
+        snapshot = model.snapshot()
+        frozen = snapshot.get_state()
+        for _ in range(3 * LiveModel.CHANGE_WINDOW):
+            model.next_generation()
+        self.assertEqual(snapshot.get_state(), frozen)
+        self.assertEqual(model.count_alive_cells(), 5)
+
+    def _check_grid_step(self, bench_engine):
+        """Grid.step (Q54fusion / Q54bis) : cendres 200x200, blocs (stables) et clignotants"""
+        module = bench_engine._module
+        size = 200
+        for engine in (module.CellStepEngine(), module.BlockStepEngine()):
+            grid = module.Grid(size, size, engine)
+            for r in range(0, size, 10):
+                for c in range(0, size, 10):
+                    for dr, dc in ((1, 1), (1, 2), (2, 1), (2, 2), (6, 4), (6, 5), (6, 6)):
+                        grid.set_alive(r + dr, c + dc, True)
+            for _ in range(3):
+                grid.step()
+            tracemalloc.start()
+            try:
+                base = tracemalloc.get_traced_memory()[0]
+                for _ in range(2):
+                    grid.step()
+                current, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            with self.subTest(engine=type(engine).__name__):
+                # quelques lignes et les cellules qui changent, jamais un état
+                # entier (40 000 cases) ni l'ensemble des vivantes (2 800)
+                self.assertLess(peak - base, size * size // 2)
+                self.assertLess(current - base, 1024)
+
+    def test_fusion_grid_step_allocates_no_grid_sized_memory(self):
+        self._check_grid_step(livebench.FusionGridEngine())
+
+    def test_bis_grid_step_allocates_no_grid_sized_memory(self):
+        self._check_grid_step(livebench.BisGridEngine())
+
+
+class TestRenderScheduler(unittest.TestCase):
+    """Test du regroupement des redessins (au plus un rendu par image, sans Tk)"""
+
+    class FakeWindow:
+        """after / after_idle notés au lieu d'être exécutés par Tk"""
+
+        def __init__(self):
+            self.idle = []
+            self.timers = []
+
+        def after_idle(self, callback):
+            self.idle.append(callback)
+
+        def after(self, delay, callback):
+            self.timers.append((delay, callback))
+
+        def run_idle(self):
+            callbacks, self.idle = self.idle, []
+            for callback in callbacks:
+                callback()
+
+    def setUp(self):
+        self.now = 0.0
+        self.window = self.FakeWindow()
+        self.rendered = []
+        self.scheduler = RenderScheduler(self.window, lambda cells, merged: self.rendered.append((cells, merged)),
+                                         frame_ms=16, clock=lambda: self.now)
+
+    def test_requests_coalesce_into_one_render(self):
+        self.scheduler.mark_dirty([(1, 1)])
+        self.scheduler.mark_dirty([(2, 2), (1, 1)])
+        self.scheduler.mark_dirty([(3, 3)])
+        self.assertEqual(len(self.window.idle), 1)      # un seul rappel programmé
+        self.assertEqual(self.rendered, [])             # rien de dessiné avant le moment libre
+        self.window.run_idle()
+        self.assertEqual(self.rendered, [({(1, 1), (2, 2), (3, 3)}, 2)])
+        self.assertEqual((self.scheduler.renders, self.scheduler.coalesced), (1, 2))
+        self.assertFalse(self.scheduler.pending)
+
+    def test_full_redraw_absorbs_cells(self):
+        self.scheduler.mark_dirty([(1, 1)])
+        self.scheduler.mark_dirty()
+        self.scheduler.mark_dirty([(4, 4)])
+        self.window.run_idle()
+        self.assertEqual(self.rendered, [(None, 2)])
+
+    def test_next_render_waits_for_next_frame(self):
+        self.scheduler.mark_dirty()
+        self.window.run_idle()
+        self.now = 0.005                                # 5 ms après le rendu
+        self.scheduler.mark_dirty()
+        self.assertEqual(self.window.idle, [])
+        (delay, callback), = self.window.timers
+        self.assertEqual(delay, 11)
+        callback()                                      # l'image suivante : rappel au moment libre
+        self.window.run_idle()
+        self.assertEqual(self.scheduler.renders, 2)
+
+    def test_flush_without_request_does_nothing(self):
+        self.scheduler.flush()
+        self.assertEqual(self.rendered, [])
+
+    def test_profiler_counts_events(self):
+        profiler = LiveProfiler()
+        profiler.count("coalesced", 3)
+        profiler.count("coalesced")
+        self.assertEqual(profiler.counter("coalesced"), 4)
+        self.assertIn("coalesced 4", profiler.overlay_text())
+        profiler.reset()
+        self.assertEqual(profiler.counter("coalesced"), 0)
+
+
     # Point d'entrée pour exécuter les tests
 if __name__ == '__main__':
     # Configuration du runner de tests
@@ -0,0 +1,293 @@
+"""
+Tests de performance : détectent les régressions de vitesse
+
+Chaque charge de référence (générations, stratégies, comptage) est chronométrée
+(meilleur de plusieurs essais), puis divisée par le temps d'une boucle de
+calibration en Python pur mesurée sur la même machine : le score obtenu ne
+dépend presque plus de la vitesse de la machine. Il est comparé au score
+enregistré dans perf_baseline.json ; le test échoue si la charge est plus de
+`tolerance` fois plus lente que la référence.
+
+    python -m pytest test_perf.py                 # tier complet
+    LIVE_SKIP_PERF=1 python -m pytest             # exécution rapide : ces tests sont ignorés
+    LIVE_PERF_TOLERANCE=3 python -m pytest ...    # autre tolérance
+    LIVE_PERF_UPDATE=1 python -m pytest test_perf.py   # réécrit la référence (après une optimisation voulue)
+
+Les surcoûts (enregistrement...) sont mesurés en rapport : même charge avec
+et sans, sur la même machine, sans référence enregistrée.
+"""
+
+import json
+import os
+import random
+import tempfile
+import time
+import unittest
+
+from livecounter import LiveCounter
+from livelabel import label
+from livemodel import LiveModel, RandomStrategy, CanonStrategy, random_mask
+from liverecord import LiveRecorder
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(HERE, "perf_baseline.json")
+
+SKIP = os.environ.get("LIVE_SKIP_PERF", "") not in ("", "0")
+UPDATE = os.environ.get("LIVE_PERF_UPDATE", "") not in ("", "0")
+DEFAULT_TOLERANCE = 2.5
+REPEAT = 5
+
+
+def _calibration_loop():
+    """Travail fixe en Python pur (entiers, indexation, petits buffers) : l'unité de temps de la machine"""
+    data = bytearray(range(256)) * 64
+    total = 0
+    for i in range(200_000):
+        total += data[i & 16383] ^ (i & 255)
+    return total
+
+
+def best_time(function, repeat: int = REPEAT) -> float:
+    """Meilleur temps (s) de function() sur repeat essais : le moins perturbé par la machine"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# ============================================================================
+# Charges de référence : chaque fonction prépare et renvoie ce qu'on chronomètre
+# ============================================================================
+
+
+def _soup_model(size: int, seed: int = 1) -> LiveModel:
+    model = LiveModel(size, size, 1)
+    model.load_state(random_mask(size * size, size * size // 4, random.Random(seed)))
+    return model
+
+
+def workload_step_soup():
+    """3 générations d'une soupe 25% en 160x160 (toute la grille est calculée)"""
+    model = _soup_model(160)
+    state = model.get_state()
+
+    def run():
+        model.load_state(state)
+        for _ in range(3):
+            model.next_generation()
+    return run
+
+
+def workload_step_gun():
+    """30 générations d'un canon à planeurs dans une grille 300x300 (rectangle des vivantes)"""
+    model = LiveModel(300, 300, 1)
+    model.set_strategy(CanonStrategy())
+
+    def run():
+        model.apply_strategy()
+        for _ in range(30):
+            model.next_generation()
+    return run
+
+
+def workload_strategy_random():
+    """RandomStrategy (25%) appliquée à une grille 512x512, 3 fois"""
+    model = LiveModel(512, 512, 1)
+    model.set_strategy(RandomStrategy(25, seed=3))
+
+    def run():
+        for _ in range(3):
+            model.apply_strategy()
+    return run
+
+
+def workload_strategy_canon():
+    """CanonStrategy (remise à zéro + motif) sur une grille 512x512, 40 fois"""
+    model = LiveModel(512, 512, 1)
+    model.set_strategy(CanonStrategy())
+
+    def run():
+        for _ in range(40):
+            model.apply_strategy()
+    return run
+
+
+def workload_count_all():
+    """LiveCounter.count_all sur une soupe 512x512, 50 fois"""
+    model = _soup_model(512)
+    counter = LiveCounter()
+
+    def run():
+        for _ in range(50):
+            counter.count_all(model)
+    return run
+
+
+def workload_count_cells():
+    """Compteur notifié cellule par cellule (pattern Observer) : 2000 cellules allumées puis éteintes, 5 fois"""
+    model = LiveModel(100, 100, 1)
+    model.set_counter(LiveCounter())
+    cells = [model.get_cell(i % 100, i // 100) for i in range(0, 10000, 5)]
+
+    def run():
+        for _ in range(5):
+            for cell in cells:
+                cell.set_alive(True)
+            for cell in cells:
+                cell.set_alive(False)
+    return run
+
+
+def workload_label_sparse():
+    """Étiquetage d'une grille torique 1024x1024 à 2% de vivantes (environ 20000 segments)"""
+    size = 1024
+    state = bytes(random_mask(size * size, size * size // 50, random.Random(5)))
+
+    def run():
+        label(state, size, size, wrap=True)
+    return run
+
+
+def workload_label_soup():
+    """Étiquetage d'une soupe torique 512x512 à 25% (environ 50000 segments)"""
+    size = 512
+    state = _soup_model(size).get_state()
+
+    def run():
+        label(state, size, size, wrap=True)
+    return run
+
+
+WORKLOADS = {
+    "step_soup": workload_step_soup,
+    "step_gun": workload_step_gun,
+    "strategy_random": workload_strategy_random,
+    "strategy_canon": workload_strategy_canon,
+    "count_all": workload_count_all,
+    "count_cells": workload_count_cells,
+    "label_sparse": workload_label_sparse,
+    "label_soup": workload_label_soup,
+}
+
+
+def measure() -> dict:
+    """Scores de toutes les charges (temps / temps de calibration)"""
+    calibration = best_time(_calibration_loop)
+    return {name: best_time(setup()) / calibration for name, setup in WORKLOADS.items()}
+
+
+def save_baseline(scores: dict, path: str = BASELINE_PATH):
+    """Écrit la référence (clés triées, indentation fixe => diff lisible)"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"tolerance": DEFAULT_TOLERANCE,
+                   "scores": {name: round(score, 4) for name, score in scores.items()}},
+                  f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+@unittest.skipIf(SKIP, "LIVE_SKIP_PERF : tests de performance ignorés")
+class TestPerformance(unittest.TestCase):
+    """Temps normalisés comparés à perf_baseline.json"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.scores = measure()
+        if UPDATE:
+            save_baseline(cls.scores)
+        with open(BASELINE_PATH, encoding="utf-8") as f:
+            baseline = json.load(f)
+        cls.reference = baseline["scores"]
+        cls.tolerance = float(os.environ.get("LIVE_PERF_TOLERANCE") or baseline["tolerance"])
+
+    def _check(self, name):
+        score, reference = self.scores[name], self.reference[name]
+        self.assertLessEqual(
+            score, reference * self.tolerance,
+            f"{name} : {score:.3f} unités de calibration, référence {reference:.3f} "
+            f"(x{score / reference:.1f}, tolérance x{self.tolerance})")
+
+    def test_baseline_covers_workloads(self):
+        self.assertEqual(sorted(self.reference), sorted(WORKLOADS))
+
+    def test_step_soup(self):
+        self._check("step_soup")
+
+    def test_step_gun(self):
+        self._check("step_gun")
+
+    def test_strategy_random(self):
+        self._check("strategy_random")
+
+    def test_strategy_canon(self):
+        self._check("strategy_canon")
+
+    def test_count_all(self):
+        self._check("count_all")
+
+    def test_count_cells(self):
+        self._check("count_cells")
+
+    def test_label_sparse(self):
+        self._check("label_sparse")
+
+    def test_label_soup(self):
+        self._check("label_soup")
+
+
+# ============================================================================
+# Surcoûts : rapport entre la même charge avec et sans l'option mesurée
+# ============================================================================
+
+# Surcoût visé pour l'enregistrement et l'historique : 10 % ; la marge absorbe
+# le bruit de mesure
+RECORD_OVERHEAD = 1.25
+HISTORY_OVERHEAD = 1.25
+
+
+def _gun_model(size: int) -> LiveModel:
+    """Canon à planeurs déjà lancé : peu de cellules changent à chaque génération"""
+    model = LiveModel(size, size, 1)
+    model.set_strategy(CanonStrategy())
+    model.apply_strategy()
+    for _ in range(30):
+        model.next_generation()
+    return model
+
+
+def overhead_ratio(plain, extra, generations: int = 20, repeat: int = 7) -> float:
+    """Temps de generations générations de extra / de plain (meilleurs essais, mesures alternées)"""
+    best = [float("inf"), float("inf")]
+    for _ in range(repeat):
+        for i, model in enumerate((plain, extra)):
+            start = time.process_time()
+            for _ in range(generations):
+                model.next_generation()
+            best[i] = min(best[i], time.process_time() - start)
+    return best[1] / best[0]
+
+
+@unittest.skipIf(SKIP, "LIVE_SKIP_PERF : tests de performance ignorés")
+class TestOverhead(unittest.TestCase):
+    """Surcoût des options sur une charge creuse"""
+
+    def test_recording_sparse_gun(self):
+        """Enregistrer un canon 512x512 ne coûte que les cellules qui changent, pas la grille"""
+        with tempfile.TemporaryDirectory() as folder:
+            recorded = _gun_model(512)
+            with LiveRecorder(os.path.join(folder, "gun.liferec"), keyframe_interval=1000) as recorder:
+                recorder.attach(recorded)
+                ratio = overhead_ratio(_gun_model(512), recorded)
+        self.assertLess(ratio, RECORD_OVERHEAD, f"enregistrement : x{ratio:.2f}")
+
+    def test_history_sparse_gun(self):
+        """L'historique (toujours actif dans le contrôleur) suit les changements, pas la taille de la grille"""
+        kept = _gun_model(1024)
+        kept.enable_history()
+        ratio = overhead_ratio(_gun_model(1024), kept)
+        self.assertLess(ratio, HISTORY_OVERHEAD, f"historique : x{ratio:.2f}")
+
+
+if __name__ == '__main__':
+    unittest.main()